@@ -2,18 +2,248 @@
 Glassbox Bio REST API
 Production-ready validation gateway
 """
-from fastapi import FastAPI, File, UploadFile, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, File, Header, UploadFile, HTTPException, Query
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import Optional
+from typing import Dict, Iterable, List, Optional
+from collections import deque
+from datetime import datetime
+import asyncio
+import hashlib
+import hmac
+import ipaddress
+import itertools
+import json
+import tarfile
 import temple
+import time
+import zipfile
+import zlib
 import os
-from glassbox_validator.pre_execution import PreExecutionValidator
-from glassbox_validator.post_execution import PostExecutionValidator
+import socket
+from urllib.parse import urlsplit
+from glassbox_validator.admissibility import compile_policy, load_policies
+from glassbox_validator.attestation import AttestationStore
+from glassbox_validator.executor import ExecutorSaturated, ValidationExecutor
+from glassbox_validator.http_client import GlassboxClient, RetryPolicy
+from glassbox_validator.job_queue import JobQueue, lanes_for_runner
+from glassbox_validator.lineage_store import LineageStore
+from glassbox_validator.metrics import MetricsRegistry
+from glassbox_validator.pre_execution import SequenceRecord, ValidationResult
+from glassbox_validator.result_cache import ResultCache, cache_key
+from glassbox_validator.sbol_io import is_archive, iter_archive
+from glassbox_validator.sequence_io import iter_fasta
+from glassbox_validator.seal import ED25519, SEALED_DECISIONS, RevocationList, SealError, SealIssuer
 
 app = FastAPI(title="Glassbox Bio Validation Gateway", version="1.0.0")
-pre_validator = PreExecutionValidator()
-post_validator = PostExecutionValidator()
+# Exposed at GET /metrics in the Prometheus text format
+metrics = MetricsRegistry()
+request_seconds = metrics.histogram(
+    "glassbox_http_request_duration_seconds", "HTTP request latency by route template", ("method", "route", "status")
+)
+
+# Largest body GzipRequestMiddleware will inflate; beyond it the request gets 413 (gzip bomb guard)
+INFLATE_MAX_BYTES = int(os.environ.get("GLASSBOX_INFLATE_MAX_BYTES", 2 * 1024 ** 3))
+
+class GzipRequestMiddleware:
+    """
+    Inflates request bodies sent with Content-Encoding: gzip (large uploads from
+    GlassboxClient) chunk by chunk as the endpoint reads them, so multipart parsing
+    and disk spooling see the plain body without it ever being held compressed.
+    No chunk inflates past INFLATE_MAX_BYTES in total; a body that would is rejected with 413.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or dict(scope["headers"]).get(b"content-encoding") != b"gzip":
+            return await self.app(scope, receive, send)
+        headers = [(k, v) for k, v in scope["headers"] if k not in (b"content-encoding", b"content-length")]
+        inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        inflated = 0
+
+        def check(body: bytes):
+            nonlocal inflated
+            inflated += len(body)
+            if inflated > INFLATE_MAX_BYTES:
+                raise HTTPException(status_code=413, detail=f"Inflated request body exceeds {INFLATE_MAX_BYTES} bytes")
+
+        async def inflating_receive():
+            message = await receive()
+            if message["type"] == "http.request":
+                # At most one byte past the cap is ever produced, so a gzip bomb is never expanded
+                body = inflater.decompress(message.get("body", b""), INFLATE_MAX_BYTES - inflated + 1)
+                check(body)
+                if not message.get("more_body", False):
+                    tail = inflater.flush()
+                    check(tail)
+                    body += tail
+                message = {**message, "body": body}
+            return message
+        await self.app({**scope, "headers": headers}, inflating_receive, send)
+
+class MetricsMiddleware:
+    """
+    Observes every HTTP request into glassbox_http_request_duration_seconds, labelled
+    by route template ("/jobs/{job_id}") rather than raw path so ids do not each get a
+    series. Runs inside GzipRequestMiddleware, on the scope the router fills in.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        started = time.perf_counter()
+        status = 500
+
+        async def recording_send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+        try:
+            await self.app(scope, receive, recording_send)
+        finally:
+            route = getattr(scope.get("route"), "path", "unmatched")
+            request_seconds.observe(time.perf_counter() - started, scope["method"], route, str(status))
+
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(GzipRequestMiddleware)
+# GLASSBOX_EXECUTOR=thread|process|inline, GLASSBOX_WORKERS, GLASSBOX_MAX_QUEUE, GLASSBOX_TIMEOUT_S
+executor = ValidationExecutor.from_env()
+# GLASSBOX_CACHE_SIZE=0 disables the memory tier; GLASSBOX_CACHE_DB adds a shared SQLite tier
+result_cache = ResultCache(
+    max_entries=int(os.environ.get("GLASSBOX_CACHE_SIZE", 1024)),
+    ttl_s=float(os.environ.get("GLASSBOX_CACHE_TTL_S", 3600)),
+    db_path=os.environ.get("GLASSBOX_CACHE_DB") or None
+)
+# GLASSBOX_LINEAGE_DB persists design/data lineage; the default keeps it in memory for this process
+lineage = LineageStore(
+    db_path=os.environ.get("GLASSBOX_LINEAGE_DB", ":memory:"),
+    batch_size=int(os.environ.get("GLASSBOX_LINEAGE_BATCH", 256))
+)
+
+# GLASSBOX_POLICY_DIR holds audit_policy_v1 documents selectable per request with ?policy_id=
+POLICY_DIR = os.environ.get("GLASSBOX_POLICY_DIR")
+policies: Dict[str, Dict] = load_policies(POLICY_DIR) if POLICY_DIR and os.path.isdir(POLICY_DIR) else {}
+
+# GLASSBOX_SEAL_KEY / GLASSBOX_SEAL_HMAC_KEY sign seals; GLASSBOX_SEAL_REVOCATIONS lists revoked seal_ids
+sealer = SealIssuer.from_env()
+seal_verifier = sealer.verifier(revocations=RevocationList(os.environ.get("GLASSBOX_SEAL_REVOCATIONS")))
+
+# GLASSBOX_ATTESTATIONS: JSON-lines attestation file shared with the validator workers
+attestations = AttestationStore.from_env()
+
+# Job mode: a persistent queue (GLASSBOX_JOB_DB) drained by its own pool of GLASSBOX_JOB_WORKERS,
+# with a timeout (GLASSBOX_JOB_TIMEOUT_S) sized for large constructs and multi-GB datasets.
+# A claimed job is leased for GLASSBOX_JOB_LEASE_S and renewed while it runs; jobs whose lease
+# lapsed (their process died) are queued again, and finished jobs are kept GLASSBOX_JOB_RETENTION_S
+jobs = JobQueue(os.environ.get("GLASSBOX_JOB_DB", ":memory:"),
+                lease_s=float(os.environ.get("GLASSBOX_JOB_LEASE_S", 60)))
+JOB_RETENTION_S = float(os.environ.get("GLASSBOX_JOB_RETENTION_S", 7 * 24 * 3600))
+JOB_DIR = os.environ.get("GLASSBOX_JOB_DIR") or os.path.join(temple.gettempdir(), "glassbox-jobs")
+JOB_POLL_S = float(os.environ.get("GLASSBOX_JOB_POLL_S", 1.0))
+JOB_WEBHOOK_ATTEMPTS = 3
+# GLASSBOX_WEBHOOK_ALLOWED_HOSTS: comma-separated hosts (".example.com" for a domain and its subdomains)
+# webhooks may target; unset allows any host that resolves to public addresses only
+WEBHOOK_ALLOWED_HOSTS = [h.strip().lower() for h in os.environ.get("GLASSBOX_WEBHOOK_ALLOWED_HOSTS", "").split(",")
+                         if h.strip()]
+# One attempt per call: _deliver_webhook owns the retry loop
+webhook_client = GlassboxClient(connect_timeout_s=3.05, read_timeout_s=10, retry=RetryPolicy(attempts=1))
+job_executor = ValidationExecutor(
+    mode=os.environ.get("GLASSBOX_EXECUTOR", "thread"),
+    max_workers=int(os.environ.get("GLASSBOX_JOB_WORKERS", 2)),
+    max_queue=0,  # one runner per worker, so the job pool never saturates
+    timeout_s=float(os.environ.get("GLASSBOX_JOB_TIMEOUT_S", 3600))
+)
+job_wakeup = asyncio.Event()
+
+# Executor, cache and job gauges are read from the objects' own counters at scrape time
+stage_seconds = metrics.histogram(
+    "glassbox_validation_stage_seconds", "Time per validation stage, as recorded by the validators", ("kind", "stage")
+)
+validations_total = metrics.counter(
+    "glassbox_validations_total", "Validations run by the workers (cache hits excluded)", ("kind", "outcome")
+)
+_pools = {"api": executor, "jobs": job_executor}
+metrics.callback("glassbox_executor_in_flight", "Validations admitted to the pool, running or waiting",
+                 lambda: {(name,): pool.stats()["in_flight"] for name, pool in _pools.items()}, ("pool",))
+metrics.callback("glassbox_executor_queued", "Admitted validations waiting for a free worker",
+                 lambda: {(name,): pool.stats()["queued"] for name, pool in _pools.items()}, ("pool",))
+metrics.callback("glassbox_executor_capacity", "Workers plus wait-queue slots",
+                 lambda: {(name,): pool.stats()["capacity"] for name, pool in _pools.items()}, ("pool",))
+metrics.callback("glassbox_cache_hits_total", "Result cache hits", lambda: result_cache.hits, kind="counter")
+metrics.callback("glassbox_cache_misses_total", "Result cache misses", lambda: result_cache.misses, kind="counter")
+metrics.callback("glassbox_cache_entries", "Results held in the memory tier", lambda: result_cache.stats()["entries"])
+metrics.callback("glassbox_jobs", "Jobs by lane and status",
+                 lambda: {(lane, status): count for lane, counts in jobs.stats().items()
+                          for status, count in counts.items()}, ("lane", "status"))
+job_runners: List[asyncio.Task] = []
+
+@app.on_event("startup")
+async def start_executor():
+    executor.start()
+    job_executor.start()
+    os.makedirs(JOB_DIR, exist_ok=True)
+    jobs.requeue_expired()
+    for index in range(job_executor.max_workers):
+        job_runners.append(asyncio.create_task(_job_runner(lanes_for_runner(index, job_executor.max_workers))))
+    job_runners.append(asyncio.create_task(_job_maintenance()))
+
+@app.on_event("shutdown")
+def stop_executor():
+    for runner in job_runners:
+        runner.cancel()
+    executor.shutdown()
+    job_executor.shutdown()
+    jobs.release()
+    jobs.close()
+    lineage.close()
+
+def _overloaded(e: ExecutorSaturated) -> HTTPException:
+    return HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+
+def _timed_out() -> HTTPException:
+    return HTTPException(status_code=504, detail=f"Validation exceeded {executor.timeout_s:.0f}s timeout")
+
+# Uploads up to this size go to the parsers as bytes; larger ones are spooled to disk
+SPOOL_MAX_BYTES = int(os.environ.get("GLASSBOX_SPOOL_MAX_BYTES", 16 * 1024 * 1024))
+# Designs accepted by one /validate/design/batch request, counting archive members
+BATCH_MAX_DESIGNS = int(os.environ.get("GLASSBOX_BATCH_MAX_DESIGNS", 1000))
+# Uncompressed size limits for one archive member and for all members of one archive
+ARCHIVE_MAX_MEMBER_BYTES = int(os.environ.get("GLASSBOX_ARCHIVE_MAX_MEMBER_BYTES", 64 * 1024 ** 2))
+ARCHIVE_MAX_BYTES = int(os.environ.get("GLASSBOX_ARCHIVE_MAX_BYTES", 1024 ** 3))
+
+async def _upload_source(upload: UploadFile, suffix: str):
+    """Return upload bytes, or a temp file path when the upload exceeds SPOOL_MAX_BYTES"""
+    if upload.size is None or upload.size <= SPOOL_MAX_BYTES:
+        return await upload.read()
+    with temple.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        while chunk := await upload.read(1024 * 1024):
+            tmp.write(chunk)
+        return tmp.name
+
+async def _source_digest(source) -> str:
+    """
+    SHA-256 of the raw upload, whether held in memory (at most SPOOL_MAX_BYTES) or spooled to
+    disk; a spooled file is read and hashed in a worker thread, off the event loop
+    """
+    if not isinstance(source, str):
+        return hashlib.sha256(source).hexdigest()
+    return await asyncio.to_thread(_file_digest, source)
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _discard(*sources):
+    for source in sources:
+        if isinstance(source, str) and os.path.exists(source):
+            os.unlink(source)
 
 class ValidationResponse(BaseModel):
     is_valid: bool
@@ -21,31 +251,327 @@ class ValidationResponse(BaseModel):
     warnings: list[str]
     quality_score: Optional[float] = None
     design_hash: Optional[str] = None
+    component_digests: Optional[Dict[str, str]] = None
     metadata_hash: Optional[str] = None
     provenance_chain_valid: Optional[bool] = None
+    admissibility: Optional[Dict] = None
+    reevaluated_components: Optional[List[str]] = None
+    seal: Optional[Dict] = None
+    cache_hit: bool = False
+
+def _policy(policy_id: Optional[str]) -> Optional[Dict]:
+    if policy_id is None:
+        return None
+    policy = policies.get(policy_id)
+    if policy is None:
+        raise HTTPException(status_code=404, detail=f"Unknown policy: {policy_id}")
+    return policy
+
+def _previous_digests(previous_design_hash: Optional[str]) -> Optional[Dict[str, str]]:
+    if previous_design_hash is None:
+        return None
+    previous_digests = lineage.design_components(previous_design_hash)
+    if not previous_digests:
+        raise HTTPException(status_code=404, detail=f"Unknown previous design: {previous_design_hash}")
+    return previous_digests
+
+async def _validate_design_cached(source, queued: bool = False, policy: Dict = None,
+                                  previous_digests: Dict[str, str] = None,
+                                  pool: ValidationExecutor = None) -> ValidationResponse:
+    """Serve a design result from the cache, or validate it in the pool (the API executor by default) and cache it"""
+    pool = pool or executor
+    payload_sha256 = await _source_digest(source)
+    key = cache_key(payload_sha256, _design_fingerprint(policy))
+    cached = result_cache.get(key)
+    if cached is not None:
+        response = ValidationResponse(**cached, cache_hit=True)
+        if previous_digests is not None:
+            response.reevaluated_components = []
+        _record_design(response)
+        return _sealed(response, payload_sha256, policy)
+    if queued:
+        result = await pool.validate_design_queued(source, policy, previous_digests)
+    else:
+        result = await pool.validate_design(source, policy, previous_digests)
+    _observe("design", result)
+    response = _design_response(key, result)
+    _record_design(response)
+    return _sealed(response, payload_sha256, policy)
+
+def _observe(kind: str, result):
+    """Count a fresh validation and record its per-stage timings"""
+    validations_total.inc(kind, "valid" if result.is_valid else "invalid")
+    for stage, seconds in result.timings.items():
+        stage_seconds.observe(seconds, kind, stage)
+
+def _design_fingerprint(policy: Optional[Dict]) -> str:
+    fingerprint = executor.design_fingerprint
+    if policy is not None:
+        # Policy versions are immutable, so id + version identifies the scoring
+        fingerprint += f":{policy['policy_id']}@{policy['policy_version']}"
+        if policy.get("attestation_bypass", {}).get("enabled"):
+            fingerprint += f":att{attestations.generation}"
+    return fingerprint
+
+def _design_response(key: str, result: ValidationResult) -> ValidationResponse:
+    """Response for a fresh design result, cached under key"""
+    response = ValidationResponse(
+        is_valid=result.is_valid,
+        errors=result.errors,
+        warnings=result.warnings,
+        design_hash=result.design_hash,
+        component_digests=result.component_digests,
+        admissibility=result.admissibility,
+        reevaluated_components=result.reevaluated_components
+    )
+    if not response.admissibility or response.admissibility["decision"] != "pass_via_attestation":
+        # Attestations expire, so a bypass is re-checked on every request
+        result_cache.put(key, response.model_dump(exclude={"cache_hit", "seal", "reevaluated_components"}))
+    return response
+
+def _sealed(response: ValidationResponse, payload_sha256: str, policy: Optional[Dict]) -> ValidationResponse:
+    """Attach a fresh seal when the policy decision admits a valid design (seals are never cached)"""
+    if (policy is None or not response.is_valid or not response.admissibility
+            or response.admissibility["decision"] not in SEALED_DECISIONS):
+        return response
+    sealing = policy.get("sealing", {"enabled": True})
+    if not sealing["enabled"]:
+        return response
+    try:
+        response.seal = sealer.issue(payload_sha256, response.design_hash, response.admissibility,
+                                     sealing.get("algorithm", ED25519), sealing.get("seal_ttl_days", 30))
+    except SealError as e:
+        response.warnings = response.warnings + [f"Seal not issued: {e}"]
+    return response
+
+def _record_design(response: ValidationResponse):
+    if response.design_hash:
+        lineage.record_design(response.design_hash, response.is_valid, len(response.errors),
+                              len(response.warnings), response.component_digests)
 
 @app.post("/validate/design", response_model=ValidationResponse)
-async def validate_design(sbol_le: UploadFile = File(...)):
+async def validate_design(sbol_le: UploadFile = File(...), policy_id: Optional[str] = None,
+                          previous_design_hash: Optional[str] = None):
     """
     Pre-execution validation: Validate AI-generated SBOL design
+    Args:
+        policy_id: Score the design under this audit policy (see GLASSBOX_POLICY_DIR)
+        previous_design_hash: design_hash of the design this one revises (iterate_until_pass);
+            only components that changed since then are re-analysed
     Returns:
-        ValidationResponse with pass/fail and design hash
+        ValidationResponse with pass/fail and design hash, plus the adm_v1
+        decision and score breakdown when a policy is named and the re-analysed
+        components in incremental mode
     """
+    policy = _policy(policy_id)
+    previous_digests = _previous_digests(previous_design_hash)
+    source = None
     try:
-        with temple.NamedTemporaryFile(delete=False, suffix=".sbol") as tmp:
-            content = await sbol_le.read()
-            tmp.write(content)
-            tmp_path = tmp.name
-        result = pre_validator.validate_design(tmp_path)
-        os.unlink(tmp_path)
-        return ValidationResponse(
-            is_valid=result.is_valid,
-            errors=result.errors,
-            warnings=result.warnings,
-            design_hash=result.design_hash
-        )
+        source = await _upload_source(sbol_le, ".sbol")
+        return await _validate_design_cached(source, policy=policy, previous_digests=previous_digests)
+    except ExecutorSaturated as e:
+        raise _overloaded(e)
+    except asyncio.TimeoutError:
+        raise _timed_out()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        _discard(source)
+
+async def _collect_batch(uploads: List[UploadFile]) -> list:
+    """Flatten uploaded SBOL files and zip/tar archives into (name, bytes) in input order"""
+    designs = []
+    for upload in uploads:
+        data = await upload.read()
+        if is_archive(data):
+            designs.extend(iter_archive(data, max_members=BATCH_MAX_DESIGNS,
+                                        max_member_bytes=ARCHIVE_MAX_MEMBER_BYTES, max_total_bytes=ARCHIVE_MAX_BYTES))
+        else:
+            designs.append((upload.filename, data))
+        if len(designs) > BATCH_MAX_DESIGNS:
+            raise ValueError(f"Batch holds more than {BATCH_MAX_DESIGNS} designs")
+    return designs
+
+async def _stream_batch(designs: list, policy: Dict = None):
+    """
+    Yield one NDJSON line per design in input order, then a summary line.
+    At most executor.max_workers designs are in flight, so a large batch queues for
+    slots instead of crowding out single-design requests.
+    """
+    started = time.perf_counter()
+    summary = {"total": len(designs), "valid": 0, "invalid": 0, "failed": 0, "cache_hits": 0}
+    pending = iter(enumerate(designs))
+    window = deque()
+
+    def launch():
+        for index, (name, data) in pending:
+            task = asyncio.ensure_future(_validate_design_cached(data, queued=True, policy=policy))
+            window.append((index, name, task))
+            return
+
+    for _ in range(executor.max_workers):
+        launch()
+    try:
+        while window:
+            index, name, task = window.popleft()
+            launch()
+            try:
+                response = await task
+            except Exception as e:
+                timed_out = isinstance(e, asyncio.TimeoutError)
+                error = f"Validation exceeded {executor.timeout_s:.0f}s timeout" if timed_out else str(e)
+                line = {"is_valid": False, "errors": [error], "warnings": []}
+                summary["failed"] += 1
+            else:
+                line = response.model_dump()
+                summary["valid" if response.is_valid else "invalid"] += 1
+                summary["cache_hits"] += response.cache_hit
+            yield json.dumps({"index": index, "name": name, **line}) + "\n"
+    finally:
+        # Client went away mid-stream: drop designs that have not been picked up yet
+        for _, _, task in window:
+            task.cancel()
+    summary["elapsed_s"] = round(time.perf_counter() - started, 3)
+    yield json.dumps({"summary": summary}) + "\n"
+
+@app.post("/validate/design/batch")
+async def validate_design_batch(sbol_les: List[UploadFile] = File(...), policy_id: Optional[str] = None):
+    """
+    Pre-execution validation of many designs in one request.
+    Accepts several SBOL files and/or zip/tar archives of SBOL files, optionally
+    scored under one audit policy.
+    Returns:
+        NDJSON stream: {"index", "name", ...ValidationResponse} per design in input
+        order as each finishes, then {"summary": {...}} with aggregate counts
+    """
+    policy = _policy(policy_id)
+    try:
+        designs = await _collect_batch(sbol_les)
+    except ValueError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except (tarfile.TarError, zipfile.BadZipFile) as e:
+        raise HTTPException(status_code=400, detail=f"Unreadable archive: {e}")
+    if not designs:
+        raise HTTPException(status_code=400, detail="Batch contains no SBOL documents")
+    return StreamingResponse(_stream_batch(designs, policy), media_type="application/x-ndjson")
+
+# Records accepted by one /validate/sequences request; workers take them SEQUENCE_CHUNK at a time
+SEQUENCE_BATCH_MAX = int(os.environ.get("GLASSBOX_BATCH_MAX_SEQUENCES", 10000))
+SEQUENCE_CHUNK = 256
+
+class SequenceIn(BaseModel):
+    id: str  # Component display id
+    sequence: str
+    sequence_id: Optional[str] = None  # Sequence display id, seq_<id> by default
+    was_generated_by: Optional[str] = None  # AI provenance (prov:wasGeneratedBy)
+
+class SequenceBatchRequest(BaseModel):
+    records: List[SequenceIn]
+
+async def _validate_sequences(records: List[SequenceRecord], policy: Dict = None) -> Dict:
+    """
+    Validate records with the per-record result cache: misses go to the executor in
+    chunks of SEQUENCE_CHUNK, at most executor.max_workers at a time, and every result is recorded in lineage. A record's
+    design_hash is its digest, which also stands in for the payload digest in seals.
+    """
+    started = time.perf_counter()
+    fingerprint = _design_fingerprint(policy) + ":sequence"
+    digests = [record.digest() for record in records]
+    keys = [cache_key(digest, fingerprint) for digest in digests]
+    responses: List[Optional[ValidationResponse]] = []
+    misses = []
+    for index, key in enumerate(keys):
+        cached = result_cache.get(key)
+        responses.append(ValidationResponse(**cached, cache_hit=True) if cached is not None else None)
+        if cached is None:
+            misses.append(index)
+    # Like _stream_batch, at most executor.max_workers chunks are in flight, so a large
+    # batch leaves the remaining slots to other requests
+    pending = (misses[i:i + SEQUENCE_CHUNK] for i in range(0, len(misses), SEQUENCE_CHUNK))
+    window = deque()
+
+    def launch():
+        for chunk in pending:
+            task = asyncio.ensure_future(executor.validate_sequences_queued([records[i] for i in chunk], policy))
+            window.append((chunk, task))
+            return
+
+    for _ in range(executor.max_workers):
+        launch()
+    try:
+        while window:
+            chunk, task = window.popleft()
+            launch()
+            for index, result in zip(chunk, await task):
+                _observe("sequence", result)
+                responses[index] = _design_response(keys[index], result)
+    finally:
+        for _, task in window:
+            task.cancel()
+    summary = {"total": len(records), "valid": 0, "invalid": 0, "cache_hits": 0}
+    lines = []
+    for index, (record, digest, response) in enumerate(zip(records, digests, responses)):
+        _record_design(response)
+        response = _sealed(response, digest, policy)
+        summary["valid" if response.is_valid else "invalid"] += 1
+        summary["cache_hits"] += response.cache_hit
+        lines.append({"index": index, "name": record.display_id, **response.model_dump()})
+    summary["elapsed_s"] = round(time.perf_counter() - started, 3)
+    return {"results": lines, "summary": summary}
+
+async def _sequence_batch(records: Iterable[SequenceRecord], policy: Optional[Dict]) -> Dict:
+    records = list(itertools.islice(records, SEQUENCE_BATCH_MAX + 1))
+    if len(records) > SEQUENCE_BATCH_MAX:
+        raise HTTPException(status_code=413, detail=f"Batch holds more than {SEQUENCE_BATCH_MAX} sequences")
+    if not records:
+        raise HTTPException(status_code=400, detail="Batch contains no sequences")
+    try:
+        return await _validate_sequences(records, policy)
+    except ExecutorSaturated as e:
+        raise _overloaded(e)
+    except asyncio.TimeoutError:
+        raise _timed_out()
+
+@app.post("/validate/sequences")
+async def validate_sequences(request: SequenceBatchRequest, policy_id: Optional[str] = None):
+    """
+    Pre-execution validation of raw sequences without SBOL encoding. Each record gets
+    the rules, finding codes and policy scoring /validate/design applies to the
+    equivalent one-Component design; provenance is the record's was_generated_by.
+    Returns:
+        {"results": [{"index", "name", ...ValidationResponse}], "summary": {...}} in input order
+    """
+    policy = _policy(policy_id)
+    return await _sequence_batch(
+        (SequenceRecord(r.id, r.sequence, r.sequence_id, r.was_generated_by) for r in request.records), policy
+    )
+
+@app.post("/validate/sequences/fasta")
+async def validate_fasta(fasta_le: UploadFile = File(...), policy_id: Optional[str] = None,
+                         was_generated_by: Optional[str] = None):
+    """
+    /validate/sequences for a FASTA upload: each header's first word is the record id
+    and was_generated_by, when given, is the provenance of every record
+    """
+    policy = _policy(policy_id)
+    return await _sequence_batch(iter_fasta(await fasta_le.read(), was_generated_by), policy)
+
+async def _validate_data(allotrope_source, sbol_source, pool: ValidationExecutor = None) -> ValidationResponse:
+    """Validate one dataset in the pool (the API executor by default) and record its lineage"""
+    result = await (pool or executor).validate_data(allotrope_source, sbol_source)
+    _observe("data", result)
+    if result.metadata_hash:
+        lineage.record_data(result.metadata_hash, result.is_valid, result.quality_score,
+                            result.provenance_chain_valid, len(result.errors), len(result.warnings),
+                            result.device_ids, result.provenance_edges, object_digests=result.object_digests)
+    return ValidationResponse(
+        is_valid=result.is_valid,
+        errors=result.errors,
+        warnings=result.warnings,
+        quality_score=result.quality_score,
+        metadata_hash=result.metadata_hash,
+        provenance_chain_valid=result.provenance_chain_valid
+    )
 
 @app.post("/validate/data", response_model=ValidationResponse)
 async def validate_experimental_data(
@@ -57,31 +583,289 @@ async def validate_experimental_data(
     Returns:
         ValidationResponse with quality score and provenance status
     """
+    allotrope_source = sbol_source = None
     try:
-        with temple.NamedTemporaryFile(delete=False, suffix=".json") as tmp1:
-            tmp1.write(await allotrope_le.read())
-            allotrope_path = tmp1.name
-        with temple.NamedTemporaryFile(delete=False, suffix=".sbol") as tmp2:
-            tmp2.write(await sbol_provenance_le.read())
-            sbol_path = tmp2.name
-        result = post_validator.validate_data(allotrope_path, sbol_path)
-        os.unlink(allotrope_path)
-        os.unlink(sbol_path)
-        return ValidationResponse(
-            is_valid=result.is_valid,
-            errors=result.errors,
-            warnings=result.warnings,
-            quality_score=result.quality_score,
-            metadata_hash=result.metadata_hash,
-            provenance_chain_valid=result.provenance_chain_valid
-        )
+        allotrope_source = await _upload_source(allotrope_le, ".json")
+        sbol_source = await _upload_source(sbol_provenance_le, ".sbol")
+        return await _validate_data(allotrope_source, sbol_source)
+    except ExecutorSaturated as e:
+        raise _overloaded(e)
+    except asyncio.TimeoutError:
+        raise _timed_out()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        _discard(allotrope_source, sbol_source)
+
+async def _job_upload(upload: UploadFile, suffix: str) -> str:
+    """Persist a job upload under JOB_DIR so the job survives a restart"""
+    fd, path = temple.mkstemp(suffix=suffix, dir=JOB_DIR)
+    with os.fdopen(fd, "wb") as f:
+        while chunk := await upload.read(1024 * 1024):
+            f.write(chunk)
+    return path
+
+def _webhook_target_error(url: str) -> Optional[str]:
+    """
+    Why url may not be used as a webhook, or None. Only http(s) URLs to allow-listed hosts
+    are accepted, and every address the host resolves to must be public, so callers cannot
+    make the service reach loopback, private networks or cloud metadata endpoints.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        return "webhook_url must be an http(s) URL with a host"
+    host = parts.hostname.lower()
+    if WEBHOOK_ALLOWED_HOSTS and not any(
+            host == allowed or (allowed.startswith(".") and host.endswith(allowed)) for allowed in WEBHOOK_ALLOWED_HOSTS):
+        return f"webhook host {host} is not allowed"
+    try:
+        addresses = {info[4][0] for info in socket.getaddrinfo(host, parts.port or 443, proto=socket.IPPROTO_TCP)}
+    except (socket.gaierror, UnicodeError, ValueError) as e:
+        return f"webhook host {host} does not resolve: {e}"
+    for address in addresses:
+        if not ipaddress.ip_address(address.split("%", 1)[0]).is_global:
+            return f"webhook host {host} resolves to non-public address {address}"
+    return None
+
+async def _checked_webhook(webhook_url: Optional[str]) -> Optional[str]:
+    if webhook_url is not None:
+        error = await asyncio.to_thread(_webhook_target_error, webhook_url)
+        if error:
+            raise HTTPException(status_code=400, detail=error)
+    return webhook_url
+
+def _enqueue(kind: str, payload: Dict, lane: str, webhook_url: Optional[str]) -> Dict:
+    job_id = jobs.enqueue(kind, payload, lane, webhook_url)
+    job_wakeup.set()
+    return {"job_id": job_id, "status": "queued", "lane": lane}
+
+@app.post("/jobs/validate/design", status_code=202)
+async def enqueue_design_job(sbol_le: UploadFile = File(...), policy_id: Optional[str] = None,
+                             previous_design_hash: Optional[str] = None,
+                             lane: str = Query("gating", pattern="^(gating|bulk)$"),
+                             webhook_url: Optional[str] = None):
+    """Queue a design validation; returns a job_id at once (poll /jobs/{job_id} or pass webhook_url)"""
+    webhook_url = await _checked_webhook(webhook_url)
+    _policy(policy_id)
+    _previous_digests(previous_design_hash)
+    source = await _job_upload(sbol_le, ".sbol")
+    payload = {"source": source, "policy_id": policy_id, "previous_design_hash": previous_design_hash}
+    return _enqueue("design", payload, lane, webhook_url)
+
+@app.post("/jobs/validate/data", status_code=202)
+async def enqueue_data_job(allotrope_le: UploadFile = File(...), sbol_provenance_le: UploadFile = File(...),
+                           lane: str = Query("bulk", pattern="^(gating|bulk)$"),
+                           webhook_url: Optional[str] = None):
+    """Queue an experimental data validation; bulk lane unless the result gates execution"""
+    webhook_url = await _checked_webhook(webhook_url)
+    payload = {"allotrope_source": await _job_upload(allotrope_le, ".json"),
+               "sbol_source": await _job_upload(sbol_provenance_le, ".sbol")}
+    return _enqueue("data", payload, lane, webhook_url)
+
+@app.get("/jobs/{job_id}")
+async def job_status(job_id: str):
+    """Job state; result (a ValidationResponse) once done, error once failed"""
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    del job["payload"]
+    job["queue_position"] = jobs.position(job_id)
+    return job
+
+async def _job_runner(lanes: List[str]):
+    """Claim and run jobs from lanes until cancelled, sleeping until an enqueue or JOB_POLL_S"""
+    while True:
+        job_wakeup.clear()
+        job = jobs.claim(lanes)
+        if job is None:
+            try:
+                await asyncio.wait_for(job_wakeup.wait(), JOB_POLL_S)
+            except asyncio.TimeoutError:
+                pass
+            continue
+        await _run_job(job)
+
+async def _job_maintenance():
+    """
+    Every lease period: requeue jobs of dead processes, delete those past JOB_RETENTION_S and
+    drop expired rows from the GLASSBOX_CACHE_DB result cache
+    """
+    while True:
+        if jobs.requeue_expired():
+            job_wakeup.set()
+        jobs.purge(JOB_RETENTION_S)
+        result_cache.purge_expired()
+        await asyncio.sleep(jobs.lease_s)
+
+async def _heartbeat(job_id: str):
+    """Renew the job's lease while it runs, three times per lease period"""
+    while jobs.heartbeat(job_id):
+        await asyncio.sleep(jobs.lease_s / 3)
+
+async def _run_job(job: Dict):
+    payload = job["payload"]
+    heartbeat = asyncio.create_task(_heartbeat(job["job_id"]))
+    try:
+        if job["kind"] == "design":
+            response = await _validate_design_cached(
+                payload["source"], queued=True, policy=_policy(payload["policy_id"]),
+                previous_digests=_previous_digests(payload["previous_design_hash"]), pool=job_executor
+            )
+        else:
+            response = await _validate_data(payload["allotrope_source"], payload["sbol_source"], pool=job_executor)
+    except asyncio.CancelledError:
+        raise  # shutting down: the job is released back to the queue
+    except asyncio.TimeoutError:
+        finished = jobs.fail(job["job_id"], f"Validation exceeded {job_executor.timeout_s:.0f}s timeout")
+    except HTTPException as e:
+        finished = jobs.fail(job["job_id"], str(e.detail))
+    except Exception as e:
+        finished = jobs.fail(job["job_id"], str(e))
+    else:
+        finished = jobs.complete(job["job_id"], response.model_dump())
+    finally:
+        heartbeat.cancel()
+    if not finished:
+        return  # the lease lapsed and the job was requeued: its new owner reports it
+    _discard(*(payload[k] for k in ("source", "allotrope_source", "sbol_source") if k in payload))
+    if job["webhook_url"]:
+        await asyncio.to_thread(_deliver_webhook, job["job_id"], job["webhook_url"])
+
+def _deliver_webhook(job_id: str, url: str):
+    """
+    POST the finished job to its webhook, retrying with backoff; the outcome is kept on the job.
+    The target is re-checked before sending (DNS may have changed since enqueue) and redirects
+    are not followed. Each attempt carries the job_id as its Idempotency-Key.
+    """
+    job = jobs.get(job_id)
+    del job["payload"]
+    error = _webhook_target_error(url)
+    if error:
+        jobs.set_webhook_status(job_id, f"failed: {error}")
+        return
+    headers = {"Content-Type": "application/json", "Idempotency-Key": job_id}
+    for attempt in range(JOB_WEBHOOK_ATTEMPTS):
+        if attempt:
+            time.sleep(2 ** (attempt - 1))
+        try:
+            response = webhook_client.post(url, endpoint="webhook", data=json.dumps(job).encode(), headers=headers,
+                                           allow_redirects=False)
+        except Exception as e:
+            error = str(e)
+            continue
+        response.close()
+        if response.status_code < 300:
+            jobs.set_webhook_status(job_id, f"delivered ({response.status_code})")
+            return
+        error = f"HTTP {response.status_code}"
+    jobs.set_webhook_status(job_id, f"failed: {error}")
+
+class SealVerifyRequest(BaseModel):
+    seal: Dict
+    design_payload_sha256: Optional[str] = None  # SHA-256 of the design file about to be executed
+    design_hash: Optional[str] = None  # canonical design_hash of that design
+
+class SealBatchVerifyRequest(BaseModel):
+    items: List[SealVerifyRequest]
+
+@app.post("/seal/verify")
+async def verify_seal(request: SealVerifyRequest):
+    """
+    Execution gate: signature, revocation, expiry and (when given) payload digest check.
+    The design is not re-validated. Returns {"valid", "reason", "seal_id"}.
+    """
+    return seal_verifier.verify(request.seal, request.design_payload_sha256, design_hash=request.design_hash)
+
+@app.post("/seal/verify/batch")
+async def verify_seals(request: SealBatchVerifyRequest):
+    """Verify many seals, results in request order"""
+    return {"results": seal_verifier.verify_many(item.model_dump() for item in request.items)}
+
+# Bearer token for seal administration; unset disables revocation over the API
+# (append seal IDs to GLASSBOX_SEAL_REVOCATIONS instead)
+ADMIN_TOKEN = os.environ.get("GLASSBOX_ADMIN_TOKEN")
+
+def _require_operator(authorization: Optional[str]):
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Seal administration over the API is disabled")
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.strip().encode(), ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="Operator token required", headers={"WWW-Authenticate": "Bearer"})
+
+@app.post("/seal/revoke/{seal_id}")
+async def revoke_seal(seal_id: str, authorization: Optional[str] = Header(None)):
+    """Revoke a seal; requires Authorization: Bearer <GLASSBOX_ADMIN_TOKEN>"""
+    _require_operator(authorization)
+    seal_verifier.revocations.revoke(seal_id)
+    return {"seal_id": seal_id, "revoked": True}
+
+@app.get("/seal/keys")
+async def seal_keys():
+    """Public keys for offline verification with glassbox_validator.seal.SealVerifier"""
+    return {"keys": {sealer.key_id: {"algorithm": ED25519, "public_key": sealer.public_key}}}
+
+@app.post("/attestations")
+async def add_attestation(envelope: Dict, authorization: Optional[str] = Header(None)):
+    """
+    Register an external audit attestation of a design_hash; operators only, like seal
+    revocation. The envelope is stored only if a loaded policy's attestation_bypass would
+    accept it now (trusted attestor, allowed type, in date, valid signature); the signature
+    is checked again at use. Resubmitting a stored envelope changes nothing.
+    """
+    _require_operator(authorization)
+    if not attestations.path:
+        raise HTTPException(status_code=409, detail="GLASSBOX_ATTESTATIONS is not configured")
+    bypasses = [plan.bypass for plan in map(compile_policy, policies.values()) if plan.bypass is not None]
+    if not any(bypass.match([envelope]) for bypass in bypasses):
+        raise HTTPException(status_code=422, detail="Attestation is not signed by a trusted attestor of any policy")
+    try:
+        added = attestations.add(envelope)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"attested_payload_sha256": envelope["attested_payload_sha256"], "added": added,
+            "stored": len(attestations)}
+
+@app.get("/lineage/design/{design_hash}")
+async def design_lineage(design_hash: str, limit: int = Query(1000, le=10000)):
+    """Validations, component digests and derived datasets of one design"""
+    return {
+        "design_hash": design_hash,
+        "components": lineage.design_components(design_hash),
+        "validations": lineage.validations_for(design_hash, limit),
+        "datasets": lineage.datasets_for_design(design_hash, limit),
+    }
+
+@app.get("/lineage/dataset/{metadata_hash}")
+async def dataset_lineage(metadata_hash: str, limit: int = Query(1000, le=10000)):
+    """Validations of one dataset and the designs it was built from"""
+    return {
+        "metadata_hash": metadata_hash,
+        "validations": lineage.validations_for(metadata_hash, limit),
+        "designs": lineage.designs_for_dataset(metadata_hash, limit),
+    }
+
+@app.get("/lineage/device/{device_id}")
+async def device_lineage(device_id: str, limit: int = Query(1000, le=10000)):
+    """Datasets measured on one instrument, newest first"""
+    return {"device_id": device_id, "datasets": lineage.datasets_for_device(device_id, limit)}
+
+@app.get("/lineage/validations")
+async def validations_between(start: datetime, end: datetime,
+                              kind: Optional[str] = Query(None, pattern="^(design|data)$"),
+                              limit: int = Query(1000, le=10000)):
+    """Validation events recorded in [start, end)"""
+    return {"validations": lineage.validations_between(start.timestamp(), end.timestamp(), kind, limit)}
 
 @app.get("/health")
 async def health_check():
     """Service health check"""
-    return {"status": "healthy", "service": "glassbox-validator"}
+    return {"status": "healthy", "service": "glassbox-validator", "executor": executor.stats(),
+            "cache": result_cache.stats(), "policies": sorted(policies), "jobs": jobs.stats()}
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Prometheus scrape endpoint: request latency, per-stage validation timings, queue depth and cache hits"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
 
 if __name__ == "__main__":
     import uvicorn
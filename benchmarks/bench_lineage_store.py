@@ -0,0 +1,66 @@
+"""
+Benchmark: lineage store ingest and query latency
+Loads synthetic design and dataset validations with batched inserts, then times the
+indexed queries behind the /lineage endpoints.
+Run from the repository root: python -m benchmarks.bench_lineage_store [datasets]
+"""
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from glassbox_validator.lineage_store import LineageStore
+
+COMPONENTS_PER_DESIGN = 5
+DEVICES = 50
+QUERY_ROUNDS = 200
+
+def populate(store: LineageStore, datasets: int, rng: random.Random) -> list:
+    designs = [f"design-{i:08d}" for i in range(max(1, datasets // 10))]
+    start = time.time() - 86400 * 30
+    for i, design in enumerate(designs):
+        components = {f"https://lab.example/{design}/part_{c}": f"{design}-{c}" for c in range(COMPONENTS_PER_DESIGN)}
+        store.record_design(design, True, 0, 1, components, recorded_at=start + i)
+    for i in range(datasets):
+        design = rng.choice(designs)
+        edges = [
+            (f"https://lab.example/data_{i}", "generated_by", f"https://lab.example/exp_{i}"),
+            (f"https://lab.example/exp_{i}", "members", f"https://lab.example/impl_{i}"),
+            (f"https://lab.example/impl_{i}", "built", f"https://lab.example/{design}/part_{rng.randrange(COMPONENTS_PER_DESIGN)}"),
+        ]
+        store.record_data(f"data-{i:08d}", True, rng.random(), True, 0, 0, [f"reader_{rng.randrange(DEVICES):03d}"],
+                          edges, recorded_at=start + i * 2.5)
+    store.flush()
+    return designs
+
+def time_ms(fn) -> float:
+    samples = []
+    for _ in range(QUERY_ROUNDS):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+def main(datasets: int = 200000, seed: int = 0):
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = LineageStore(os.path.join(tmp, "lineage.db"), batch_size=5000)
+        start = time.perf_counter()
+        designs = populate(store, datasets, rng)
+        ingest_s = time.perf_counter() - start
+        rows = sum(store.stats().values())
+        print(f"datasets={datasets} designs={len(designs)} rows={rows} ingest={rows / ingest_s:,.0f} rows/s")
+        t0 = time.time() - 86400 * 30
+        queries = {
+            "datasets_for_design": lambda: store.datasets_for_design(rng.choice(designs)),
+            "designs_for_dataset": lambda: store.designs_for_dataset(f"data-{rng.randrange(datasets):08d}"),
+            "datasets_for_device": lambda: store.datasets_for_device(f"reader_{rng.randrange(DEVICES):03d}", 100),
+            "validations_between": lambda: store.validations_between(t0 + 3600, t0 + 7200),
+        }
+        for name, query in queries.items():
+            print(f"{name:20s} {time_ms(query):7.3f} ms (median of {QUERY_ROUNDS})")
+        store.close()
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,60 @@
+"""
+Benchmark: Allotrope schema validation throughput
+jsonschema.validate() per call (metaschema check + new validator each time) vs the
+registry's precompiled per-manifest validator, on a 384-well plate reader document.
+Run from the repository root: python -m benchmarks.bench_schema_registry
+"""
+import random
+import time
+import jsonschema
+from glassbox_validator.schema_registry import SchemaRegistry, DEFAULT_SCHEMA_DIR
+
+MANIFEST = "http://purl.allotrope.org/manifests/plate-reader/REC/2023/09/plate-reader.manifest"
+WELLS = 384
+MEASUREMENTS = 4
+DURATION_S = 3.0
+
+def build_document(seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    rows = "ABCDEFGHIJKLMNOP"
+    measurement_docs = []
+    for m in range(MEASUREMENTS):
+        points = [{
+            "sample document": {"sample identifier": f"plate/{rows[w // 24]}{w % 24 + 1}"},
+            "fluorescence": {"value": rng.gauss(40000, 2000), "unit": "RFU"},
+            "excitation wavelength": {"value": 488, "unit": "nm"},
+            "emission wavelength": {"value": 520, "unit": "nm"},
+        } for w in range(WELLS)]
+        measurement_docs.append({
+            "measurement identifier": f"run_{m}",
+            "measurement time": "2026-02-22T03:00:00Z",
+            "device system document": {"device identifier": "reader_001", "firmware version": "v2.3.0"},
+            "fluorescence point detection aggregate document": {"fluorescence point detection document": points},
+        })
+    return {"$asm.manifest": MANIFEST, "measurement aggregate document": {"measurement document": measurement_docs}}
+
+def rate(fn) -> float:
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < DURATION_S:
+        fn()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+def main():
+    document = build_document()
+    start = time.perf_counter()
+    registry = SchemaRegistry(DEFAULT_SCHEMA_DIR)
+    load_s = time.perf_counter() - start
+    name = registry.for_manifest(MANIFEST)
+    schema = registry.schema(name)
+
+    assert registry.validate(document, name) == [], "benchmark document should be valid"
+    legacy = rate(lambda: jsonschema.validate(instance=document, schema=schema))
+    compiled = rate(lambda: registry.validate(document, name))
+    print(f"schema={name} wells={WELLS} measurements={MEASUREMENTS} registry load={load_s * 1000:.1f} ms")
+    print(f"jsonschema.validate: {legacy:9.1f} validations/s")
+    print(f"registry (compiled): {compiled:9.1f} validations/s ({compiled / legacy:.1f}x)")
+
+if __name__ == "__main__":
+    main()
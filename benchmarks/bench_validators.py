@@ -0,0 +1,223 @@
+"""
+Benchmark: pre- and post-execution validators, API endpoints and end-to-end throughput
+Times the validator entrypoints and their hot helpers on deterministic workloads from
+benchmarks.workloads, the /validate endpoints in-process, and batch throughput. Results
+are saved as JSON; with --baseline, cases slower than the baseline by more than
+--threshold are reported as regressions and the exit status is 1.
+Run from the repository root: python -m benchmarks.bench_validators [-o results.json] [--baseline old.json]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List
+import numpy as np
+from benchmarks.workloads import design_xml, fasta, plate_document, plate_values, provenance_xml, random_dna
+from glassbox_validator.measurements import MeasurementTable, extract_measurements
+from glassbox_validator.post_execution import PostExecutionValidator
+from glassbox_validator.pre_execution import PreExecutionValidator, SequenceRecord
+from glassbox_validator.provenance_index import ProvenanceIndex
+from glassbox_validator.sbol_io import load_document
+
+ROUNDS = 15
+THROUGHPUT_ROUNDS = 3
+WARMUP = 2
+MIN_ROUND_S = 0.02  # fast cases repeat within a round until it lasts this long, to keep timer noise out
+READS = 4  # plate reads (measurement documents) per dataset
+
+class Suite:
+    """Runs and records cases whose name contains the filter; each is warmed up, then timed per call over rounds"""
+    def __init__(self, name_filter: str = None):
+        self.name_filter = name_filter
+        self.results: Dict[str, Dict] = {}
+
+    def selects(self, group: str) -> bool:
+        """False when the filter names another group ("pre.", "post.", "api.", "throughput."), so its setup is skipped"""
+        return not self.name_filter or "." not in self.name_filter or self.name_filter.split(".")[0] == group
+
+    def run(self, name: str, fn: Callable, rounds: int = ROUNDS, items: int = None, unit: str = None):
+        if self.name_filter and self.name_filter not in name:
+            return
+        for _ in range(WARMUP if rounds > THROUGHPUT_ROUNDS else 1):
+            start = time.perf_counter()
+            fn()
+            once = time.perf_counter() - start
+        loops = max(1, int(MIN_ROUND_S / once)) if once > 0 and rounds > THROUGHPUT_ROUNDS else 1
+        samples = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for _ in range(loops):
+                fn()
+            samples.append((time.perf_counter() - start) * 1000 / loops)
+        median = statistics.median(samples)
+        result = {"median_ms": round(median, 4), "min_ms": round(min(samples), 4), "rounds": rounds, "loops": loops}
+        line = f"{name:<52} {median:10.2f} ms"
+        if unit:
+            result["throughput"] = round(items / (median / 1000), 1)
+            result["unit"] = unit
+            line += f"  {result['throughput']:>12,.0f} {unit}"
+        print(line, flush=True)
+        self.results[name] = result
+
+def bench_pre_execution(suite: Suite, quick: bool):
+    validator = PreExecutionValidator()
+    sizes = [(1, 1000), (10, 2000)] + ([] if quick else [(100, 2000), (10, 20000)])
+    for components, length in sizes:
+        design = design_xml(components, length)
+        suite.run(f"pre.validate_design/{components}x{length}bp", lambda: validator.validate_design(design))
+    record = SequenceRecord("bench_part", random_dna(random.Random(0), 10000), was_generated_by="urn:bench")
+    suite.run("pre.validate_sequence/10000bp", lambda: validator.validate_sequence(record))
+    for length in [5000] + ([] if quick else [50000]):
+        construct = random_dna(random.Random(length), length, repeats=3)
+        suite.run(f"pre._has_high_repetition/{length}bp", lambda: validator._has_high_repetition(construct))
+
+def measurement_table(wells: int, seed: int = 0) -> MeasurementTable:
+    """Plate readings as the MeasurementTable extract_measurements builds, one group per read"""
+    values = plate_values(wells, READS, seed)
+    return MeasurementTable(
+        value=np.asarray([v for read in values for v in read], dtype=np.float64),
+        measurement=np.repeat(np.arange(READS, dtype=np.int64), wells),
+        well=np.asarray([f"w{w}" for _ in range(READS) for w in range(wells)], dtype=object),
+        unit=np.full(READS * wells, "RFU", dtype=object),
+        measurement_ids=[f"run_{m}" for m in range(READS)],
+        detection_counts=np.full(READS, wells, dtype=np.int64),
+    )
+
+def check_plate(validator: PostExecutionValidator, plate: Dict, wells: int):
+    """The plate is read in full and its planted outliers are found, so the timed path is the real one"""
+    table = extract_measurements(plate)
+    assert len(table.value) == wells * READS, f"extract_measurements read {len(table.value)} of {wells * READS} values"
+    outliers = table.outlier_counts(table.group_stats()["z"], validator.cong["outlier_threshold_sigma"])
+    assert outliers.sum() > 0, f"no outliers detected in the {wells}-well plate"
+
+def bench_post_execution(suite: Suite, quick: bool):
+    validator = PostExecutionValidator()
+    provenance = provenance_xml()
+    for wells in [96, 384] + ([] if quick else [1536]):
+        plate = plate_document(wells, READS)
+        check_plate(validator, plate, wells)
+        document = json.dumps(plate).encode()
+        suite.run(f"post.validate_data/{wells}w", lambda: validator.validate_data(document, provenance))
+        table = measurement_table(wells)
+        suite.run(f"post._detect_outliers/{wells}w",
+                  lambda: validator._detect_outliers(table, table.group_stats()))
+    for experiments in [10] + ([] if quick else [200]):
+        graph = provenance_xml(design_count=experiments)
+        suite.run(f"post.provenance_chain/{experiments}exp", lambda: validator._validate_provenance_chain(
+            ProvenanceIndex.from_document(load_document(graph))))
+
+def bench_endpoints(suite: Suite, quick: bool):
+    """In-process requests; the result cache is off by default here so every request validates"""
+    os.environ.setdefault("GLASSBOX_EXECUTOR", "inline")
+    os.environ.setdefault("GLASSBOX_CACHE_SIZE", "0")
+    from fastapi.testclient import TestClient
+    import api
+    design = design_xml(10, 2000)
+    records = {"records": [{"id": f"seq_{i}", "sequence": random_dna(random.Random(i), 1000),
+                            "was_generated_by": "urn:bench"} for i in range(100)]}
+    plate = json.dumps(plate_document(384, READS)).encode()
+    provenance = provenance_xml()
+    batch_size = 8 if quick else 32
+    batch = [("sbol_les", (f"design_{i}.xml", design_xml(10, 2000, seed=i, prefix=f"bench{i}")))
+             for i in range(batch_size)]
+    sequence_count = 1000 if quick else 5000
+    sequences = {"records": [{"id": f"seq_{i}", "sequence": s, "was_generated_by": "urn:bench"} for i, s in
+                             enumerate(fasta(sequence_count, 1000).decode().split("\n")[1::2])]}
+
+    def ok(response):
+        assert response.status_code == 200, response.text
+        return response
+
+    with TestClient(api.app) as client:
+        suite.run("api.POST /validate/design/10x2000bp", lambda: ok(
+            client.post("/validate/design", files={"sbol_le": ("design.xml", design)})))
+        suite.run("api.POST /validate/sequences/100x1000bp", lambda: ok(
+            client.post("/validate/sequences", json=records)))
+        suite.run("api.POST /validate/data/384w", lambda: ok(client.post("/validate/data", files={
+            "allotrope_le": ("plate.json", plate), "sbol_provenance_le": ("provenance.xml", provenance)})))
+        suite.run("api.GET /metrics", lambda: ok(client.get("/metrics")))
+        suite.run(f"api.throughput/POST /validate/design/batch/{batch_size}", lambda: ok(
+            client.post("/validate/design/batch", files=batch)).content,
+            rounds=THROUGHPUT_ROUNDS, items=batch_size, unit="designs/s")
+        suite.run(f"api.throughput/POST /validate/sequences/{sequence_count}", lambda: ok(
+            client.post("/validate/sequences", json=sequences)),
+            rounds=THROUGHPUT_ROUNDS, items=sequence_count, unit="sequences/s")
+
+def bench_throughput(suite: Suite, quick: bool):
+    """Validator throughput across a process pool, as used for batch and bulk work outside the API"""
+    from glassbox_validator.bulk_ingest import ingest
+    validator = PreExecutionValidator()
+    design_count = 8 if quick else 64
+    designs = [design_xml(10, 2000, seed=i, prefix=f"bench{i}") for i in range(design_count)]
+    suite.run(f"throughput.validate_many/{design_count}", lambda: list(validator.validate_many(designs)),
+              rounds=THROUGHPUT_ROUNDS, items=design_count, unit="designs/s")
+    record_count = 5000 if quick else 50000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "library.fasta")
+        with open(path, "wb") as f:
+            f.write(fasta(record_count, 1000))
+        suite.run(f"throughput.bulk_ingest/{record_count}x1000bp", lambda: ingest(path, os.devnull),
+                  rounds=THROUGHPUT_ROUNDS, items=record_count, unit="records/s")
+
+GROUPS = {"pre": bench_pre_execution, "post": bench_post_execution, "api": bench_endpoints,
+          "throughput": bench_throughput}
+
+def environment() -> Dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {"created": datetime.utcnow().isoformat() + "Z", "commit": commit, "python": platform.python_version(),
+            "platform": platform.platform(), "cpu_count": os.cpu_count()}
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[str]:
+    """Names of cases whose median is more than threshold (a fraction) slower than the baseline"""
+    regressions = []
+    print(f"\n{'case':<52} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        change = result["median_ms"] / before["median_ms"] - 1
+        flag = " REGRESSION" if change > threshold else ""
+        print(f"{name:<52} {before['median_ms']:10.2f} {result['median_ms']:10.2f} {change:+8.1%}{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_validators", description=__doc__.split("\n")[1])
+    parser.add_argument("-o", "--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="results JSON from an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="slowdown reported as a regression (fraction, default 0.15)")
+    parser.add_argument("-k", "--filter", help="only run cases whose name contains this")
+    parser.add_argument("--quick", action="store_true", help="smaller workloads, for CI")
+    args = parser.parse_args(argv)
+    suite = Suite(args.filter)
+    for name, group in GROUPS.items():
+        if suite.selects(name):
+            group(suite, args.quick)
+    report = {"environment": environment(), "quick": args.quick, "results": suite.results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(suite.results, baseline["results"], args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}", file=sys.stderr)
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""
+Synthetic workload generator for the validator benchmarks
+Deterministic (seeded) SBOL3 designs, Allotrope plate-reader documents and SBOL provenance
+graphs, filled in from the templates in schemas/ so they track the documented formats.
+Run from the repository root to write a workload to disk:
+python -m benchmarks.workloads out_dir [--designs N] [--components N] [--wells 96|384|1536]
+"""
+import argparse
+import copy
+import json
+import os
+import random
+import re
+from typing import Dict, List, Tuple
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "schemas")
+TIMESTAMP = "2026-01-01T00:00:00Z"
+MOTIF_LENGTH = 40
+# Plate formats: wells -> (rows, columns)
+PLATE_LAYOUTS = {96: (8, 12), 384: (16, 24), 1536: (32, 48)}
+# ASM key spellings as PostExecutionValidator and extract_measurements read them ("uorescence ...",
+# "... identier"); plate documents are renamed to match so the benchmark exercises the outlier path
+VALIDATOR_SPELLINGS = (("fluorescence", "uorescence"), ("identifier", "identier"))
+
+def _template(name: str) -> Tuple[str, str, str]:
+    """(rdf:RDF opening tag, body, closing tag) of an SBOL template in schemas/"""
+    with open(os.path.join(SCHEMA_DIR, name)) as f:
+        text = f.read()
+    match = re.search(r"(<rdf:RDF[^>]*>)(.*)(</rdf:RDF>)", text, re.S)
+    return match.group(1), match.group(2), match.group(3)
+
+def random_dna(rng: random.Random, length: int, repeats: int = 0) -> str:
+    """Uniform ACGT; repeats > 0 plants that many extra copies of one 40 bp motif"""
+    bases = rng.choices("ACGT", k=length)
+    if repeats and length >= MOTIF_LENGTH * (repeats + 1):
+        motif = bases[:MOTIF_LENGTH]
+        for offset in rng.sample(range(1, length // MOTIF_LENGTH), repeats):
+            bases[offset * MOTIF_LENGTH:(offset + 1) * MOTIF_LENGTH] = motif
+    return "".join(bases)
+
+def _components(component_count: int, length: int, seed: int, prefix: str, repeats: int) -> List[str]:
+    _, body, _ = _template("sbol3_design_schema.xml")
+    rng = random.Random(seed)
+    return [body.format(
+        design_id=f"{prefix}_part_{i}",
+        human_readable_name=f"Synthetic part {i}",
+        design_rationale="Benchmark workload",
+        seq_id=f"{prefix}_seq_{i}",
+        model_id="bench-generator-v1",
+        ISO8601_timestamp=TIMESTAMP,
+        DNA_sequence_string=random_dna(rng, length, repeats),
+    ) for i in range(component_count)]
+
+def design_xml(component_count: int = 10, length: int = 2000, seed: int = 0, repeats: int = 0,
+               prefix: str = "bench") -> bytes:
+    """
+    SBOL3 RDF/XML design of component_count Components, each with one Sequence of
+    length bases and AI provenance, from schemas/sbol3_design_schema.xml. Components
+    are named <prefix>_part_<i>; vary seed or prefix for designs that do not share a cache entry.
+    """
+    head, _, tail = _template("sbol3_design_schema.xml")
+    return "\n".join([head, *_components(component_count, length, seed, prefix, repeats), tail]).encode()
+
+def plate_wells(wells: int) -> List[str]:
+    rows, columns = PLATE_LAYOUTS[wells]
+    names = [chr(ord("A") + r) if r < 26 else "A" + chr(ord("A") + r - 26) for r in range(rows)]
+    return [f"{row}{column + 1}" for row in names for column in range(columns)]
+
+def plate_values(wells: int = 96, measurements: int = 1, seed: int = 0,
+                 outlier_rate: float = 0.01) -> List[List[float]]:
+    """Fluorescence readings (RFU) per measurement and well; outlier_rate of them read 3x high"""
+    if wells not in PLATE_LAYOUTS:
+        raise ValueError(f"wells must be one of {sorted(PLATE_LAYOUTS)}")
+    rng = random.Random(seed)
+    return [[rng.gauss(40000, 2000) * (3 if rng.random() < outlier_rate else 1) for _ in range(wells)]
+            for _ in range(measurements)]
+
+def _validator_keys(node):
+    """node with every dict key respelled per VALIDATOR_SPELLINGS"""
+    if isinstance(node, list):
+        return [_validator_keys(item) for item in node]
+    if not isinstance(node, dict):
+        return node
+    renamed = {}
+    for key, value in node.items():
+        for spelling, validator_spelling in VALIDATOR_SPELLINGS:
+            key = key.replace(spelling, validator_spelling)
+        renamed[key] = _validator_keys(value)
+    return renamed
+
+def plate_document(wells: int = 96, measurements: int = 1, seed: int = 0, outlier_rate: float = 0.01) -> Dict:
+    """
+    Allotrope ASM plate-reader document from schemas/allotrope_asm_schema.json: one
+    measurement document per read, each with a point detection document per well, keyed
+    the way the validator reads them (VALIDATOR_SPELLINGS).
+    """
+    with open(os.path.join(SCHEMA_DIR, "allotrope_asm_schema.json")) as f:
+        template = json.load(f)
+    measurement_template = template["measurement aggregate document"]["measurement document"][0]
+    aggregate_key = next(k for k in measurement_template if k.endswith("point detection aggregate document"))
+    documents_key = aggregate_key.replace(" aggregate document", " document")
+    point_template = measurement_template[aggregate_key][documents_key][0]
+    reading_key = aggregate_key.replace(" point detection aggregate document", "")
+    names = plate_wells(wells)
+    documents = []
+    for m, values in enumerate(plate_values(wells, measurements, seed, outlier_rate)):
+        points = []
+        for name, value in zip(names, values):
+            point = copy.deepcopy(point_template)
+            point["sample document"]["sample identifier"] = f"plate_{seed}/{name}"
+            point[reading_key]["value"] = round(value, 1)
+            points.append(point)
+        document = copy.deepcopy({k: v for k, v in measurement_template.items() if k != aggregate_key})
+        document["measurement identifier"] = f"run_{seed}_{m:03d}"
+        document[aggregate_key] = {documents_key: points}
+        documents.append(document)
+    return _validator_keys({**template, "measurement aggregate document": {"measurement document": documents}})
+
+def provenance_xml(design_count: int = 1, builds_per_design: int = 4, components_per_design: int = 1,
+                   length: int = 500, seed: int = 0) -> bytes:
+    """
+    SBOL3 provenance graph for validate_data: design Components, and per design one
+    Experiment over builds_per_design Implementations (sbol:built -> the design's first
+    Component) with an ExperimentalData generated by it, from
+    schemas/sbol3_experimental_data_schema.xml.
+    """
+    head, body, tail = _template("sbol3_experimental_data_schema.xml")
+    implementation, rest = body.split("<!-- Experiment Execution -->")
+    member = re.search(r"\s*<sbol:member [^>]*/>", rest).group(0)
+    parts = []
+    for d in range(design_count):
+        prefix = f"bench{seed}_{d}"
+        parts.extend(_components(components_per_design, length, seed * 7919 + d, prefix, 0))
+        builds = [f"{prefix}_build_{b}" for b in range(builds_per_design)]
+        parts.extend(implementation.format(build_id=build, design_id=f"{prefix}_part_0", robot_id="bench_robot")
+                     for build in builds)
+        members = "".join(member.format(build_id=build) for build in builds)
+        parts.append("<!-- Experiment Execution -->" + rest.replace(member, members, 1).format(
+            exp_id=f"{prefix}_exp", ISO8601_start=TIMESTAMP, ISO8601_end=TIMESTAMP,
+            data_id=f"{prefix}_data", filename=f"{prefix}_plate",
+        ))
+    return "\n".join([head, *parts, tail]).encode()
+
+def fasta(record_count: int = 1000, length: int = 1000, seed: int = 0) -> bytes:
+    rng = random.Random(seed)
+    return "".join(f">seq_{i}\n{random_dna(rng, length)}\n" for i in range(record_count)).encode()
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.workloads",
+                                     description="Write a deterministic synthetic validation workload")
+    parser.add_argument("out_dir")
+    parser.add_argument("--designs", type=int, default=10)
+    parser.add_argument("--components", type=int, default=10)
+    parser.add_argument("--length", type=int, default=2000, help="bases per Sequence")
+    parser.add_argument("--wells", type=int, default=96, choices=sorted(PLATE_LAYOUTS))
+    parser.add_argument("--measurements", type=int, default=4, help="plate reads per dataset")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    os.makedirs(args.out_dir, exist_ok=True)
+    for i in range(args.designs):
+        seed = args.seed * 1000003 + i
+        with open(os.path.join(args.out_dir, f"design_{i:04d}.xml"), "wb") as f:
+            f.write(design_xml(args.components, args.length, seed, prefix=f"bench{seed}"))
+        with open(os.path.join(args.out_dir, f"plate_{i:04d}.json"), "w") as f:
+            json.dump(plate_document(args.wells, args.measurements, seed), f)
+        with open(os.path.join(args.out_dir, f"provenance_{i:04d}.xml"), "wb") as f:
+            f.write(provenance_xml(seed=seed))
+    print(f"wrote {args.designs} designs, plates and provenance graphs to {args.out_dir}")
+
+if __name__ == "__main__":
+    main()
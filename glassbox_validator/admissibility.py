@@ -0,0 +1,303 @@
+"""
+Glassbox Bio Admissibility Engine
+Compiles audit policies (schemas/audit_policy.schema.json) into executable plans scored with adm_v1
+"""
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+from glassbox_validator.attestation import AttestationBypass
+from glassbox_validator.schema_registry import default_registry
+
+SCORE_MODEL_VERSION = "adm_v1"
+SEVERITIES = ("info", "low", "medium", "high", "critical")
+BLOCKING_SEVERITIES = frozenset(("high", "critical"))
+# Module score when a module reports findings but no score of its own: 100 minus these per finding
+SEVERITY_DEDUCTIONS = {"info": 0, "low": 5, "medium": 15, "high": 40, "critical": 100}
+# adm_v1 step 2: (penalty code, finding code prefix, amount by most severe matching finding)
+PENALTIES = (
+    ("OOD", "OOD_", {"medium": -5, "high": -10, "critical": -20}),
+    ("XMODEL_CONTRADICTION", "XMODEL_CONTRADICTION_", {"medium": -5, "high": -12, "critical": -25}),
+    ("EVIDENCE_MISSING", "EVIDENCE_MISSING_", {"medium": -4, "high": -10, "critical": -18}),
+)
+REQUIRED_MODULE_MISSING = "POLICY_REQUIRED_MODULE_MISSING"
+ATTESTATION_ACCEPTED = "ATTESTATION_ACCEPTED"
+
+class PolicyError(ValueError):
+    """Policy document that does not conform to audit_policy_v1 or cannot be scored"""
+
+@dataclass
+class Finding:
+    """One module observation under a stable code (audit_response Finding)"""
+    code: str
+    title: str
+    severity: str  # info | low | medium | high | critical
+    category: str
+    description: str = ""
+    confidence: str = "high"
+    scope: Dict = field(default_factory=dict)
+
+    def to_dict(self, finding_id: str) -> Dict:
+        out = {"finding_id": finding_id, "code": self.code, "title": self.title, "severity": self.severity,
+               "confidence": self.confidence, "category": self.category}
+        if self.description:
+            out["description"] = self.description
+        if self.scope:
+            out["scope"] = self.scope
+        return out
+
+@dataclass
+class ModuleResult:
+    module_id: str
+    findings: List[Finding]
+    score: Optional[float] = None  # 0-100; derived from finding severities when not given
+
+    def __post_init__(self):
+        if self.score is None:
+            self.score = float(max(0, 100 - sum(SEVERITY_DEDUCTIONS[f.severity] for f in self.findings)))
+
+# A module runs with its policy params and reports its findings
+ModuleFn = Callable[[Dict], ModuleResult]
+
+@dataclass(frozen=True)
+class PlannedModule:
+    module_id: str
+    weight: float
+    params: Dict
+    fail_on_codes: frozenset
+
+@dataclass
+class AdmissibilityReport:
+    policy: Dict
+    decision: str  # pass | warn | fail | pass_via_attestation
+    admissibility_index: float
+    score_breakdown: Dict
+    findings: List[Finding]
+    blocking_findings: List[Finding]
+    modules_run: List[str]
+    hard_fail: Optional[str] = None  # code that stopped the run early
+    attestation: Optional[Dict] = None  # envelope that bypassed some or all modules
+
+    @property
+    def passed(self) -> bool:
+        return self.decision in ("pass", "pass_via_attestation")
+
+    def to_dict(self) -> Dict:
+        """audit_response fields: policy, decision, admissibility_index, score_breakdown, findings"""
+        ids = {id(f): f"F{i:04d}" for i, f in enumerate(self.findings, 1)}
+        return {
+            "policy": self.policy,
+            "decision": self.decision,
+            "admissibility_index": self.admissibility_index,
+            "score_breakdown": self.score_breakdown,
+            "blocking_findings": [f.to_dict(ids[id(f)]) for f in self.blocking_findings],
+            "findings": [f.to_dict(ids[id(f)]) for f in self.findings],
+        }
+
+def round_half_up(value: float, places: int = 3) -> float:
+    return float(Decimal(str(value)).quantize(Decimal(1).scaleb(-places), rounding=ROUND_HALF_UP))
+
+class PolicyPlan:
+    """
+    A validated policy reduced to what scoring needs: enabled modules in policy order,
+    hard-fail codes as a set, thresholds. Disabled modules are dropped here and never run.
+    """
+    def __init__(self, policy: Dict):
+        adm = policy["admissibility"]
+        if adm["score_model_version"] != SCORE_MODEL_VERSION:
+            raise PolicyError(f"Unsupported score_model_version {adm['score_model_version']!r}")
+        if adm["warn_threshold"] > adm["pass_threshold"]:
+            raise PolicyError("warn_threshold exceeds pass_threshold")
+        self.policy_id = policy["policy_id"]
+        self.policy_version = policy["policy_version"]
+        self.pass_threshold = adm["pass_threshold"]
+        self.warn_threshold = adm["warn_threshold"]
+        self.hard_fail_codes = frozenset(adm["hard_fail_codes"])
+        self.required_modules = tuple(adm["require_modules"])
+        self.modules = tuple(
+            PlannedModule(m["module_id"], m["weight"], dict(m["params"]), frozenset(m["fail_on_codes"]))
+            for m in policy["modules"] if m["enabled"]
+        )
+        enabled = {m.module_id for m in self.modules}
+        self.disabled_required = [m for m in self.required_modules if m not in enabled]
+        self.policy_ref = {"policy_id": self.policy_id, "policy_version": self.policy_version,
+                           "score_model_version": SCORE_MODEL_VERSION}
+        bypass = policy.get("attestation_bypass")
+        self.bypass = AttestationBypass(bypass) if bypass and bypass["enabled"] else None
+        self.source = policy
+
+    def run(self, providers: Mapping[str, ModuleFn], attestation: Dict = None) -> AdmissibilityReport:
+        """
+        Run each enabled module that has a provider and score the results (adm_v1).
+        Stops at the first hard-fail code; a required module that is disabled or has no
+        provider fails the run before any module executes. A finding whose code is in its
+        module's fail_on_codes fails the run whatever the index, and a high or critical
+        finding holds the decision at warn or below.
+        attestation, an envelope accepted by self.bypass, skips every module (full_bypass)
+        or the modules its claims list (partial_bypass, each scored 100); a pass then
+        becomes pass_via_attestation.
+        """
+        covered = frozenset()
+        if attestation is not None:
+            covered = self.bypass.covered_modules(attestation)
+            if covered is None:
+                return self._attested(attestation)
+        missing = self.disabled_required + [m for m in self.required_modules if m not in self.disabled_required
+                                            and m not in providers and m not in covered]
+        if missing:
+            findings = [Finding(REQUIRED_MODULE_MISSING, "Required module produced no result", "critical", "policy",
+                                f"Policy {self.policy_id} requires module {m}", scope={"module_id": m})
+                        for m in missing]
+            return self._fail(findings, [], REQUIRED_MODULE_MISSING)
+
+        results: List[Tuple[PlannedModule, ModuleResult]] = []
+        findings: List[Finding] = []
+        for module in self.modules:
+            if module.module_id in covered:
+                results.append((module, ModuleResult(module.module_id, [], score=100.0)))
+                continue
+            provider = providers.get(module.module_id)
+            if provider is None:
+                continue
+            result = provider(module.params)
+            results.append((module, result))
+            findings.extend(result.findings)
+            for finding in result.findings:
+                if finding.code in self.hard_fail_codes:
+                    return self._fail(findings, results, finding.code)
+        report = self._score(findings, results)
+        if attestation is not None:
+            report.attestation = attestation
+            report.findings.append(self._attestation_finding(attestation, covered))
+            if report.decision == "pass":
+                report.decision = "pass_via_attestation"
+        return report
+
+    def _attested(self, attestation: Dict) -> AdmissibilityReport:
+        return AdmissibilityReport(
+            policy=self.policy_ref, decision="pass_via_attestation", admissibility_index=100.0,
+            score_breakdown={"base_score": 100.0, "module_contributions": [], "penalties": []},
+            findings=[self._attestation_finding(attestation, None)], blocking_findings=[],
+            modules_run=[], attestation=attestation,
+        )
+
+    @staticmethod
+    def _attestation_finding(attestation: Dict, covered: Optional[frozenset]) -> Finding:
+        scope = {"attestor_id": attestation["attestor_id"], "attestation_type": attestation["attestation_type"],
+                 "modules": "all" if covered is None else sorted(covered)}
+        return Finding(ATTESTATION_ACCEPTED, "Trusted attestation accepted", "info", "attestation",
+                       f"Design attested by {attestation['attestor_id']} ({attestation['attestation_type']}) "
+                       f"on {attestation['issued_at_utc']}", scope=scope)
+
+    def _score(self, findings: List[Finding], results: List[Tuple[PlannedModule, ModuleResult]]) -> AdmissibilityReport:
+        total_weight = sum(module.weight for module, _ in results)
+        if total_weight == 0:
+            base = 50.0
+        else:
+            base = round_half_up(sum(module.weight * result.score for module, result in results) / total_weight)
+        penalties = self._penalties(findings)
+        index = round_half_up(min(100.0, max(0.0, base + sum(p["amount"] for p in penalties))))
+        if any(f.code in module.fail_on_codes for module, result in results for f in result.findings):
+            decision = "fail"
+        elif index >= self.pass_threshold and not any(f.severity in BLOCKING_SEVERITIES for f in findings):
+            decision = "pass"
+        elif index >= self.warn_threshold:
+            decision = "warn"
+        else:
+            decision = "fail"
+        return AdmissibilityReport(
+            policy=self.policy_ref, decision=decision, admissibility_index=index,
+            score_breakdown=self._breakdown(base, results, total_weight, penalties),
+            findings=findings, blocking_findings=self._blocking(findings, results, decision),
+            modules_run=[module.module_id for module, _ in results],
+        )
+
+    def _fail(self, findings, results, code: str) -> AdmissibilityReport:
+        total_weight = sum(module.weight for module, _ in results)
+        return AdmissibilityReport(
+            policy=self.policy_ref, decision="fail", admissibility_index=0.0,
+            score_breakdown=self._breakdown(0.0, results, total_weight, []),
+            findings=findings, blocking_findings=self._blocking(findings, results, "fail"),
+            modules_run=[module.module_id for module, _ in results], hard_fail=code,
+        )
+
+    @staticmethod
+    def _breakdown(base: float, results, total_weight: float, penalties: List[Dict]) -> Dict:
+        return {
+            "base_score": base,
+            "module_contributions": [
+                {"module_id": module.module_id, "weight": module.weight, "score": result.score,
+                 "weighted_score": round_half_up(module.weight * result.score / total_weight) if total_weight else 0.0}
+                for module, result in results
+            ],
+            "penalties": penalties,
+        }
+
+    @staticmethod
+    def _penalties(findings: List[Finding]) -> List[Dict]:
+        penalties = []
+        for penalty_code, prefix, amounts in PENALTIES:
+            matched = [f for f in findings if f.code.startswith(prefix) and f.severity in amounts]
+            if not matched:
+                continue
+            worst = max(matched, key=lambda f: SEVERITIES.index(f.severity))
+            penalties.append({"penalty_code": penalty_code, "amount": amounts[worst.severity],
+                              "reason": f"{len(matched)} {prefix}* finding(s), most severe {worst.severity}"})
+        return penalties
+
+    def _blocking(self, findings: List[Finding], results, decision: str) -> List[Finding]:
+        if decision in ("pass", "pass_via_attestation"):
+            return []
+        fail_on = set(self.hard_fail_codes)
+        for module, _ in results:
+            fail_on |= module.fail_on_codes
+        return [f for f in findings if f.severity in BLOCKING_SEVERITIES or f.code in fail_on]
+
+_plans: Dict[Tuple[str, str], PolicyPlan] = {}
+_plans_lock = threading.Lock()
+
+def compile_policy(policy: Dict) -> PolicyPlan:
+    """
+    PolicyPlan for a policy document, cached by (policy_id, policy_version).
+    Schema validation and compilation happen on the first sight of a version only;
+    a published policy version is immutable, so later documents with the same id and
+    version reuse the cached plan.
+    """
+    try:
+        key = (policy["policy_id"], policy["policy_version"])
+    except (KeyError, TypeError):
+        raise PolicyError("Policy document missing policy_id or policy_version")
+    plan = _plans.get(key)
+    if plan is not None:
+        return plan
+    violations = default_registry().validate(policy, "audit_policy")
+    if violations:
+        raise PolicyError("; ".join(str(v) for v in violations))
+    plan = PolicyPlan(policy)
+    with _plans_lock:
+        return _plans.setdefault(key, plan)
+
+def clear_policy_cache():
+    with _plans_lock:
+        _plans.clear()
+
+def load_policies(policy_dir: str) -> Dict[str, Dict]:
+    """
+    Policy documents (*.json) in policy_dir by policy_id, each compiled up front so a
+    malformed policy fails at startup rather than on the first request that names it.
+    When several files share a policy_id the last one in filename order wins.
+    """
+    policies = {}
+    for filename in sorted(os.listdir(policy_dir)):
+        if not filename.endswith(".json"):
+            continue
+        with open(os.path.join(policy_dir, filename)) as f:
+            policy = json.load(f)
+        try:
+            compile_policy(policy)
+        except PolicyError as e:
+            raise PolicyError(f"{filename}: {e}")
+        policies[policy["policy_id"]] = policy
+    return policies
@@ -0,0 +1,82 @@
+"""
+Glassbox Bio Streaming Allotrope Reader
+Yields ASM measurement documents one at a time with bounded memory
+"""
+import copy
+import hashlib
+import json
+from typing import IO, Dict, Iterator
+import ijson
+
+MEASUREMENT_PREFIX = "measurement aggregate document.measurement document.item"
+
+class AllotropeStream:
+    """
+    Incremental parse of an Allotrope ASM JSON file.
+    Iterating yields each measurement document as soon as it is complete; everything else
+    (manifest, aggregate-level metadata) is collected into envelope, available once the
+    iteration finishes, with an empty "measurement document" list in place of the documents.
+    """
+    def __init__(self, f: IO):
+        self._events = ijson.parse(f, use_float=True)
+        self.envelope: Dict = None
+        self.manifest: str = None
+
+    def __iter__(self) -> Iterator[Dict]:
+        envelope = ijson.ObjectBuilder()
+        doc = None
+        for prefix, event, value in self._events:
+            if doc is not None:
+                doc.event(event, value)
+                if prefix == MEASUREMENT_PREFIX and event == "end_map":
+                    yield doc.value
+                    doc = None
+                continue
+            if prefix == MEASUREMENT_PREFIX and event == "start_map":
+                doc = ijson.ObjectBuilder()
+                doc.event(event, value)
+                continue
+            if prefix == "$asm.manifest" and event == "string":
+                self.manifest = value
+            envelope.event(event, value)
+        self.envelope = envelope.value
+
+class MetadataHasher:
+    """
+    SHA-256 over the canonical (sort_keys) JSON of each measurement document in order,
+    then the envelope. Only one document is serialized at a time, and the same digest
+    results whether the file was streamed or loaded whole. This replaced the SHA-256 of
+    the whole document's canonical JSON, so metadata_hash values recorded before the
+    streaming mode do not match those of the same file now.
+    """
+    def __init__(self):
+        self._measurements = hashlib.sha256()
+
+    def add_measurement(self, doc: Dict):
+        self._measurements.update(hashlib.sha256(_canonical(doc)).digest())
+
+    def hexdigest(self, envelope: Dict) -> str:
+        digest = hashlib.sha256(_canonical(envelope))
+        digest.update(self._measurements.digest())
+        return digest.hexdigest()
+
+def metadata_hash(data: Dict) -> str:
+    """MetadataHasher digest of an already-loaded Allotrope document"""
+    hasher = MetadataHasher()
+    for doc in measurement_documents(data):
+        hasher.add_measurement(doc)
+    return hasher.hexdigest(envelope_of(data))
+
+def measurement_documents(data: Dict):
+    return data.get("measurement aggregate document", {}).get("measurement document", [])
+
+def envelope_of(data: Dict) -> Dict:
+    """data with the measurement document list emptied, matching AllotropeStream.envelope"""
+    envelope = copy.copy(data)
+    aggregate = envelope.get("measurement aggregate document")
+    if isinstance(aggregate, dict) and "measurement document" in aggregate:
+        envelope["measurement aggregate document"] = dict(aggregate, **{"measurement document": []})
+    return envelope
+
+def _canonical(value) -> bytes:
+    return json.dumps(value, sort_keys=True).encode()
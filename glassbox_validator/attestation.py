@@ -0,0 +1,221 @@
+"""
+Glassbox Bio Attestation Bypass
+Indexed store of external audit attestations and the trusted-attestor check behind pass_via_attestation
+"""
+import base64
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+from glassbox_validator.seal import signing_payload
+
+FULL_BYPASS = "full_bypass"
+PARTIAL_BYPASS = "partial_bypass"
+_REQUIRED_FIELDS = ("attestor_id", "attestation_type", "attested_payload_sha256", "issued_at_utc", "signature")
+
+def _parse_utc(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+class AttestationStore:
+    """
+    Attestation envelopes indexed by attested_payload_sha256 (the canonical design_hash):
+    {attestor_id, attestation_type, attested_payload_sha256, issued_at_utc, expires_at_utc?,
+    claims?, signature}. The signature is ed25519 over every other field, canonicalized
+    like a seal. An optional JSON-lines file backs the store; it is stat()ed at most every
+    refresh_s (default: every lookup, a microsecond call) and re-read when it changes, so
+    validator workers see attestations appended by the API immediately. Malformed lines
+    are skipped with a message on stderr. Past max_entries the file is rewritten without
+    expired envelopes and then without the oldest ones.
+    """
+    def __init__(self, path: str = None, refresh_s: float = 0.0, max_entries: int = 10000):
+        self.path = path
+        self.refresh_s = refresh_s
+        self.max_entries = max_entries
+        self._generation = 0
+        self._by_payload: Dict[str, List[Dict]] = defaultdict(list)
+        self._signatures = set()  # stored envelopes, so a resubmitted one is not appended again
+        self._file_state = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+        self._reload()
+
+    def __getstate__(self):
+        # Validators holding a store are pickled into validate_many() worker processes
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "AttestationStore":
+        return cls(os.environ.get("GLASSBOX_ATTESTATIONS"),
+                   max_entries=int(os.environ.get("GLASSBOX_ATTESTATIONS_MAX", 10000)))
+
+    def __len__(self) -> int:
+        return sum(len(envelopes) for envelopes in self._by_payload.values())
+
+    @property
+    def generation(self) -> int:
+        """Bumped whenever the set of attestations changes (part of result cache keys)"""
+        self._refresh()
+        return self._generation
+
+    def add(self, envelope: Dict, now: datetime = None) -> bool:
+        """Store envelope; False (and no change) when the same signed envelope is already stored"""
+        missing = [f for f in _REQUIRED_FIELDS if f not in envelope]
+        if missing:
+            raise ValueError(f"Attestation missing {', '.join(missing)}")
+        with self._lock:
+            if envelope["signature"] in self._signatures:
+                return False
+            self._by_payload[envelope["attested_payload_sha256"].lower()].append(envelope)
+            self._signatures.add(envelope["signature"])
+            self._generation += 1
+            if len(self) > self.max_entries:
+                self._rotate(now or datetime.now(timezone.utc))
+            elif self.path:
+                with open(self.path, "a") as f:
+                    f.write(json.dumps(envelope, sort_keys=True) + "\n")
+            if self.path:
+                self._file_state = self._stat()
+        return True
+
+    def lookup(self, payload_sha256: str) -> List[Dict]:
+        self._refresh()
+        return self._by_payload.get(payload_sha256.lower(), [])
+
+    def _refresh(self):
+        if self.path and time.monotonic() - self._checked >= self.refresh_s:
+            self._reload()
+
+    def _stat(self) -> Tuple[int, int]:
+        st = os.stat(self.path)
+        return st.st_mtime_ns, st.st_size
+
+    def _reload(self):
+        with self._lock:
+            self._checked = time.monotonic()
+            if not self.path or not os.path.exists(self.path):
+                return
+            file_state = self._stat()
+            if file_state == self._file_state:
+                return
+            index = defaultdict(list)
+            with open(self.path) as f:
+                for number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        envelope = json.loads(line)
+                        index[envelope["attested_payload_sha256"].lower()].append(envelope)
+                    except (ValueError, KeyError, TypeError, AttributeError) as e:
+                        print(f"glassbox attestations: skipping malformed line {number} of {self.path}: {e}",
+                              file=sys.stderr)
+            self._by_payload = index
+            self._signatures = {e.get("signature") for envelopes in index.values() for e in envelopes}
+            self._file_state = file_state
+            self._generation += 1
+
+    def _rotate(self, now: datetime):
+        """Keep the newest max_entries unexpired envelopes; called with the lock held"""
+        def issued(envelope):
+            try:
+                return _parse_utc(envelope["issued_at_utc"])
+            except (KeyError, TypeError, ValueError):
+                return datetime.min.replace(tzinfo=timezone.utc)
+
+        def live(envelope):
+            try:
+                return not envelope.get("expires_at_utc") or _parse_utc(envelope["expires_at_utc"]) > now
+            except (TypeError, ValueError):
+                return False
+        kept = sorted((e for envelopes in self._by_payload.values() for e in envelopes if live(e)), key=issued)
+        kept = kept[-self.max_entries:]
+        index = defaultdict(list)
+        for envelope in kept:
+            index[envelope["attested_payload_sha256"].lower()].append(envelope)
+        self._by_payload = index
+        self._signatures = {e["signature"] for e in kept}
+        if self.path:
+            temporary = f"{self.path}.tmp"
+            with open(temporary, "w") as f:
+                f.writelines(json.dumps(envelope, sort_keys=True) + "\n" for envelope in kept)
+            os.replace(temporary, self.path)
+
+class AttestationBypass:
+    """
+    Compiled attestation_bypass section of an audit policy: trusted attestors by id with
+    their allowed types and parsed public keys. Signature checks that succeed are cached
+    for verified_ttl_s, so a repeat design costs an index lookup and a few comparisons.
+    """
+    def __init__(self, section: Dict, verified_ttl_s: float = 300.0):
+        self.mode = section["mode"]
+        self.max_age = timedelta(days=section["max_age_days"])
+        self.attestors: Dict[str, Tuple[frozenset, List[Ed25519PublicKey]]] = {
+            attestor["attestor_id"]: (
+                frozenset(attestor["allowed_types"]),
+                [Ed25519PublicKey.from_public_bytes(base64.b64decode(key)) for key in attestor["public_keys"]],
+            )
+            for attestor in section["trusted_attestors"]
+        }
+        self.verified_ttl_s = verified_ttl_s
+        self._verified: Dict[Tuple[str, bytes], float] = {}
+
+    def match(self, envelopes: Iterable[Dict], now: datetime = None) -> Optional[Dict]:
+        """First envelope from a trusted attestor that is of an allowed type, in date and correctly signed"""
+        now = now or datetime.now(timezone.utc)
+        for envelope in envelopes:
+            try:
+                if self._accepts(envelope, now):
+                    return envelope
+            except (KeyError, TypeError, ValueError):
+                continue
+        return None
+
+    def covered_modules(self, envelope: Dict) -> Optional[frozenset]:
+        """Modules the attestation vouches for: None means all of them (full_bypass)"""
+        if self.mode == FULL_BYPASS:
+            return None
+        return frozenset((envelope.get("claims") or {}).get("modules", ()))
+
+    def _accepts(self, envelope: Dict, now: datetime) -> bool:
+        trusted = self.attestors.get(envelope["attestor_id"])
+        if trusted is None:
+            return False
+        allowed_types, keys = trusted
+        if allowed_types and envelope["attestation_type"] not in allowed_types:
+            return False
+        issued = _parse_utc(envelope["issued_at_utc"])
+        if issued > now or now - issued > self.max_age:
+            return False
+        if envelope.get("expires_at_utc") and _parse_utc(envelope["expires_at_utc"]) <= now:
+            return False
+        return self._signed(envelope, keys)
+
+    def _signed(self, envelope: Dict, keys: List[Ed25519PublicKey]) -> bool:
+        payload = signing_payload(envelope)
+        cache_key = (envelope["signature"], payload)
+        expires = self._verified.get(cache_key)
+        if expires is not None and expires > time.monotonic():
+            return True
+        signature = base64.b64decode(envelope["signature"])
+        for key in keys:
+            try:
+                key.verify(signature, payload)
+            except InvalidSignature:
+                continue
+            now = time.monotonic()
+            if len(self._verified) >= 4096:
+                self._verified = {k: t for k, t in self._verified.items() if t > now}
+            self._verified[cache_key] = now + self.verified_ttl_s
+            return True
+        return False
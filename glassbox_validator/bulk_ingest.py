@@ -0,0 +1,179 @@
+"""
+Glassbox Bio Bulk Sequence Ingestion
+Validates multi-GB FASTA/GenBank libraries from a memory map, sharded across a process pool
+Usage: python -m glassbox_validator.bulk_ingest library.fasta -o results.ndjson [--workers N]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from glassbox_validator.admissibility import compile_policy
+from glassbox_validator.pre_execution import PreExecutionValidator, SequenceRecord, ValidationResult
+from glassbox_validator.sequence_io import iter_records, open_mapped, shard_offsets, sniff_sequence_format
+
+SHARD_BYTES = 8 * 1024 * 1024
+
+# Validator and policy held by each pool worker, built once by the initializer
+_validator: Optional[PreExecutionValidator] = None
+_policy: Optional[Dict] = None
+
+def _init_worker(cong: Optional[Dict], policy: Optional[Dict]):
+    global _validator, _policy
+    _validator = PreExecutionValidator(cong)
+    _policy = policy
+
+def _validate_shard(path: str, fmt: str, start: int, end: int,
+                    was_generated_by: Optional[str]) -> Tuple[List[Dict], int]:
+    """Map the file in the worker and validate one shard; only result rows travel back"""
+    with open_mapped(path) as data:
+        shard = data[start:end]
+    rows, bases = [], 0
+    for record in iter_records(shard, fmt, was_generated_by):
+        bases += len(record.elements)
+        rows.append(result_row(record, _validator.validate_sequence(record, _policy)))
+    return rows, bases
+
+def result_row(record: SequenceRecord, result: ValidationResult) -> Dict:
+    """Flat, fixed-column result for NDJSON/Parquet output"""
+    admissibility = result.admissibility or {}
+    return {
+        "id": record.display_id,
+        "length": len(record.elements),
+        "is_valid": result.is_valid,
+        "errors": result.errors,
+        "warnings": result.warnings,
+        "design_hash": result.design_hash,
+        "decision": admissibility.get("decision"),
+        "admissibility_index": admissibility.get("admissibility_index"),
+    }
+
+@dataclass
+class IngestStats:
+    records: int = 0
+    invalid: int = 0
+    bases: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def records_per_s(self) -> float:
+        return self.records / self.elapsed_s if self.elapsed_s else 0.0
+
+    @property
+    def bases_per_s(self) -> float:
+        return self.bases / self.elapsed_s if self.elapsed_s else 0.0
+
+    def to_dict(self) -> Dict:
+        return {"records": self.records, "invalid": self.invalid, "bases": self.bases,
+                "elapsed_s": round(self.elapsed_s, 3), "records_per_s": round(self.records_per_s, 1),
+                "bases_per_s": round(self.bases_per_s, 1)}
+
+class _NdjsonWriter:
+    def __init__(self, path: str):
+        self._out = sys.stdout if path == "-" else open(path, "w")
+
+    def write(self, rows: List[Dict]):
+        self._out.write("".join(json.dumps(row, separators=(",", ":")) + "\n" for row in rows))
+
+    def close(self):
+        if self._out is not sys.stdout:
+            self._out.close()
+
+class _ParquetWriter:
+    """One row group per shard; pyarrow is only needed when Parquet output is requested"""
+    def __init__(self, path: str):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise RuntimeError("Parquet output requires pyarrow (pip install pyarrow)") from e
+        self._pa = pyarrow
+        self._schema = pyarrow.schema([
+            ("id", pyarrow.string()), ("length", pyarrow.int64()), ("is_valid", pyarrow.bool_()),
+            ("errors", pyarrow.list_(pyarrow.string())), ("warnings", pyarrow.list_(pyarrow.string())),
+            ("design_hash", pyarrow.string()), ("decision", pyarrow.string()),
+            ("admissibility_index", pyarrow.float64()),
+        ])
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema, compression="zstd")
+
+    def write(self, rows: List[Dict]):
+        if rows:
+            self._writer.write_table(self._pa.Table.from_pylist(rows, schema=self._schema))
+
+    def close(self):
+        self._writer.close()
+
+def ingest(path: str, output: str = "-", fmt: str = None, max_workers: int = None,
+           shard_bytes: int = SHARD_BYTES, policy: Dict = None, was_generated_by: str = None,
+           cong: Dict = None) -> IngestStats:
+    """
+    Validate every record of a FASTA or GenBank file with the sequence-level checks.
+    The parent only locates shard boundaries in its memory map; workers map the file
+    themselves and parse and validate their shard, so neither the file nor the record
+    list is ever held in memory whole. At most 2 * max_workers shards are in flight and
+    results are written in file order, as NDJSON, or Parquet when output ends in .parquet.
+    Args:
+        fmt: "fasta" or "genbank"; sniffed from the file when omitted
+        policy: Optional audit_policy_v1 document applied to every record
+        was_generated_by: provenance recorded for every record
+    Raises:
+        PolicyError: policy does not conform to audit_policy_v1
+    """
+    if policy is not None:
+        compile_policy(policy)  # reject a bad policy before any worker starts
+    max_workers = max_workers or os.cpu_count() or 1
+    stats = IngestStats()
+    started = time.perf_counter()
+    writer = _ParquetWriter(output) if output.endswith(".parquet") else _NdjsonWriter(output)
+    try:
+        with open_mapped(path) as data, \
+                ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=(cong, policy)) as pool:
+            if not len(data):
+                return stats
+            fmt = fmt or sniff_sequence_format(data)
+            window = deque()
+            for start, end in shard_offsets(data, fmt, shard_bytes):
+                window.append(pool.submit(_validate_shard, path, fmt, start, end, was_generated_by))
+                if len(window) >= 2 * max_workers:
+                    _drain(window.popleft(), writer, stats)
+            while window:
+                _drain(window.popleft(), writer, stats)
+    finally:
+        writer.close()
+        stats.elapsed_s = time.perf_counter() - started
+    return stats
+
+def _drain(future, writer, stats: IngestStats):
+    rows, bases = future.result()
+    writer.write(rows)
+    stats.records += len(rows)
+    stats.invalid += sum(not row["is_valid"] for row in rows)
+    stats.bases += bases
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m glassbox_validator.bulk_ingest",
+                                     description="Validate a FASTA/GenBank library with the pre-execution sequence checks")
+    parser.add_argument("input", help="FASTA or GenBank file")
+    parser.add_argument("-o", "--output", default="-", help="NDJSON path, or .parquet (default: stdout)")
+    parser.add_argument("--format", choices=("fasta", "genbank"), help="input format (sniffed by default)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--shard-mb", type=float, default=SHARD_BYTES / 1024 / 1024, help="shard size in MiB")
+    parser.add_argument("--policy", help="audit_policy_v1 JSON file applied to every record")
+    parser.add_argument("--was-generated-by", help="provenance (generating model/activity URI) for every record")
+    args = parser.parse_args(argv)
+    policy = None
+    if args.policy:
+        with open(args.policy) as f:
+            policy = json.load(f)
+    stats = ingest(args.input, args.output, args.format, args.workers, int(args.shard_mb * 1024 * 1024),
+                   policy, args.was_generated_by)
+    print(f"{stats.records:,} records ({stats.invalid:,} invalid), {stats.bases:,} bases in {stats.elapsed_s:.1f}s: "
+          f"{stats.records_per_s:,.0f} records/s, {stats.bases_per_s:,.0f} bases/s", file=sys.stderr)
+    return 1 if stats.invalid else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""
+Glassbox Bio Canonical Design Digest
+Serializer-independent SHA-256 of an SBOL3 graph, with a Merkle digest per top-level object
+"""
+import hashlib
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Tuple
+
+DIGEST_VERSION = "1"  # bump when term normalization or the combination scheme changes
+
+@dataclass
+class DesignDigest:
+    """Digest of a whole design plus one digest per top-level object (Component, Sequence, ...)"""
+    design_hash: str
+    object_digests: Dict[str, str] = field(default_factory=dict)
+
+    def changed_objects(self, previous: "DesignDigest") -> Dict[str, str]:
+        """Objects added or modified since a previous digest of the same design"""
+        return {identity: digest for identity, digest in self.object_digests.items()
+                if previous.object_digests.get(identity) != digest}
+
+def _triple_digest(subject, predicate, obj) -> bytes:
+    """
+    N-Triples terms are canonical for URIs and typed/lang literals, independent of serializer.
+    Blank node labels are not; SBOL3 documents name every object, so none are expected.
+    """
+    line = f"{subject.n3()} {predicate.n3()} {obj.n3()} .\n"
+    return hashlib.sha256(line.encode("utf-8")).digest()
+
+def _owner(subject: str, subjects: frozenset, owners: Dict[str, str]) -> str:
+    """
+    Top-level object a subject belongs to.
+    SBOL3 child identities extend their parent's URI (.../part/SubComponent1), so the
+    outermost ancestor that is itself a subject owns the triples.
+    """
+    owner = owners.get(subject)
+    if owner is not None:
+        return owner
+    owner = subject
+    prefix = subject
+    while "/" in prefix:
+        prefix = prefix.rsplit("/", 1)[0]
+        if prefix in subjects:
+            owner = prefix
+    owners[subject] = owner
+    return owner
+
+def digest_triples(triples: Iterable[Tuple], subjects: Iterable = None) -> DesignDigest:
+    """
+    Fold (subject, predicate, object) rdflib terms into a DesignDigest.
+    Each triple is hashed as it is read and only its 32-byte digest is kept, grouped by
+    owning object; sorting the digests makes the result independent of triple order.
+    """
+    triples = list(triples) if subjects is None else triples
+    if subjects is None:
+        subjects = {s for s, _, _ in triples}
+    subjects = frozenset(str(s) for s in subjects)
+    owners: Dict[str, str] = {}
+    buckets: Dict[str, list] = {}
+    for s, p, o in triples:
+        buckets.setdefault(_owner(str(s), subjects, owners), []).append(_triple_digest(s, p, o))
+    object_digests = {}
+    for identity, digests in buckets.items():
+        digests.sort()
+        h = hashlib.sha256(f"{DIGEST_VERSION}:{identity}\n".encode("utf-8"))
+        for d in digests:
+            h.update(d)
+        object_digests[identity] = h.hexdigest()
+    root = hashlib.sha256(f"{DIGEST_VERSION}:design\n".encode("utf-8"))
+    for identity in sorted(object_digests):
+        root.update(f"{identity} {object_digests[identity]}\n".encode("utf-8"))
+    return DesignDigest(design_hash=root.hexdigest(), object_digests=object_digests)
+
+def digest_graph(graph) -> DesignDigest:
+    """DesignDigest of an rdflib Graph (e.g. the one a Document was parsed from)"""
+    return digest_triples(graph, subjects=set(graph.subjects()))
@@ -0,0 +1,224 @@
+"""
+Glassbox Bio Validation Executor
+Runs blocking validations off the event loop in a thread or process pool
+"""
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional
+from glassbox_validator.metrics import SlowCallProfiler
+from glassbox_validator.pre_execution import PreExecutionValidator, ValidationResult
+from glassbox_validator.post_execution import PostExecutionValidator, DataValidationResult
+
+class ExecutorSaturated(Exception):
+    """Raised when every worker is busy and the wait queue is full"""
+
+_INLINE = object()  # pool placeholder for mode="inline"
+
+# Per-worker validators, built once by the pool initializer (pre-warm)
+_pre_validator: Optional[PreExecutionValidator] = None
+_post_validator: Optional[PostExecutionValidator] = None
+_profiler: Optional[SlowCallProfiler] = None  # GLASSBOX_PROFILE_SLOW_MS: sample validations slower than this
+_init_lock = threading.Lock()
+
+def _init_worker(pre_cong: Optional[Dict], post_cong: Optional[Dict]):
+    global _pre_validator, _post_validator, _profiler
+    with _init_lock:
+        if _pre_validator is None:
+            _pre_validator = PreExecutionValidator(pre_cong)
+        if _post_validator is None:
+            _post_validator = PostExecutionValidator(post_cong)
+        if _profiler is None:
+            _profiler = SlowCallProfiler.from_env()
+
+def _warm() -> int:
+    return os.getpid()
+
+def _fingerprint() -> str:
+    return _pre_validator.config_fingerprint()
+
+def _profiled(name: str, fn, *args, **kwargs):
+    if _profiler is None:
+        return fn(*args, **kwargs)
+    with _profiler.watch(name):
+        return fn(*args, **kwargs)
+
+def _run_design(*args, **kwargs) -> ValidationResult:
+    return _profiled("design", _pre_validator.validate_design, *args, **kwargs)
+
+def _run_data(*args, **kwargs) -> DataValidationResult:
+    return _profiled("data", _post_validator.validate_data, *args, **kwargs)
+
+def _run_sequences(*args, **kwargs) -> List[ValidationResult]:
+    return _profiled("sequences", _pre_validator.validate_sequences, *args, **kwargs)
+
+class ValidationExecutor:
+    """
+    Bounded worker pool for the REST API.
+    mode="process" sidesteps the GIL for pySBOL3/rdflib parsing, mode="thread" keeps
+    everything in one process and mode="inline" runs on the caller (tests, debugging).
+    At most max_workers + max_queue validations are admitted; beyond that submit()
+    raises ExecutorSaturated so the API can answer 503 instead of queueing forever.
+    submit_queued() callers wait on the event loop in FIFO order and only take a slot
+    once one is free, so a waiter that is cancelled or times out holds nothing.
+    """
+    def __init__(self, mode: str = "thread", max_workers: int = None, max_queue: int = 32,
+                 timeout_s: float = 120.0, pre_cong: Dict = None, post_cong: Dict = None):
+        if mode not in ("thread", "process", "inline"):
+            raise ValueError(f"Unknown executor mode: {mode}")
+        self.mode = mode
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.timeout_s = timeout_s
+        self._initargs = (pre_cong, post_cong)
+        self._slots = threading.BoundedSemaphore(self.max_workers + max_queue)
+        self._in_flight = 0
+        self._count_lock = threading.Lock()  # guards _in_flight, slot release and _waiters
+        self._waiters: deque = deque()  # asyncio futures of submit_queued() callers, oldest first
+        self._pool: Optional[Executor] = None
+        self.design_fingerprint = ""
+
+    @classmethod
+    def from_env(cls, **kwargs) -> "ValidationExecutor":
+        return cls(
+            mode=os.environ.get("GLASSBOX_EXECUTOR", "thread"),
+            max_workers=int(os.environ.get("GLASSBOX_WORKERS", 0)) or None,
+            max_queue=int(os.environ.get("GLASSBOX_MAX_QUEUE", 32)),
+            timeout_s=float(os.environ.get("GLASSBOX_TIMEOUT_S", 120)),
+            **kwargs
+        )
+
+    def start(self):
+        """Create the pool and build validators in every worker before serving traffic"""
+        if self.mode == "inline":
+            _init_worker(*self._initargs)
+            self._pool = _INLINE
+            self.design_fingerprint = _fingerprint()
+            return
+        if self._pool is not None:
+            return
+        if self.mode == "process":
+            self._pool = ProcessPoolExecutor(self.max_workers, initializer=_init_worker, initargs=self._initargs)
+        else:
+            self._pool = ThreadPoolExecutor(self.max_workers, initializer=_init_worker, initargs=self._initargs,
+                                            thread_name_prefix="glassbox-validate")
+        for future in [self._pool.submit(_warm) for _ in range(self.max_workers)]:
+            future.result()
+        self.design_fingerprint = self._pool.submit(_fingerprint).result()
+
+    def shutdown(self):
+        if self._pool is not None and self._pool is not _INLINE:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+        self._pool = None
+
+    def stats(self) -> Dict:
+        return {
+            "mode": self.mode,
+            "workers": self.max_workers,
+            "in_flight": self._in_flight,
+            "queued": max(0, self._in_flight - self.max_workers),
+            "capacity": self.max_workers + self.max_queue,
+        }
+
+    async def validate_design(self, *args, **kwargs) -> ValidationResult:
+        return await self.submit(_run_design, *args, **kwargs)
+
+    async def validate_data(self, *args, **kwargs) -> DataValidationResult:
+        return await self.submit(_run_data, *args, **kwargs)
+
+    async def validate_design_queued(self, *args, **kwargs) -> ValidationResult:
+        """Like validate_design, but waits up to timeout_s for a free slot instead of failing fast"""
+        return await self.submit_queued(_run_design, *args, **kwargs)
+
+    async def validate_sequences_queued(self, *args, **kwargs) -> List[ValidationResult]:
+        """One chunk of SequenceRecords in a worker, waiting for a slot like validate_design_queued"""
+        return await self.submit_queued(_run_sequences, *args, **kwargs)
+
+    async def submit_queued(self, fn, *args, **kwargs):
+        """Like submit, but waits up to timeout_s for a free slot instead of raising ExecutorSaturated"""
+        if self._pool is None:
+            self.start()
+        loop = asyncio.get_running_loop()
+        deadline = time.monotonic() + self.timeout_s
+        first = True
+        while True:
+            with self._count_lock:
+                if self._slots.acquire(blocking=False):
+                    break
+                waiter = loop.create_future()
+                if first:
+                    self._waiters.append(waiter)
+                else:  # woken but beaten to the slot: keep its place at the head
+                    self._waiters.appendleft(waiter)
+            first = False
+            try:
+                await asyncio.wait_for(waiter, max(0.0, deadline - time.monotonic()))
+            except asyncio.TimeoutError:
+                self._forget(waiter)
+                raise ExecutorSaturated(f"No validation slot freed up within {self.timeout_s:.0f}s")
+            except asyncio.CancelledError:
+                self._forget(waiter)
+                raise
+        return await self._run_admitted(fn, *args, **kwargs)
+
+    async def submit(self, fn, *args, **kwargs):
+        """
+        Run fn in the pool and await it with the per-request timeout.
+        Raises ExecutorSaturated when full and asyncio.TimeoutError on timeout. A job that
+        already started keeps its slot until the worker finishes, so capacity stays honest.
+        """
+        if self._pool is None:
+            self.start()
+        if not self._slots.acquire(blocking=False):
+            raise ExecutorSaturated(f"Validation queue full ({self.max_workers + self.max_queue} in flight)")
+        return await self._run_admitted(fn, *args, **kwargs)
+
+    async def _run_admitted(self, fn, *args, **kwargs):
+        """Run fn once its slot has been acquired; the slot is released when fn finishes"""
+        with self._count_lock:
+            self._in_flight += 1
+        if self.mode == "inline":
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._release()
+        try:
+            future = self._pool.submit(fn, *args, **kwargs)
+        except Exception:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        # Timing out cancels the pool future, which drops it if it has not started yet
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout_s)
+
+    def _release(self):
+        with self._count_lock:
+            self._in_flight -= 1
+            self._slots.release()
+            waiter = self._waiters.popleft() if self._waiters else None
+        if waiter is not None:
+            waiter.get_loop().call_soon_threadsafe(self._wake, waiter)
+
+    def _wake(self, waiter: asyncio.Future):
+        """Tell the oldest live waiter a slot is free; a waiter that already gave up passes it on"""
+        if not waiter.done():
+            waiter.set_result(None)
+            return
+        with self._count_lock:
+            waiter = self._waiters.popleft() if self._waiters else None
+        if waiter is not None:
+            waiter.get_loop().call_soon_threadsafe(self._wake, waiter)
+
+    def _forget(self, waiter: asyncio.Future):
+        """Drop a waiter that gave up; if it was woken first, pass the wakeup on"""
+        with self._count_lock:
+            try:
+                self._waiters.remove(waiter)
+                return
+            except ValueError:
+                pass
+        if waiter.done() and not waiter.cancelled():
+            self._wake(waiter)
@@ -0,0 +1,272 @@
+"""
+Glassbox Bio HTTP Client
+Pooled, retrying HTTP client shared by the integration bridges (sync and asyncio)
+"""
+import asyncio
+import gzip
+import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from functools import partial
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Methods safe to resend after the server may already have acted on them
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+
+@dataclass
+class RetryPolicy:
+    """
+    attempts counts the first try. Delays use full jitter, uniform(0, backoff_s * 2**n)
+    capped at max_backoff_s, so bridges retrying together spread out; a Retry-After
+    header on 429/503 takes precedence.
+    """
+    attempts: int = 3
+    backoff_s: float = 0.2
+    max_backoff_s: float = 10.0
+    statuses: frozenset = RETRY_STATUSES
+
+    def delay(self, retry: int, response: Optional[requests.Response] = None) -> float:
+        if response is not None and response.headers.get("Retry-After"):
+            after = _retry_after(response.headers["Retry-After"])
+            if after is not None:
+                return min(after, self.max_backoff_s)
+        return random.uniform(0, min(self.max_backoff_s, self.backoff_s * 2 ** retry))
+
+def _retry_after(value: str) -> Optional[float]:
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+class EndpointStats:
+    """Latency of one "METHOD /path" endpoint: totals plus a window of recent samples for percentiles"""
+    def __init__(self, window: int = 1024):
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+        self._recent = deque(maxlen=window)
+
+    def record(self, elapsed_s: float, ok: bool, retries: int):
+        self.count += 1
+        self.errors += not ok
+        self.retries += retries
+        self.total_s += elapsed_s
+        self.max_s = max(self.max_s, elapsed_s)
+        self._recent.append(elapsed_s)
+
+    def to_dict(self) -> Dict:
+        recent = sorted(self._recent)
+        def pct(p):
+            return round(recent[min(len(recent) - 1, int(p * len(recent)))] * 1000, 3) if recent else None
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "retries": self.retries,
+            "mean_ms": round(self.total_s / self.count * 1000, 3) if self.count else None,
+            "p50_ms": pct(0.50),
+            "p95_ms": pct(0.95),
+            "max_ms": round(self.max_s * 1000, 3),
+        }
+
+def _never_sent(error: requests.RequestException) -> bool:
+    """True when the connection was never established, so the server cannot have seen the request"""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    cause = error.args[0] if error.args else None
+    return isinstance(cause, MaxRetryError) and isinstance(cause.reason, NewConnectionError)
+
+def _env_settings(kwargs: Dict) -> Dict:
+    """
+    GLASSBOX_CONNECT_TIMEOUT_S, GLASSBOX_READ_TIMEOUT_S, GLASSBOX_HTTP_ATTEMPTS; explicit kwargs win.
+    Bodies of 64 KiB or more are gzipped, since the Glassbox API inflates Content-Encoding: gzip.
+    """
+    kwargs.setdefault("connect_timeout_s", float(os.environ.get("GLASSBOX_CONNECT_TIMEOUT_S", 3.05)))
+    kwargs.setdefault("read_timeout_s", float(os.environ.get("GLASSBOX_READ_TIMEOUT_S", 60)))
+    kwargs.setdefault("retry", RetryPolicy(attempts=int(os.environ.get("GLASSBOX_HTTP_ATTEMPTS", 3))))
+    kwargs.setdefault("gzip_min_bytes", 64 * 1024)
+    return kwargs
+
+class GlassboxClient:
+    """
+    One requests.Session per client, so connections (and TLS sessions) to the Glassbox
+    API and the lab systems are reused across calls instead of reopened per request.
+    Every call gets a (connect, read) timeout. Idempotent requests (GET/HEAD/PUT/DELETE/
+    OPTIONS, or idempotent=True) are retried with jittered backoff on 429/5xx, connection
+    errors and timeouts; other requests (POST, PATCH) only when the connection could not be
+    established, so nothing the server accepted is ever sent twice. With gzip_min_bytes set, request
+    bodies at least that large (multipart SBOL uploads, Allotrope JSON) are sent gzip-compressed with
+    Content-Encoding: gzip; it is off by default because lab systems need not accept compressed bodies,
+    and from_env() turns it on for the Glassbox API.
+    Latency is recorded per endpoint; pass endpoint="/designs/{id}" for templated paths
+    so ids do not each get their own entry.
+    Args:
+        base_url: prefix for relative paths ("/validate/design"); absolute URLs pass through
+        pool_size: connections kept per host (size it to the caller's concurrency)
+        gzip_min_bytes: smallest body worth compressing; 0 (default) disables compression
+    """
+    def __init__(self, base_url: str = None, connect_timeout_s: float = 3.05, read_timeout_s: float = 60.0,
+                 retry: RetryPolicy = None, pool_size: int = 10, gzip_min_bytes: int = 0,
+                 headers: Dict[str, str] = None):
+        self.base_url = base_url.rstrip("/") if base_url else None
+        self.timeout: Tuple[float, float] = (connect_timeout_s, read_timeout_s)
+        self.retry = retry or RetryPolicy()
+        self.pool_size = pool_size
+        self.gzip_min_bytes = gzip_min_bytes
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(headers or {})
+        self._stats: Dict[str, EndpointStats] = {}
+        self._stats_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, base_url: str = None, **kwargs) -> "GlassboxClient":
+        return cls(base_url or os.environ.get("GLASSBOX_API_URL"), **_env_settings(kwargs))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> requests.Response:
+        return self.request("PATCH", url, **kwargs)
+
+    def request(self, method: str, url: str, endpoint: str = None, stream: bool = False,
+                idempotent: bool = None, attempts: int = None, **kwargs) -> requests.Response:
+        """
+        Send with retries. kwargs are those of requests (params, json, data, files, headers,
+        allow_redirects); timeout defaults to the client's. The body is prepared once, so uploaded files are
+        read once and replayed as bytes on retry; streamed (iterator) bodies are never retried.
+        Args:
+            idempotent: whether the request may be resent after the server received it;
+                defaults to True for idempotent methods and requests with an Idempotency-Key header
+            attempts: overrides the retry policy's attempts for this call (1 never retries)
+        """
+        timeout = kwargs.pop("timeout", self.timeout)
+        allow_redirects = kwargs.pop("allow_redirects", True)
+        prepared = self.session.prepare_request(requests.Request(method, self._url(url), **kwargs))
+        self._compress(prepared)
+        replayable = prepared.body is None or isinstance(prepared.body, (bytes, str))
+        if idempotent is None:
+            idempotent = prepared.method in IDEMPOTENT_METHODS or "Idempotency-Key" in prepared.headers
+        attempts = attempts or self.retry.attempts
+        settings = self.session.merge_environment_settings(prepared.url, {}, stream, None, None)
+        settings["allow_redirects"] = allow_redirects
+        endpoint = f"{method.upper()} {endpoint or urlsplit(prepared.url).path}"
+        started = time.perf_counter()
+        retries = 0
+        ok = False
+        try:
+            while True:
+                last = retries + 1 >= attempts or not replayable
+                try:
+                    response = self.session.send(prepared, timeout=timeout, **settings)
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    if last or not (idempotent or _never_sent(e)):
+                        raise
+                    time.sleep(self.retry.delay(retries))
+                    retries += 1
+                    continue
+                if response.status_code in self.retry.statuses and idempotent and not last:
+                    delay = self.retry.delay(retries, response)
+                    response.close()
+                    time.sleep(delay)
+                    retries += 1
+                    continue
+                ok = response.status_code < 400
+                return response
+        finally:
+            self._record(endpoint, time.perf_counter() - started, ok, retries)
+
+    def stats(self) -> Dict[str, Dict]:
+        with self._stats_lock:
+            return {endpoint: stats.to_dict() for endpoint, stats in self._stats.items()}
+
+    def _url(self, url: str) -> str:
+        if self.base_url and not urlsplit(url).scheme:
+            return f"{self.base_url}/{url.lstrip('/')}"
+        return url
+
+    def _compress(self, prepared: requests.PreparedRequest):
+        body = prepared.body
+        if (not self.gzip_min_bytes or not isinstance(body, (bytes, str)) or len(body) < self.gzip_min_bytes
+                or "Content-Encoding" in prepared.headers):
+            return
+        prepared.body = gzip.compress(body.encode() if isinstance(body, str) else body, compresslevel=5)
+        prepared.headers["Content-Encoding"] = "gzip"
+        prepared.headers["Content-Length"] = str(len(prepared.body))
+
+    def _record(self, endpoint: str, elapsed_s: float, ok: bool, retries: int):
+        with self._stats_lock:
+            stats = self._stats.get(endpoint)
+            if stats is None:
+                stats = self._stats[endpoint] = EndpointStats()
+            stats.record(elapsed_s, ok, retries)
+
+class AsyncGlassboxClient:
+    """
+    asyncio variant: the same pooled, retrying client driven from a dedicated thread pool
+    sized to its connection pool, so up to pool_size requests are in flight at once
+    without blocking the event loop. Timeouts, retries, gzip and stats are shared with
+    the sync client (exposed as .sync).
+    """
+    def __init__(self, base_url: str = None, **kwargs):
+        self.sync = GlassboxClient(base_url, **kwargs)
+        self._threads = ThreadPoolExecutor(max_workers=self.sync.pool_size, thread_name_prefix="glassbox-http")
+
+    @classmethod
+    def from_env(cls, base_url: str = None, **kwargs) -> "AsyncGlassboxClient":
+        return cls(base_url or os.environ.get("GLASSBOX_API_URL"), **_env_settings(kwargs))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._threads.shutdown(wait=False)
+        self.sync.close()
+
+    async def get(self, url: str, **kwargs) -> requests.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> requests.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs) -> requests.Response:
+        return await self.request("PATCH", url, **kwargs)
+
+    async def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._threads, partial(self.sync.request, method, url, **kwargs))
+
+    def stats(self) -> Dict[str, Dict]:
+        return self.sync.stats()
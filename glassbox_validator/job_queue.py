@@ -0,0 +1,174 @@
+"""
+Glassbox Bio Job Queue
+Persistent SQLite queue of long-running validations with priority lanes
+"""
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional, Sequence
+
+# Claimed in this order: small execution-gating checks never wait behind bulk retraining data
+LANES = ("gating", "bulk")
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS jobs ("
+    "job_id TEXT PRIMARY KEY, kind TEXT NOT NULL, lane TEXT NOT NULL, lane_rank INTEGER NOT NULL, "
+    "status TEXT NOT NULL, payload TEXT NOT NULL, result TEXT, error TEXT, webhook_url TEXT, "
+    "webhook_status TEXT, attempts INTEGER NOT NULL DEFAULT 0, created_at REAL NOT NULL, "
+    "started_at REAL, finished_at REAL, owner TEXT, lease_expires REAL)",
+    "CREATE INDEX IF NOT EXISTS jobs_queued ON jobs (status, lane_rank, created_at)",
+)
+# Columns added after the first release, for queue files created before them
+_ADDED_COLUMNS = (("owner", "TEXT"), ("lease_expires", "REAL"))
+
+class JobQueue:
+    """
+    Jobs move queued -> running -> done | failed. A claim is one IMMEDIATE transaction, so
+    several API processes can share a queue file (WAL mode) without running a job twice.
+    A claim records this queue's owner id and a lease of lease_s, which the running process
+    extends with heartbeat(); requeue_expired() puts back only jobs whose lease ran out,
+    i.e. whose process died, and complete()/fail() only land while the owner still holds it.
+    """
+    def __init__(self, db_path: str = ":memory:", lease_s: float = 60.0, owner: str = None):
+        self.lease_s = lease_s
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._db = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._db.execute(statement)
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(jobs)")}
+        for column, column_type in _ADDED_COLUMNS:
+            if column not in columns:
+                self._db.execute(f"ALTER TABLE jobs ADD COLUMN {column} {column_type}")
+        self._lock = threading.Lock()
+
+    def enqueue(self, kind: str, payload: Dict, lane: str = "gating", webhook_url: str = None) -> str:
+        if lane not in LANES:
+            raise ValueError(f"Unknown lane: {lane}")
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO jobs (job_id, kind, lane, lane_rank, status, payload, webhook_url, created_at) "
+                "VALUES (?, ?, ?, ?, 'queued', ?, ?, ?)",
+                (job_id, kind, lane, LANES.index(lane), json.dumps(payload), webhook_url, time.time())
+            )
+        return job_id
+
+    def claim(self, lanes: Sequence[str] = LANES) -> Optional[Dict]:
+        """Oldest queued job of the highest-priority lane among lanes, marked running"""
+        ranks = [LANES.index(lane) for lane in lanes]
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._db.execute(
+                    f"SELECT * FROM jobs WHERE status = 'queued' AND lane_rank IN ({','.join('?' * len(ranks))}) "
+                    "ORDER BY lane_rank, created_at LIMIT 1", ranks
+                ).fetchone()
+                if row is not None:
+                    now = time.time()
+                    self._db.execute(
+                        "UPDATE jobs SET status = 'running', started_at = ?, attempts = attempts + 1, owner = ?, "
+                        "lease_expires = ? WHERE job_id = ?", (now, self.owner, now + self.lease_s, row["job_id"])
+                    )
+                    row = self._db.execute("SELECT * FROM jobs WHERE job_id = ?", (row["job_id"],)).fetchone()
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+        return self._job(row) if row is not None else None
+
+    def heartbeat(self, job_id: str) -> bool:
+        """Extend this owner's lease on a running job; False once it has lost the job"""
+        with self._lock:
+            return self._db.execute(
+                "UPDATE jobs SET lease_expires = ? WHERE job_id = ? AND status = 'running' AND owner = ?",
+                (time.time() + self.lease_s, job_id, self.owner)
+            ).rowcount == 1
+
+    def complete(self, job_id: str, result: Dict) -> bool:
+        """Record the result; False when the lease expired and the job was requeued or reclaimed"""
+        return self._finish(job_id, "done", json.dumps(result), None)
+
+    def fail(self, job_id: str, error: str) -> bool:
+        return self._finish(job_id, "failed", None, error)
+
+    def set_webhook_status(self, job_id: str, status: str):
+        with self._lock:
+            self._db.execute("UPDATE jobs SET webhook_status = ? WHERE job_id = ?", (status, job_id))
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._db.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._job(row) if row is not None else None
+
+    def position(self, job_id: str) -> Optional[int]:
+        """Queued jobs that will be claimed before this one (None unless it is queued)"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT COUNT(*) FROM jobs j, jobs q WHERE q.job_id = ? AND q.status = 'queued' "
+                "AND j.status = 'queued' AND (j.lane_rank < q.lane_rank OR "
+                "(j.lane_rank = q.lane_rank AND j.created_at < q.created_at))", (job_id,)
+            ).fetchone()
+            queued = self._db.execute("SELECT 1 FROM jobs WHERE job_id = ? AND status = 'queued'", (job_id,)).fetchone()
+        return row[0] if queued else None
+
+    def requeue_expired(self) -> int:
+        """Queue again running jobs whose lease expired (their process stopped heartbeating)"""
+        with self._lock:
+            return self._db.execute(
+                "UPDATE jobs SET status = 'queued', started_at = NULL, owner = NULL, lease_expires = NULL "
+                "WHERE status = 'running' AND (lease_expires IS NULL OR lease_expires < ?)", (time.time(),)
+            ).rowcount
+
+    def release(self) -> int:
+        """Queue again the jobs this owner is running, e.g. at shutdown"""
+        with self._lock:
+            return self._db.execute(
+                "UPDATE jobs SET status = 'queued', started_at = NULL, owner = NULL, lease_expires = NULL "
+                "WHERE status = 'running' AND owner = ?", (self.owner,)
+            ).rowcount
+
+    def purge(self, older_than_s: float) -> int:
+        """Delete finished jobs older than older_than_s"""
+        with self._lock:
+            return self._db.execute("DELETE FROM jobs WHERE status IN ('done', 'failed') AND finished_at < ?",
+                                    (time.time() - older_than_s,)).rowcount
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            rows = self._db.execute("SELECT lane, status, COUNT(*) FROM jobs GROUP BY lane, status").fetchall()
+        counts: Dict[str, Dict[str, int]] = {lane: {} for lane in LANES}
+        for lane, status, count in rows:
+            counts[lane][status] = count
+        return counts
+
+    def close(self):
+        self._db.close()
+
+    def _finish(self, job_id: str, status: str, result: Optional[str], error: Optional[str]) -> bool:
+        with self._lock:
+            return self._db.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?, lease_expires = NULL "
+                "WHERE job_id = ? AND status = 'running' AND owner = ?",
+                (status, result, error, time.time(), job_id, self.owner)
+            ).rowcount == 1
+
+    @staticmethod
+    def _job(row: sqlite3.Row) -> Dict:
+        job = dict(row)
+        del job["lane_rank"]
+        job["payload"] = json.loads(job["payload"])
+        job["result"] = json.loads(job["result"]) if job["result"] is not None else None
+        return job
+
+def lanes_for_runner(index: int, runners: int, reserved_gating: int = 1) -> List[str]:
+    """The first reserved_gating runners take gating jobs only (when there are others to do bulk)"""
+    if index < reserved_gating and runners > reserved_gating:
+        return ["gating"]
+    return list(LANES)
@@ -0,0 +1,199 @@
+"""
+Glassbox Bio Lineage Store
+Embedded SQLite record of validated designs, datasets and the provenance edges linking them
+"""
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS validations ("
+    "id INTEGER PRIMARY KEY, kind TEXT NOT NULL, subject_hash TEXT NOT NULL, is_valid INTEGER NOT NULL, "
+    "quality_score REAL, error_count INTEGER NOT NULL, warning_count INTEGER NOT NULL, recorded_at REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS validations_subject ON validations (subject_hash)",
+    "CREATE INDEX IF NOT EXISTS validations_time ON validations (recorded_at, kind)",
+    "CREATE TABLE IF NOT EXISTS design_components ("
+    "design_hash TEXT NOT NULL, component_uri TEXT NOT NULL, component_digest TEXT NOT NULL, "
+    "PRIMARY KEY (design_hash, component_uri)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS design_components_uri ON design_components (component_uri)",
+    "CREATE INDEX IF NOT EXISTS design_components_digest ON design_components (component_digest)",
+    "CREATE TABLE IF NOT EXISTS datasets ("
+    "metadata_hash TEXT PRIMARY KEY, is_valid INTEGER NOT NULL, quality_score REAL, "
+    "provenance_valid INTEGER NOT NULL, recorded_at REAL NOT NULL) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS datasets_time ON datasets (recorded_at)",
+    "CREATE TABLE IF NOT EXISTS dataset_devices ("
+    "device_id TEXT NOT NULL, metadata_hash TEXT NOT NULL, PRIMARY KEY (device_id, metadata_hash)) WITHOUT ROWID",
+    "CREATE TABLE IF NOT EXISTS provenance_edges ("
+    "target_uri TEXT NOT NULL, relation TEXT NOT NULL, source_uri TEXT NOT NULL, metadata_hash TEXT NOT NULL, "
+    "target_digest TEXT, PRIMARY KEY (target_uri, relation, source_uri, metadata_hash)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS provenance_edges_dataset ON provenance_edges (metadata_hash)",
+)
+# Columns added after the first release, for lineage files created before them
+_ADDED_COLUMNS = (("provenance_edges", "target_digest", "TEXT"),)
+
+# A built edge matches a design Component by URI and, when the provenance document carried
+# the Component, by its digest, so a dataset is linked only to design revisions it was built from
+_BUILT_FROM = ("e.target_uri = c.component_uri AND e.relation = 'built' "
+               "AND (e.target_digest IS NULL OR e.target_digest = c.component_digest)")
+
+_INSERTS = {
+    "validations": "INSERT INTO validations (kind, subject_hash, is_valid, quality_score, error_count, "
+                   "warning_count, recorded_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+    "design_components": "INSERT OR REPLACE INTO design_components VALUES (?, ?, ?)",
+    "datasets": "INSERT OR REPLACE INTO datasets VALUES (?, ?, ?, ?, ?)",
+    "dataset_devices": "INSERT OR IGNORE INTO dataset_devices VALUES (?, ?)",
+    "provenance_edges": "INSERT OR IGNORE INTO provenance_edges "
+                        "(target_uri, relation, source_uri, metadata_hash, target_digest) VALUES (?, ?, ?, ?, ?)",
+}
+
+class LineageStore:
+    """
+    Design-to-data lineage in SQLite (WAL mode, so readers never block the writer).
+    Writes are buffered and flushed in one transaction per batch_size rows, or by a timer at
+    most flush_interval_s after the first buffered row, and on close(); queries flush first so
+    callers always read their own writes. Every query is an index lookup:
+    design hash -> component URIs and digests -> sbol:built edges -> datasets.
+    """
+    def __init__(self, db_path: str = ":memory:", batch_size: int = 256, flush_interval_s: float = 1.0):
+        self.batch_size = batch_size
+        self.flush_interval_s = flush_interval_s
+        self._db = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._db.execute(statement)
+        for table, column, column_type in _ADDED_COLUMNS:
+            if column not in {row[1] for row in self._db.execute(f"PRAGMA table_info({table})")}:
+                self._db.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+        self._lock = threading.Lock()
+        self._pending: Dict[str, List[Tuple]] = {table: [] for table in _INSERTS}
+        self._pending_rows = 0
+        self._timer: Optional[threading.Timer] = None
+        self._closed = False
+
+    def record_design(self, design_hash: str, is_valid: bool, error_count: int, warning_count: int,
+                      component_digests: Dict[str, str] = None, recorded_at: float = None):
+        recorded_at = recorded_at or time.time()
+        self._queue("validations", [("design", design_hash, int(is_valid), None, error_count, warning_count, recorded_at)])
+        self._queue("design_components", [(design_hash, uri, digest) for uri, digest in (component_digests or {}).items()])
+
+    def record_data(self, metadata_hash: str, is_valid: bool, quality_score: float, provenance_valid: bool,
+                    error_count: int, warning_count: int, device_ids: Iterable[str] = (),
+                    provenance_edges: Iterable[Tuple[str, str, str]] = (), recorded_at: float = None,
+                    object_digests: Dict[str, str] = None):
+        """object_digests: digests of the provenance document's objects, pinning built Components"""
+        recorded_at = recorded_at or time.time()
+        object_digests = object_digests or {}
+        self._queue("validations", [("data", metadata_hash, int(is_valid), quality_score, error_count,
+                                     warning_count, recorded_at)])
+        self._queue("datasets", [(metadata_hash, int(is_valid), quality_score, int(provenance_valid), recorded_at)])
+        self._queue("dataset_devices", [(device_id, metadata_hash) for device_id in device_ids])
+        self._queue("provenance_edges", [(target, relation, source, metadata_hash, object_digests.get(target))
+                                         for source, relation, target in provenance_edges])
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        with self._lock:
+            self._flush_locked()
+            self._closed = True
+        self._db.close()
+
+    def datasets_for_design(self, design_hash: str, limit: int = 1000) -> List[Dict]:
+        """Datasets whose provenance has an Implementation sbol:built from a Component of this design"""
+        return self._query(
+            "SELECT DISTINCT d.* FROM design_components c "
+            f"JOIN provenance_edges e ON {_BUILT_FROM} "
+            "JOIN datasets d ON d.metadata_hash = e.metadata_hash "
+            "WHERE c.design_hash = ? ORDER BY d.recorded_at DESC LIMIT ?", (design_hash, limit)
+        )
+
+    def designs_for_dataset(self, metadata_hash: str, limit: int = 1000) -> List[Dict]:
+        """Designs containing a Component this dataset's Implementations were built from"""
+        return self._query(
+            "SELECT DISTINCT c.design_hash, c.component_uri, c.component_digest FROM provenance_edges e "
+            f"JOIN design_components c ON {_BUILT_FROM} "
+            "WHERE e.metadata_hash = ? LIMIT ?", (metadata_hash, limit)
+        )
+
+    def datasets_for_device(self, device_id: str, limit: int = 1000) -> List[Dict]:
+        return self._query(
+            "SELECT d.* FROM dataset_devices v JOIN datasets d ON d.metadata_hash = v.metadata_hash "
+            "WHERE v.device_id = ? ORDER BY d.recorded_at DESC LIMIT ?", (device_id, limit)
+        )
+
+    def validations_between(self, start: float, end: float, kind: Optional[str] = None,
+                            limit: int = 1000) -> List[Dict]:
+        """Validation events recorded in [start, end), epoch seconds, optionally of one kind"""
+        if kind is None:
+            return self._query(
+                "SELECT * FROM validations WHERE recorded_at >= ? AND recorded_at < ? "
+                "ORDER BY recorded_at LIMIT ?", (start, end, limit)
+            )
+        return self._query(
+            "SELECT * FROM validations WHERE recorded_at >= ? AND recorded_at < ? AND kind = ? "
+            "ORDER BY recorded_at LIMIT ?", (start, end, kind, limit)
+        )
+
+    def validations_for(self, subject_hash: str, limit: int = 1000) -> List[Dict]:
+        """Every recorded validation of one design or dataset hash, newest first"""
+        return self._query(
+            "SELECT * FROM validations WHERE subject_hash = ? ORDER BY recorded_at DESC LIMIT ?", (subject_hash, limit)
+        )
+
+    def design_components(self, design_hash: str) -> Dict[str, str]:
+        return {row["component_uri"]: row["component_digest"] for row in self._query(
+            "SELECT component_uri, component_digest FROM design_components WHERE design_hash = ?", (design_hash,)
+        )}
+
+    def stats(self) -> Dict:
+        with self._lock:
+            self._flush_locked()
+            counts = {table: self._db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] for table in _INSERTS}
+        return counts
+
+    def _queue(self, table: str, rows: List[Tuple]):
+        if not rows:
+            return
+        with self._lock:
+            self._pending[table].extend(rows)
+            self._pending_rows += len(rows)
+            if self._pending_rows >= self.batch_size or self.flush_interval_s <= 0:
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval_s, self._flush_on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _flush_on_timer(self):
+        with self._lock:
+            if not self._closed:
+                self._flush_locked()
+
+    def _flush_locked(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending_rows:
+            return
+        self._db.execute("BEGIN")
+        try:
+            for table, rows in self._pending.items():
+                if rows:
+                    self._db.executemany(_INSERTS[table], rows)
+            self._db.execute("COMMIT")
+        except Exception:
+            self._db.execute("ROLLBACK")
+            raise
+        finally:
+            self._pending = {table: [] for table in _INSERTS}
+            self._pending_rows = 0
+
+    def _query(self, sql: str, params: Tuple) -> List[Dict]:
+        with self._lock:
+            self._flush_locked()
+            return [dict(row) for row in self._db.execute(sql, params).fetchall()]
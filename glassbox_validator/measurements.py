@@ -0,0 +1,75 @@
+"""
+Glassbox Bio Measurement Table
+Flattens Allotrope point-detection values into columnar arrays for grouped statistics
+"""
+from dataclasses import dataclass
+from typing import Dict, List
+import numpy as np
+
+@dataclass
+class MeasurementTable:
+    """
+    One row per fluorescence point-detection value, across every measurement document.
+    measurement holds the index of the owning document; per-document columns are indexed by it.
+    """
+    value: np.ndarray           # float64
+    measurement: np.ndarray     # int64 index into measurement_ids
+    well: np.ndarray            # object: sample identifier
+    unit: np.ndarray            # object: value unit
+    measurement_ids: List       # "measurement identier" of each measurement document
+    detection_counts: np.ndarray  # point-detection documents per measurement, with or without a value
+
+    @property
+    def n_measurements(self) -> int:
+        return len(self.measurement_ids)
+
+    def group_stats(self) -> Dict[str, np.ndarray]:
+        """
+        Per-measurement count, mean, population std and CV%, computed for all groups at once.
+        Two passes (mean, then squared deviations) keep the std accurate for large RFU values.
+        """
+        n = self.n_measurements
+        count = np.bincount(self.measurement, minlength=n)
+        safe = np.maximum(count, 1)
+        mean = np.bincount(self.measurement, weights=self.value, minlength=n) / safe
+        deviation = self.value - mean[self.measurement]
+        std = np.sqrt(np.bincount(self.measurement, weights=deviation * deviation, minlength=n) / safe)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cv = np.where(mean > 0, std / mean * 100, 0.0)
+            z = np.abs(deviation / std[self.measurement])
+        return {"count": count, "mean": mean, "std": std, "cv": cv, "z": z}
+
+    def outlier_counts(self, z: np.ndarray, threshold: float) -> np.ndarray:
+        """Values beyond threshold sigma per measurement (groups with zero spread count none)"""
+        outliers = np.nan_to_num(z, nan=0.0, posinf=0.0) > threshold
+        return np.bincount(self.measurement[outliers], minlength=self.n_measurements)
+
+def extract_measurements(data: Dict) -> MeasurementTable:
+    """Single walk over the nested Allotrope dicts; everything after this is array arithmetic"""
+    return extract_measurement_docs(data.get("measurement aggregate document", {}).get("measurement document", []))
+
+def extract_measurement_docs(measurement_docs: List[Dict]) -> MeasurementTable:
+    """MeasurementTable for a list of measurement documents (e.g. one streamed document)"""
+    values, owners, wells, units, ids, detection_counts = [], [], [], [], [], []
+    for index, doc in enumerate(measurement_docs):
+        ids.append(doc.get("measurement identier"))
+        uor_docs = doc.get("uorescence point detection aggregate document", {}).get(
+            "uorescence point detection document", [])
+        detection_counts.append(len(uor_docs))
+        for fd in uor_docs:
+            reading = fd.get("uorescence", {})
+            value = reading.get("value")
+            if value is None:
+                continue
+            values.append(value)
+            owners.append(index)
+            wells.append(fd.get("sample document", {}).get("sample identier"))
+            units.append(reading.get("unit"))
+    return MeasurementTable(
+        value=np.asarray(values, dtype=np.float64),
+        measurement=np.asarray(owners, dtype=np.int64),
+        well=np.asarray(wells, dtype=object),
+        unit=np.asarray(units, dtype=object),
+        measurement_ids=ids,
+        detection_counts=np.asarray(detection_counts, dtype=np.int64),
+    )
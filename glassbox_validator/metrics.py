@@ -0,0 +1,239 @@
+"""
+Glassbox Bio Metrics
+Per-stage validation timings, a minimal Prometheus registry and an opt-in slow-call sampling profiler
+"""
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter as _Tally
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Request and validation latencies span sub-millisecond cache hits to multi-minute datasets
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+                   300.0)
+
+class StageTimings(dict):
+    """
+    Seconds spent in each stage of one validation (stage -> seconds, summed over
+    repeated entries such as one check per component). Stages timed inside another
+    stage are excluded from it, so the values add up to the time measured. A plain
+    dict to callers, so it travels back from process-pool workers with the result.
+    """
+    _nested = 0.0  # seconds recorded so far by time()/wrap(), for exclusive timing
+
+    def add(self, stage: str, seconds: float):
+        self[stage] = self.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def time(self, stage: str):
+        start, nested = time.perf_counter(), self._nested
+        try:
+            yield
+        finally:
+            self._record(stage, time.perf_counter() - start, nested)
+
+    def wrap(self, stage: str, fn: Callable) -> Callable:
+        """fn with its run time added to stage on every call"""
+        def timed(*args, **kwargs):
+            start, nested = time.perf_counter(), self._nested
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._record(stage, time.perf_counter() - start, nested)
+        return timed
+
+    def _record(self, stage: str, elapsed: float, nested_before: float):
+        self.add(stage, elapsed - (self._nested - nested_before))
+        self._nested = nested_before + elapsed
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _labels(names: Sequence[str], values: Sequence, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+class Counter:
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        self.name, self.help, self.labels = name, help_text, tuple(labels)
+        self._values: Dict[Tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount: float = 1.0):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        lines.extend(f"{self.name}{_labels(self.labels, key)} {_number(value)}" for key, value in items)
+        return lines
+
+class Histogram:
+    """Fixed-bucket histogram; observe() is a bisect and three additions under a lock"""
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name, self.help, self.labels = name, help_text, tuple(labels)
+        self.buckets = tuple(buckets)
+        self._series: Dict[Tuple, list] = {}  # labels -> [per-bucket counts (+Inf last), sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((key, ([*s[0]], s[1], s[2])) for key, s in self._series.items())
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = f'le="{_number(bound)}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labels, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labels, key)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labels, key)} {count}")
+        return lines
+
+class Callback:
+    """
+    Gauge or counter read at scrape time from state the service already keeps
+    (executor in-flight counts, cache hit counters), so nothing is updated per request.
+    fn returns a number, or {label values tuple: number}.
+    """
+    def __init__(self, name: str, help_text: str, fn: Callable, labels: Sequence[str] = (), kind: str = "gauge"):
+        self.name, self.help, self.fn, self.labels, self.kind = name, help_text, fn, tuple(labels), kind
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        values = self.fn()
+        if not isinstance(values, dict):
+            values = {(): values}
+        lines.extend(f"{self.name}{_labels(self.labels, key)} {_number(value)}" for key, value in sorted(values.items()))
+        return lines
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: List = []
+
+    def counter(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labels))
+
+    def histogram(self, name: str, help_text: str, labels: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help_text, labels, buckets))
+
+    def callback(self, name: str, help_text: str, fn: Callable, labels: Sequence[str] = (),
+                 kind: str = "gauge") -> Callback:
+        return self._register(Callback(name, help_text, fn, labels, kind))
+
+    def render(self) -> str:
+        """Prometheus text exposition format 0.0.4"""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+def _collapse(frame) -> str:
+    """Stack as root;...;leaf of "function (file:line)" frames, the flamegraph.pl input format"""
+    frames = []
+    while frame is not None:
+        code = frame.f_code
+        frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+        frame = frame.f_back
+    return ";".join(reversed(frames))
+
+class SlowCallProfiler:
+    """
+    Opt-in sampling profiler for slow validations. watch() registers the calling thread;
+    a single watchdog thread starts sampling its stack every interval_s only once the call
+    has run for threshold_s, so calls that finish in time cost a dict insert and delete.
+    When a sampled call finishes, hook(name, elapsed_s, stacks) receives the collapsed
+    stacks (stack -> sample count); the default hook writes them to directory.
+    """
+    def __init__(self, threshold_s: float, interval_s: float = 0.005, directory: str = None,
+                 hook: Callable[[str, float, Dict[str, int]], None] = None):
+        self.threshold_s = threshold_s
+        self.interval_s = interval_s
+        self.directory = directory
+        self.hook = hook or self._write
+        self._active: Dict[int, list] = {}  # thread id -> [name, started, stacks]
+        self._wakeup = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_env(cls) -> Optional["SlowCallProfiler"]:
+        """GLASSBOX_PROFILE_SLOW_MS enables profiling; stacks go to GLASSBOX_PROFILE_DIR"""
+        threshold_ms = float(os.environ.get("GLASSBOX_PROFILE_SLOW_MS", 0))
+        if threshold_ms <= 0:
+            return None
+        return cls(threshold_ms / 1000, float(os.environ.get("GLASSBOX_PROFILE_INTERVAL_MS", 5)) / 1000,
+                   os.environ.get("GLASSBOX_PROFILE_DIR") or os.path.join(os.getcwd(), "glassbox-profiles"))
+
+    @contextmanager
+    def watch(self, name: str):
+        entry = [name, time.monotonic(), _Tally()]
+        ident = threading.get_ident()
+        with self._wakeup:
+            self._active[ident] = entry
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._sample, name="glassbox-profiler", daemon=True)
+                self._thread.start()
+            self._wakeup.notify()
+        try:
+            yield
+        finally:
+            with self._wakeup:
+                del self._active[ident]
+            if entry[2]:
+                try:
+                    self.hook(name, time.monotonic() - entry[1], dict(entry[2]))
+                except Exception as e:  # profiling must never fail the call it observed
+                    print(f"glassbox profiler: stacks for slow {name} call not saved: {e}", file=sys.stderr)
+
+    def _sample(self):
+        while True:
+            with self._wakeup:
+                while not self._active:
+                    self._wakeup.wait()
+                now = time.monotonic()
+                due = [(ident, entry) for ident, entry in self._active.items() if now - entry[1] >= self.threshold_s]
+                if not due:
+                    next_due = min(entry[1] for entry in self._active.values()) + self.threshold_s
+                    self._wakeup.wait(next_due - now)
+                    continue
+            frames = sys._current_frames()
+            for ident, entry in due:
+                frame = frames.get(ident)
+                if frame is not None:
+                    entry[2][_collapse(frame)] += 1
+            time.sleep(self.interval_s)
+
+    def _write(self, name: str, elapsed_s: float, stacks: Dict[str, int]):
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S.%f")
+        path = os.path.join(self.directory, f"{name}-{stamp}-{elapsed_s * 1000:.0f}ms.collapsed")
+        with open(path, "w") as f:
+            f.writelines(f"{stack} {count}\n" for stack, count in sorted(stacks.items()))
@@ -0,0 +1,122 @@
+"""
+Glassbox Bio Multi-Pattern Matcher
+Aho-Corasick automaton for forbidden-pattern and biohazard screening
+"""
+import pickle
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+_COMPLEMENT = str.maketrans("ACGTUNRYKMSWBDHVacgtunrykmswbdhv", "TGCAANYRMKSWVHDBtgcaanyrmkswvhdb")
+
+@dataclass(frozen=True)
+class PatternHit:
+    """Single pattern occurrence, with offsets on the forward strand"""
+    pattern_id: str
+    start: int
+    end: int
+    strand: str  # "+" or "-"
+
+def reverse_complement(sequence: str) -> str:
+    return sequence.translate(_COMPLEMENT)[::-1]
+
+class PatternMatcher:
+    """
+    Prebuilt Aho-Corasick automaton over a fixed pattern set.
+    Reverse complements are compiled into the same automaton, so one pass over
+    the forward strand reports hits on both strands. Instances pickle as flat
+    arrays, so worker processes can load them without rebuilding.
+    """
+    def __init__(self, patterns: Dict[str, str]):
+        self.patterns = {pid: p.upper() for pid, p in patterns.items() if p}
+        alphabet = sorted({c for p in self.patterns.values() for c in p + reverse_complement(p)})
+        self._width = len(alphabet) + 1  # last column: character outside every pattern
+        table = bytearray([len(alphabet)]) * 256
+        for code, char in enumerate(alphabet):
+            table[ord(char)] = code
+            table[ord(char.lower())] = code
+        self._table = bytes(table)
+        self._build(alphabet)
+
+    def _build(self, alphabet: List[str]):
+        codes = {c: i for i, c in enumerate(alphabet)}
+        width = self._width
+        goto = [{}]
+        terminal: Dict[int, List[int]] = {}
+        self._entries: List[Tuple[str, int, str]] = []
+        for pid, pattern in self.patterns.items():
+            strands = [("+", pattern)]
+            rc = reverse_complement(pattern)
+            if rc != pattern:
+                strands.append(("-", rc))
+            for strand, text in strands:
+                state = 0
+                for char in text:
+                    nxt = goto[state].get(codes[char])
+                    if nxt is None:
+                        nxt = len(goto)
+                        goto[state][codes[char]] = nxt
+                        goto.append({})
+                    state = nxt
+                terminal.setdefault(state, []).append(len(self._entries))
+                self._entries.append((pid, len(text), strand))
+        # Breadth-first pass turns the trie into a full DFA with merged outputs
+        delta = array("i", [0]) * (len(goto) * width)
+        fail = [0] * len(goto)
+        outputs: Dict[int, Tuple[int, ...]] = {}
+        queue = deque()
+        for code, child in goto[0].items():
+            delta[code] = child
+            queue.append(child)
+        while queue:
+            state = queue.popleft()
+            inherited = outputs.get(fail[state], ())
+            if state in terminal or inherited:
+                outputs[state] = tuple(terminal.get(state, ())) + inherited
+            base = state * width
+            fail_base = fail[state] * width
+            for code in range(width - 1):
+                child = goto[state].get(code)
+                if child is None:
+                    delta[base + code] = delta[fail_base + code]
+                else:
+                    fail[child] = delta[fail_base + code]
+                    delta[base + code] = child
+                    queue.append(child)
+        self._delta = delta
+        self._outputs = outputs
+
+    @property
+    def state_count(self) -> int:
+        return len(self._delta) // self._width
+
+    def scan(self, sequence) -> List[PatternHit]:
+        """Single pass over a str/bytes sequence; returns every hit on either strand"""
+        if not self._outputs:
+            return []
+        data = sequence.encode("ascii", "replace") if isinstance(sequence, str) else bytes(sequence)
+        delta, outputs, entries, width = self._delta, self._outputs, self._entries, self._width
+        hits = []
+        state = 0
+        for pos, code in enumerate(data.translate(self._table)):
+            state = delta[state * width + code]
+            if state in outputs:
+                for entry in outputs[state]:
+                    pid, length, strand = entries[entry]
+                    hits.append(PatternHit(pid, pos + 1 - length, pos + 1, strand))
+        return hits
+
+    def matched_ids(self, sequence) -> List[str]:
+        """Distinct pattern IDs found in the sequence, in first-hit order"""
+        return list(dict.fromkeys(hit.pattern_id for hit in self.scan(sequence)))
+
+    def to_bytes(self) -> bytes:
+        return pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> "PatternMatcher":
+        matcher = pickle.loads(payload)
+        if not isinstance(matcher, cls):
+            raise TypeError(f"Serialized object is not a {cls.__name__}")
+        return matcher
@@ -2,15 +2,21 @@
 Glassbox Bio Post-Execution Validator
 Validates wet-lab data before feeding back to AI models
 """
+import io
 import json
-import jsonschema
-from typing import Dict, List, Tuple
-from dataclasses import dataclass
+import os
+import time
+from typing import IO, Dict, List, Set, Tuple, Union
+from dataclasses import dataclass, field
 import pandas as pd
 import numpy as np
 from datetime import datetime
-import pySBOL3
-import hashlib
+from glassbox_validator.allotrope_stream import AllotropeStream, MetadataHasher, measurement_documents, metadata_hash
+from glassbox_validator.measurements import MeasurementTable, extract_measurement_docs, extract_measurements
+from glassbox_validator.metrics import StageTimings
+from glassbox_validator.provenance_index import ProvenanceIndex
+from glassbox_validator.schema_registry import GENERIC_ALLOTROPE, SchemaViolation, default_registry
+from glassbox_validator.sbol_io import SbolSource, load_document_with_digest
 
 @dataclass
 class DataValidationResult:
@@ -21,6 +27,10 @@ class DataValidationResult:
     quality_score: float  # 0.0-1.0
     provenance_chain_valid: bool
     metadata_hash: str
+    device_ids: List[str] = field(default_factory=list)
+    provenance_edges: List[Tuple[str, str, str]] = field(default_factory=list)  # (source, relation, target)
+    object_digests: Dict[str, str] = field(default_factory=dict)  # provenance top-level object -> digest
+    timings: Dict[str, float] = field(default_factory=dict)  # stage -> seconds (json_load, schema, outliers, ...)
 
 class PostExecutionValidator:
     """
@@ -29,6 +39,7 @@ class PostExecutionValidator:
     """
     def __init__(self, cong: Dict = None):
         self.cong = cong or self._default_cong()
+        self.schema_registry = default_registry()
         self.allotrope_schema = self._load_allotrope_schema()
 
     def _default_cong(self) -> Dict:
@@ -38,69 +49,181 @@ class PostExecutionValidator:
             "outlier_threshold_sigma": 3.0,
             "require_device_metadata": True,
             "require_timestamp": True,
+            "cross_check_samples": False, # every Allotrope sample identifier must name an Implementation
+            "stream_min_bytes": 64 * 1024 * 1024, # Allotrope files at least this large are parsed incrementally
         }
 
     def _load_allotrope_schema(self) -> Dict:
-        """Load Allotrope ASM JSON schema for validation"""
-        return {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "type": "object",
-            "required": ["$asm.manifest", "measurement aggregate document"],
-            "properties": {
-                "$asm.manifest": {"type": "string"},
-                "measurement aggregate document": {"type": "object"}
-            }
-        }
+        """Generic Allotrope ASM envelope schema, used when $asm.manifest has no registered schema"""
+        return self.schema_registry.schema(GENERIC_ALLOTROPE)
 
-    def validate_data(self, allotrope_le: str, sbol_provenance_le: str) -> DataValidationResult:
+    def validate_data(self, allotrope_le: Union[str, bytes, IO, Dict],
+                      sbol_provenance_le: SbolSource) -> DataValidationResult:
         """
         Main validation entrypoint for wet-lab data.
         Args:
-            allotrope_le: Path to Allotrope ADF/ASM JSON
-            sbol_provenance_le: Path to SBOL3 RDF with experiment metadata
+            allotrope_le: Path to Allotrope ADF/ASM JSON, its raw bytes, a file-like
+                object, or the already-parsed dict
+            sbol_provenance_le: Path to SBOL3 RDF with experiment metadata, its raw
+                bytes, a file-like object, or an already-parsed pySBOL3.Document
         Returns:
             DataValidationResult with quality score and findings
         """
+        if self._should_stream(allotrope_le):
+            return self.validate_data_stream(allotrope_le, sbol_provenance_le)
         errors = []
         warnings = []
+        timings = StageTimings()
         try:
-            with open(allotrope_le) as f:
-                allotrope_data = json.load(f)
-            errors.extend(self._validate_allotrope_schema(allotrope_data))
-            errors.extend(self._check_metadata_completeness(allotrope_data))
-            warnings.extend(self._detect_outliers(allotrope_data))
-            warnings.extend(self._check_instrument_qc(allotrope_data))
-            sbol_doc = pySBOL3.Document()
-            sbol_doc.read(sbol_provenance_le)
-            provenance_valid, prov_errors = self._validate_provenance_chain(sbol_doc, allotrope_data)
+            with timings.time("json_load"):
+                allotrope_data = self._load_allotrope(allotrope_le)
+            with timings.time("schema"):
+                errors.extend(self._validate_allotrope_schema(allotrope_data))
+                errors.extend(self._check_metadata_completeness(allotrope_data))
+            with timings.time("outliers"):
+                measurements = extract_measurements(allotrope_data)
+                stats = measurements.group_stats()
+                warnings.extend(self._detect_outliers(measurements, stats))
+                warnings.extend(self._check_instrument_qc(allotrope_data))
+            with timings.time("provenance_chain"):
+                sbol_doc, sbol_digest = load_document_with_digest(sbol_provenance_le)
+                index = ProvenanceIndex.from_document(sbol_doc)
+                provenance_valid, prov_errors = self._validate_provenance_chain(index, set(measurements.well))
             errors.extend(prov_errors)
-            quality_score = self._compute_quality_score(allotrope_data, len(errors), len(warnings))
-            metadata_hash = self._compute_metadata_hash(allotrope_data)
+            with timings.time("scoring"):
+                quality_score = self._compute_quality_score(self._count_noisy(stats), len(errors), len(warnings))
+                metadata_hash = self._compute_metadata_hash(allotrope_data)
             return DataValidationResult(
                 is_valid=len(errors) == 0,
                 errors=errors,
                 warnings=warnings,
                 quality_score=quality_score,
                 provenance_chain_valid=provenance_valid,
-                metadata_hash=metadata_hash
+                metadata_hash=metadata_hash,
+                device_ids=self._device_ids(measurement_documents(allotrope_data)),
+                provenance_edges=index.edge_list(),
+                object_digests=sbol_digest.object_digests,
+                timings=timings
             )
         except Exception as e:
-            return DataValidationResult(
-                is_valid=False,
-                errors=[f"Parse error: {str(e)}"],
-                warnings=[],
-                quality_score=0.0,
-                provenance_chain_valid=False,
-                metadata_hash=""
-            )
+            return self._parse_error(e)
 
-    def _validate_allotrope_schema(self, data: Dict) -> List[str]:
-        errors = []
+    def validate_data_stream(self, allotrope_le: Union[str, bytes, IO],
+                             sbol_provenance_le: SbolSource) -> DataValidationResult:
+        """
+        Streaming variant of validate_data for Allotrope files too large to load whole.
+        Each measurement document is checked and hashed as soon as it is parsed, so memory
+        is bounded by the largest single measurement document rather than the file size.
+        Findings, score and metadata_hash match validate_data on the same file.
+        """
         try:
-            jsonschema.validate(instance=data, schema=self.allotrope_schema)
-        except jsonschema.exceptions.ValidationError as e:
-            errors.append(f"Allotrope schema violation: {e.message}")
-        return errors
+            if isinstance(allotrope_le, str):
+                with open(allotrope_le, "rb") as f:
+                    return self._validate_stream(f, sbol_provenance_le)
+            if isinstance(allotrope_le, (bytes, bytearray, memoryview)):
+                allotrope_le = io.BytesIO(allotrope_le)
+            return self._validate_stream(allotrope_le, sbol_provenance_le)
+        except Exception as e:
+            return self._parse_error(e)
+
+    def _validate_stream(self, f: IO, sbol_provenance_le: SbolSource) -> DataValidationResult:
+        stream = AllotropeStream(f)
+        hasher = MetadataHasher()
+        violations, metadata_errors, outlier_warnings, qc_warnings = [], [], [], []
+        measurement_count = noisy = 0
+        sample_ids, device_ids = set(), {}
+        timings = StageTimings()
+        clock = time.perf_counter
+        started = clock()
+        for i, doc in enumerate(stream):
+            parsed = clock()
+            hasher.add_measurement(doc)
+            # $asm.manifest normally precedes the measurements; documents seen before it get the generic check
+            schema_name = self.schema_registry.for_manifest(stream.manifest)
+            violations.extend(self.schema_registry.validate_measurement(doc, schema_name, i))
+            metadata_errors.extend(self._check_measurement_metadata(i, doc))
+            checked = clock()
+            measurements = extract_measurement_docs([doc])
+            stats = measurements.group_stats()
+            outlier_warnings.extend(self._detect_outliers(measurements, stats))
+            qc_warnings.extend(self._check_measurement_qc(doc))
+            noisy += self._count_noisy(stats)
+            # json_load is the time the stream spent producing this document
+            timings.add("json_load", parsed - started)
+            timings.add("schema", checked - parsed)
+            started = clock()
+            timings.add("outliers", started - checked)
+            if self.cong.get("cross_check_samples"):
+                sample_ids.update(measurements.well)
+            device_ids.update(dict.fromkeys(self._device_ids([doc])))
+            measurement_count += 1
+        timings.add("json_load", clock() - started)
+        envelope = stream.envelope
+        with timings.time("schema"):
+            violations.extend(self.schema_registry.validate(envelope, self._schema_name(envelope)))
+        errors = self._format_schema_violations(violations)
+        if not measurement_count:
+            errors.append("No measurement documents found in Allotrope data")
+        errors.extend(metadata_errors)
+        warnings = outlier_warnings + qc_warnings
+        with timings.time("provenance_chain"):
+            sbol_doc, sbol_digest = load_document_with_digest(sbol_provenance_le)
+            index = ProvenanceIndex.from_document(sbol_doc)
+            provenance_valid, prov_errors = self._validate_provenance_chain(index, sample_ids)
+        errors.extend(prov_errors)
+        with timings.time("scoring"):
+            quality_score = self._compute_quality_score(noisy, len(errors), len(warnings))
+            metadata_hash = hasher.hexdigest(envelope)
+        return DataValidationResult(
+            is_valid=len(errors) == 0,
+            errors=errors,
+            warnings=warnings,
+            quality_score=quality_score,
+            provenance_chain_valid=provenance_valid,
+            metadata_hash=metadata_hash,
+            device_ids=list(device_ids),
+            provenance_edges=index.edge_list(),
+            object_digests=sbol_digest.object_digests,
+            timings=timings
+        )
+
+    def _should_stream(self, source) -> bool:
+        """Route large on-disk Allotrope files to the streaming parser"""
+        threshold = self.cong.get("stream_min_bytes")
+        return (threshold is not None and isinstance(source, str)
+                and os.path.getsize(source) >= threshold)
+
+    def _parse_error(self, e: Exception) -> DataValidationResult:
+        return DataValidationResult(
+            is_valid=False,
+            errors=[f"Parse error: {str(e)}"],
+            warnings=[],
+            quality_score=0.0,
+            provenance_chain_valid=False,
+            metadata_hash=""
+        )
+
+    def _load_allotrope(self, source) -> Dict:
+        """Parse Allotrope JSON from a path, bytes, file-like object or dict"""
+        if isinstance(source, dict):
+            return source
+        if isinstance(source, str):
+            with open(source) as f:
+                return json.load(f)
+        if hasattr(source, "read"):
+            return json.load(source)
+        return json.loads(bytes(source))
+
+    def _validate_allotrope_schema(self, data: Dict) -> List[str]:
+        """Every violation of the schema registered for data's $asm.manifest, in one pass"""
+        return self._format_schema_violations(self.schema_registry.validate(data, self._schema_name(data)))
+
+    def _schema_name(self, data) -> str:
+        manifest = data.get("$asm.manifest") if isinstance(data, dict) else None
+        return self.schema_registry.for_manifest(manifest)
+
+    def _format_schema_violations(self, violations: List[SchemaViolation]) -> List[str]:
+        return [f"Allotrope schema violation: {v}" for v in sorted(violations, key=lambda v: v.sort_key)]
 
     def _check_metadata_completeness(self, data: Dict) -> List[str]:
         errors = []
@@ -109,102 +232,82 @@ class PostExecutionValidator:
             errors.append("No measurement documents found in Allotrope data")
             return errors
         for i, doc in enumerate(measurement_doc):
-            if self.cong["require_timestamp"] and not doc.get("measurement time"):
-                errors.append(f"Measurement {i}: Missing timestamp")
-            if self.cong["require_device_metadata"]:
-                device = doc.get("device system document", {})
-                if not device.get("device identier"):
-                    errors.append(f"Measurement {i}: Missing device identier")
-                if not device.get("rmware version"):
-                    errors.append(f"Measurement {i}: Missing rmware version")
+            errors.extend(self._check_measurement_metadata(i, doc))
         return errors
 
-    def _detect_outliers(self, data: Dict) -> List[str]:
+    def _check_measurement_metadata(self, i: int, doc: Dict) -> List[str]:
+        errors = []
+        if self.cong["require_timestamp"] and not doc.get("measurement time"):
+            errors.append(f"Measurement {i}: Missing timestamp")
+        if self.cong["require_device_metadata"]:
+            device = doc.get("device system document", {})
+            if not device.get("device identier"):
+                errors.append(f"Measurement {i}: Missing device identier")
+            if not device.get("rmware version"):
+                errors.append(f"Measurement {i}: Missing rmware version")
+        return errors
+
+    def _detect_outliers(self, table: MeasurementTable, stats: Dict[str, np.ndarray]) -> List[str]:
+        """Replicate count, z-score outliers and CV for every measurement from one grouped pass"""
         warnings = []
-        measurement_docs = data.get("measurement aggregate document", {}).get("measurement document", [])
-        for doc in measurement_docs:
-            uor_agg = doc.get("uorescence point detection aggregate document", {})
-            uor_docs = uor_agg.get("uorescence point detection document", [])
-            if not uor_docs:
+        sigma = self.cong["outlier_threshold_sigma"]
+        outliers = table.outlier_counts(stats["z"], sigma)
+        for i, measurement_id in enumerate(table.measurement_ids):
+            if not table.detection_counts[i]:
                 continue
-            values = [fd.get("uorescence", {}).get("value") for fd in uor_docs if fd.get("uorescence", {}).get("value") is not None]
-            if len(values) < self.cong["min_sample_count"]:
+            count = stats["count"][i]
+            if count < self.cong["min_sample_count"]:
                 warnings.append(
-                    f"Measurement {doc.get('measurement identier')}: Insufficient replicates ({len(values)} < {self.cong['min_sample_count']})"
+                    f"Measurement {measurement_id}: Insufficient replicates ({count} < {self.cong['min_sample_count']})"
                 )
                 continue
-            values_array = np.array(values)
-            mean = np.mean(values_array)
-            std = np.std(values_array)
-            if std > 0:
-                z_scores = np.abs((values_array - mean) / std)
-                outlier_indices = np.where(z_scores > self.cong["outlier_threshold_sigma"])[0]
-                if len(outlier_indices) > 0:
-                    warnings.append(
-                        f"Measurement {doc.get('measurement identier')}: Detected {len(outlier_indices)} outliers (>{self.cong['outlier_threshold_sigma']}σ)"
-                    )
-            if mean > 0:
-                cv = (std / mean) * 100
-                if cv > self.cong["max_cv_percent"]:
-                    warnings.append(
-                        f"Measurement {doc.get('measurement identier')}: High variability (CV={cv:.1f}% > {self.cong['max_cv_percent']}%)"
-                    )
+            if outliers[i] > 0:
+                warnings.append(
+                    f"Measurement {measurement_id}: Detected {outliers[i]} outliers (>{sigma}σ)"
+                )
+            if stats["mean"][i] > 0 and stats["cv"][i] > self.cong["max_cv_percent"]:
+                warnings.append(
+                    f"Measurement {measurement_id}: High variability (CV={stats['cv'][i]:.1f}% > {self.cong['max_cv_percent']}%)"
+                )
         return warnings
 
     def _check_instrument_qc(self, data: Dict) -> List[str]:
         warnings = []
         measurement_docs = data.get("measurement aggregate document", {}).get("measurement document", [])
         for doc in measurement_docs:
-            qc_status = doc.get("quality control aggregate document", {})
-            if qc_status.get("instrument_warning"):
-                warnings.append(
-                    f"Measurement {doc.get('measurement identier')}: Instrument QC warning detected"
-                )
+            warnings.extend(self._check_measurement_qc(doc))
         return warnings
 
-    def _validate_provenance_chain(self, sbol_doc: pySBOL3.Document, allotrope_data: Dict) -> Tuple[bool, List[str]]:
-        errors = []
-        exp_data = sbol_doc.find_all(pySBOL3.ExperimentalData)
-        if not exp_data:
-            errors.append("SBOL document missing ExperimentalData objects")
-            return False, errors
-        for data_obj in exp_data:
-            if not hasattr(data_obj, 'generated_by') or not data_obj.generated_by:
-                errors.append(
-                    f"ExperimentalData {data_obj.display_id} missing prov:wasGeneratedBy link to Experiment"
-                )
-                continue
-            experiment = data_obj.generated_by[0].lookup()
-            if not hasattr(experiment, 'members') or not experiment.members:
-                errors.append(
-                    f"Experiment {experiment.display_id} missing sbol:member link to Implementation"
-                )
-                continue
-            implementation = experiment.members[0].lookup()
-            if not hasattr(implementation, 'built') or not implementation.built:
-                errors.append(
-                    f"Implementation {implementation.display_id} missing sbol:built link to original Component design"
-                )
+    def _device_ids(self, measurement_docs: List[Dict]) -> List[str]:
+        """Distinct instrument identifiers, in first-seen order"""
+        ids = (doc.get("device system document", {}).get("device identier") for doc in measurement_docs)
+        return list(dict.fromkeys(device_id for device_id in ids if device_id))
+
+    def _check_measurement_qc(self, doc: Dict) -> List[str]:
+        qc_status = doc.get("quality control aggregate document", {})
+        if qc_status.get("instrument_warning"):
+            return [f"Measurement {doc.get('measurement identier')}: Instrument QC warning detected"]
+        return []
+
+    def _validate_provenance_chain(self, index: ProvenanceIndex, sample_ids: Set[str] = None) -> Tuple[bool, List[str]]:
+        """Validate every provenance chain, dangling reference and cycle from the prebuilt index"""
+        errors = index.validate_chains()
+        if self.cong.get("cross_check_samples") and sample_ids:
+            for sample_id in index.unmatched_samples(sample_ids):
+                errors.append(f"Allotrope sample {sample_id} matches no Implementation in SBOL provenance")
         provenance_valid = len(errors) == 0
         return provenance_valid, errors
 
-    def _compute_quality_score(self, data: Dict, error_count: int, warning_count: int) -> float:
+    def _count_noisy(self, stats: Dict[str, np.ndarray]) -> int:
+        """Measurements with at least 3 values and CV above 15%"""
+        return int(np.count_nonzero((stats["count"] >= 3) & (stats["cv"] > 15)))
+
+    def _compute_quality_score(self, noisy_measurements: int, error_count: int, warning_count: int) -> float:
         score = 1.0
         score -= error_count * 0.3
         score -= warning_count * 0.05
-        measurement_docs = data.get("measurement aggregate document", {}).get("measurement document", [])
-        for doc in measurement_docs:
-            uor_agg = doc.get("uorescence point detection aggregate document", {})
-            uor_docs = uor_agg.get("uorescence point detection document", [])
-            values = [fd.get("uorescence", {}).get("value") for fd in uor_docs if fd.get("uorescence", {}).get("value") is not None]
-            if len(values) >= 3:
-                mean = np.mean(values)
-                std = np.std(values)
-                cv = (std / mean) * 100 if mean > 0 else 0
-                if cv > 15:
-                    score -= 0.1
+        score -= noisy_measurements * 0.1
         return max(0.0, min(1.0, score))
 
     def _compute_metadata_hash(self, data: Dict) -> str:
-        metadata_str = json.dumps(data, sort_keys=True)
-        return hashlib.sha256(metadata_str.encode()).hexdigest()
+        return metadata_hash(data)
@@ -3,11 +3,25 @@ Glassbox Bio Pre-Execution Validator
 Validates AI-generated SBOL3 designs before robotic execution
 """
 import pySBOL3
+import functools
 import re
-from typing import Dict, List
-from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+from dataclasses import asdict, dataclass, field
 import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from glassbox_validator.admissibility import (
+    BLOCKING_SEVERITIES, Finding, ModuleFn, ModuleResult, compile_policy
+)
+from glassbox_validator.attestation import AttestationStore
+from glassbox_validator.metrics import StageTimings
+from glassbox_validator.pattern_matcher import PatternMatcher
+from glassbox_validator.result_cache import ResultCache, config_fingerprint
+from glassbox_validator.design_digest import DesignDigest, digest_graph
+from glassbox_validator.sbol_io import SbolSource, load_document_with_digest
+from glassbox_validator.sequence_analysis import SequenceProfile, analyze_sequence, find_repeats
 
 @dataclass
 class ValidationResult:
@@ -17,6 +31,106 @@ class ValidationResult:
     warnings: List[str]
     design_hash: str
     validation_timestamp: str
+    component_digests: Dict[str, str] = field(default_factory=dict)  # top-level identity -> digest
+    admissibility: Optional[Dict] = None  # adm_v1 decision and score breakdown when run under a policy
+    reevaluated_components: Optional[List[str]] = None  # incremental mode: components analysed this run
+    timings: Dict[str, float] = field(default_factory=dict)  # stage -> seconds (parse, hash, each module, ...)
+
+@dataclass
+class SequenceRecord:
+    """
+    A raw sequence validated without SBOL: the one-Component, one-Sequence design the
+    bridges used to build (display_id for the Component, sequence_display_id for its
+    Sequence, prov:wasGeneratedBy as a plain field). Findings match that SBOL design.
+    """
+    display_id: str
+    elements: Union[str, bytes]
+    sequence_display_id: Optional[str] = None  # defaults to seq_<display_id>
+    was_generated_by: Optional[str] = None  # generating activity/model URI (AI provenance)
+    namespace: str = "https://glassbox.bio/sequences"
+
+    def __post_init__(self):
+        if self.sequence_display_id is None:
+            self.sequence_display_id = f"seq_{self.display_id}"
+
+    @property
+    def identity(self) -> str:
+        return f"{self.namespace}/{self.display_id}"
+
+    @property
+    def sequence_identity(self) -> str:
+        return f"{self.namespace}/{self.sequence_display_id}"
+
+    def provenance(self) -> Optional[str]:
+        return self.was_generated_by
+
+    def digest(self) -> str:
+        """SHA-256 over the record's fields; the design_hash of validate_sequence()"""
+        elements = self.elements.decode("ascii", "replace") if isinstance(self.elements, bytes) else self.elements
+        return hashlib.sha256(json.dumps(
+            [self.identity, self.sequence_identity, elements, self.was_generated_by]
+        ).encode()).hexdigest()
+
+# Policy-free validation runs every module with default params; complexity findings are warnings
+_LEGACY_MODULES = ("sequence_integrity", "biosafety", "synthesis_complexity", "provenance")
+_WARNING_MODULES = frozenset(("synthesis_complexity",))
+
+# Findings of one module for one component, given the module's policy params
+ComponentCheck = Callable[[pySBOL3.Component, Dict], List[Finding]]
+
+class _ComponentReuse:
+    """
+    Incremental-validation bookkeeping for one run. Findings are cached under the
+    component's content (its digest plus its Sequences' digests), the module and its
+    params; they are reused only when that content is unchanged from previous_digests.
+    Every component actually analysed is listed in reevaluated. New findings are held
+    until flush(), which writes them to the cache in one transaction per validation.
+    """
+    def __init__(self, cache: ResultCache, fingerprint: str, digest: DesignDigest,
+                 previous_digests: Optional[Dict[str, str]]):
+        self.cache = cache
+        self.fingerprint = fingerprint
+        self.digests = digest.object_digests
+        self.previous = previous_digests
+        self.reevaluated: List[str] = []
+        self._seen = set()
+        self._pending: Dict[str, List[Dict]] = {}
+
+    def findings(self, module_id: str, component: pySBOL3.Component, params: Dict,
+                 check: ComponentCheck) -> List[Finding]:
+        uris = [str(component.identity)] + [str(seq) for seq in component.sequences or []]
+        digests = [self.digests.get(uri) for uri in uris]
+        key = None
+        if None not in digests:
+            key = hashlib.sha256("\n".join(
+                [self.fingerprint, module_id, json.dumps(params, sort_keys=True)] + digests
+            ).encode()).hexdigest()
+            unchanged = self.previous is not None and all(
+                self.previous.get(uri) == d for uri, d in zip(uris, digests))
+            cached = self.cache.get(key) if unchanged else None
+            if cached is not None:
+                return [Finding(**f) for f in cached]
+        findings = check(component, params)
+        if uris[0] not in self._seen:
+            self._seen.add(uris[0])
+            self.reevaluated.append(uris[0])
+        if key is not None:
+            self._pending[key] = [asdict(f) for f in findings]
+        return findings
+
+    def flush(self):
+        self.cache.put_many(self._pending)
+        self._pending = {}
+
+# Validator copy held by each validate_many() worker process
+_batch_validator = None
+
+def _init_batch_worker(validator: "PreExecutionValidator"):
+    global _batch_validator
+    _batch_validator = validator
+
+def _validate_in_worker(source, policy: Dict = None) -> ValidationResult:
+    return _batch_validator._validate_source(source, policy)
 
 class PreExecutionValidator:
     """
@@ -26,6 +140,28 @@ class PreExecutionValidator:
     def __init__(self, cong: Dict = None):
         self.cong = cong or self._default_cong()
         self.biohazard_patterns = self._load_biohazard_db()
+        self.biohazard_db_version = hashlib.sha256("\n".join(self.biohazard_patterns).encode()).hexdigest()
+        self.pattern_matcher = self._build_pattern_matcher()
+        self.attestations = AttestationStore.from_env()  # GLASSBOX_ATTESTATIONS
+        self._component_cache = None
+
+    def __getstate__(self):
+        # Each worker process opens its own component cache; only the GLASSBOX_CACHE_DB tier is shared
+        state = self.__dict__.copy()
+        state["_component_cache"] = None
+        return state
+
+    @property
+    def component_cache(self) -> ResultCache:
+        """
+        Per-component findings for incremental revalidation, opened on first use. With
+        GLASSBOX_CACHE_DB set they also go to the shared SQLite tier, so a revision handled
+        by another process worker still reuses them.
+        """
+        if self._component_cache is None:
+            self._component_cache = ResultCache(max_entries=self.cong.get("component_cache_size", 16384),
+                                                db_path=os.environ.get("GLASSBOX_CACHE_DB") or None)
+        return self._component_cache
 
     def _default_cong(self) -> Dict:
         return {
@@ -34,38 +170,79 @@ class PreExecutionValidator:
             "allowed_nucleotides": set("ATGCatgc"),
             "forbidden_patterns": ["GAATTC" * 10], # homopolymers
             "enable_blast_check": False, # requires NCBI API
+            "repeat_window": 20, # k-mer length for repeat detection
+            "repeat_min_count": 2, # occurrences before a k-mer counts as repeated
+            "component_cache_size": 16384, # per-component findings kept for incremental revalidation
         }
 
     def _load_biohazard_db(self) -> List[str]:
         """Load pathogen/toxin sequence patterns (stub)"""
         return []  # In production: load from secure database
 
-    def validate_design(self, sbol_uri: str) -> ValidationResult:
+    def _build_pattern_matcher(self) -> PatternMatcher:
+        """Compile forbidden and biohazard patterns into one automaton (once per validator)"""
+        patterns = {f"forbidden:{i}": p for i, p in enumerate(self.cong["forbidden_patterns"])}
+        patterns.update({f"biohazard:{i}": p for i, p in enumerate(self.biohazard_patterns)})
+        return PatternMatcher(patterns)
+
+    def config_fingerprint(self) -> str:
+        """Changes whenever cong or the biohazard database could change a result"""
+        return config_fingerprint(self.cong, self.biohazard_db_version)
+
+    def validate_design(self, sbol_uri: SbolSource, policy: Dict = None,
+                        previous_digests: Dict[str, str] = None) -> ValidationResult:
         """
         Main validation entrypoint.
         Args:
-            sbol_uri: Path or URL to SBOL3 RDF document
+            sbol_uri: Path or URL to SBOL3 RDF document, its raw bytes, a binary
+                file-like object, or an already-parsed pySBOL3.Document
+            policy: Optional audit_policy_v1 document; when given, only its enabled modules
+                run and is_valid follows the adm_v1 decision. With attestation_bypass enabled,
+                a trusted attestation of the design_hash skips the modules it covers
+            previous_digests: component_digests of the design this one revises; enables
+                incremental mode, where components whose own and Sequence digests are
+                unchanged reuse their cached findings instead of being re-analysed
         Returns:
             ValidationResult with pass/fail and detailed findings
+        Raises:
+            PolicyError: policy does not conform to audit_policy_v1
         """
+        plan = compile_policy(policy) if policy is not None else None
         errors = []
         warnings = []
+        timings = StageTimings()
         try:
-            doc = pySBOL3.Document()
-            doc.read(sbol_uri)
+            doc, digest = load_document_with_digest(sbol_uri, timings)
             components = doc.find_all(pySBOL3.Component)
+            profile_cache = {}
+            checks = self._module_checks(
+                timings.wrap("sequence_profile", lambda c: self._analyze_component(c, profile_cache)), timings
+            )
+            reuse = _ComponentReuse(self.component_cache, self.config_fingerprint(), digest, previous_digests)
+            reevaluated = reuse.reevaluated if previous_digests is not None else None
+            if plan is not None:
+                attestation = None
+                if plan.bypass is not None:
+                    attestation = plan.bypass.match(self.attestations.lookup(digest.design_hash))
+                with timings.time("scoring"):
+                    report = plan.run(self._design_modules(components, checks, reuse), attestation)
+                reuse.flush()
+                return self._policy_result(report, digest.design_hash, digest.object_digests, timings, reevaluated)
             for component in components:
-                errors.extend(self._check_sequence_validity(component))
-                errors.extend(self._check_biohazard(component))
-                warnings.extend(self._check_complexity(component))
-                errors.extend(self._check_provenance(component))
-            design_hash = self._compute_design_hash(doc)
+                for module_id in _LEGACY_MODULES:
+                    findings = reuse.findings(module_id, component, {}, checks[module_id])
+                    target = warnings if module_id in _WARNING_MODULES else errors
+                    target.extend(f.description for f in findings)
+            reuse.flush()
             return ValidationResult(
                 is_valid=len(errors) == 0,
                 errors=errors,
                 warnings=warnings,
-                design_hash=design_hash,
-                validation_timestamp=self._get_timestamp()
+                design_hash=digest.design_hash,
+                validation_timestamp=self._get_timestamp(),
+                component_digests=digest.object_digests,
+                reevaluated_components=reevaluated,
+                timings=timings
             )
         except Exception as e:
             return ValidationResult(
@@ -73,103 +250,272 @@ class PreExecutionValidator:
                 errors=[f"Parse error: {str(e)}"],
                 warnings=[],
                 design_hash="",
-                validation_timestamp=self._get_timestamp()
+                validation_timestamp=self._get_timestamp(),
+                timings=timings
             )
 
-    def _check_sequence_validity(self, component: pySBOL3.Component) -> List[str]:
-        """Validate DNA sequence integrity"""
-        errors = []
-        if not component.sequences:
-            errors.append(f"Component {component.display_id} missing sequence")
-            return errors
-        for seq in component.sequences:
+    def validate_sequence(self, record: SequenceRecord, policy: Dict = None) -> ValidationResult:
+        """
+        Validate one raw sequence with the rules, finding codes and policy scoring that
+        validate_design() applies to the equivalent SBOL design, without building,
+        serializing or parsing SBOL. design_hash is record.digest(), not an RDF graph digest.
+        Raises:
+            PolicyError: policy does not conform to audit_policy_v1
+        """
+        plan = compile_policy(policy) if policy is not None else None
+        timings = StageTimings()
+        with timings.time("sequence_profile"):
+            profile = analyze_sequence(
+                record.sequence_identity, record.sequence_display_id, record.elements,
+                self.cong["allowed_nucleotides"], self.pattern_matcher,
+                repeat_window=self.cong.get("repeat_window", 20),
+                repeat_min_count=self.cong.get("repeat_min_count", 2)
+            )
+        checks = self._module_checks(lambda _: [profile], timings)
+        with timings.time("hash"):
+            design_hash = record.digest()
+        component_digests = {record.identity: design_hash}
+        if plan is not None:
+            attestation = None
+            if plan.bypass is not None:
+                attestation = plan.bypass.match(self.attestations.lookup(design_hash))
+            def record_module(module_id):
+                return lambda params: ModuleResult(module_id, checks[module_id](record, params))
+            modules = {module_id: record_module(module_id) for module_id in checks}
+            with timings.time("scoring"):
+                report = plan.run(modules, attestation)
+            return self._policy_result(report, design_hash, component_digests, timings)
+        errors, warnings = [], []
+        for module_id in _LEGACY_MODULES:
+            target = warnings if module_id in _WARNING_MODULES else errors
+            target.extend(f.description for f in checks[module_id](record, {}))
+        return ValidationResult(
+            is_valid=len(errors) == 0,
+            errors=errors,
+            warnings=warnings,
+            design_hash=design_hash,
+            validation_timestamp=self._get_timestamp(),
+            component_digests=component_digests,
+            timings=timings
+        )
+
+    def validate_sequences(self, records: Iterable[SequenceRecord], policy: Dict = None) -> List[ValidationResult]:
+        """
+        validate_sequence() over a batch in this process, in input order; the policy is
+        compiled once. For parallelism use validate_many() or the API's executor.
+        """
+        if policy is not None:
+            compile_policy(policy)
+        return [self.validate_sequence(record, policy) for record in records]
+
+    def validate_many(self, sources: Iterable[Union[SbolSource, SequenceRecord]], max_workers: int = None,
+                      use_processes: bool = True, policy: Dict = None,
+                      chunksize: int = 1) -> Iterator[ValidationResult]:
+        """
+        Validate many designs in parallel, yielding results in input order.
+        Args:
+            sources: Paths, raw bytes or file-like objects (must be picklable when
+                use_processes is True; parsed Documents need use_processes=False),
+                or SequenceRecords, which go through validate_sequence()
+            max_workers: Pool size (defaults to CPU count)
+            use_processes: Process pool to spread SBOL parsing across cores
+            policy: Optional audit_policy_v1 document applied to every design
+            chunksize: Sources sent to a worker process at a time; raise it for many
+                small SequenceRecords so inter-process overhead does not dominate
+        Returns:
+            Iterator of ValidationResult, one per source, available as each completes in order
+        """
+        if policy is not None:
+            compile_policy(policy)  # reject a bad policy before any worker starts
+        max_workers = max_workers or os.cpu_count() or 1
+        if use_processes:
+            pool = ProcessPoolExecutor(max_workers, initializer=_init_batch_worker, initargs=(self,))
+            run = functools.partial(_validate_in_worker, policy=policy)
+        else:
+            pool = ThreadPoolExecutor(max_workers)
+            run = functools.partial(self._validate_source, policy=policy)
+        with pool:
+            yield from pool.map(run, sources, chunksize=chunksize)
+
+    def _validate_source(self, source, policy: Dict = None) -> ValidationResult:
+        if isinstance(source, SequenceRecord):
+            return self.validate_sequence(source, policy)
+        return self.validate_design(source, policy)
+
+    def _analyze_component(self, component: pySBOL3.Component,
+                           cache: Dict[str, SequenceProfile]) -> List[SequenceProfile]:
+        """Profile each referenced Sequence once; shared Sequences reuse the cached profile"""
+        profiles = []
+        for seq in component.sequences or []:
             seq_obj = seq.lookup()
-            elements = seq_obj.elements
-            if len(elements) > self.cong["max_sequence_length"]:
-                errors.append(
-                    f"Sequence {seq_obj.display_id} exceeds max length "
-                    f"({len(elements)} > {self.cong['max_sequence_length']})"
-                )
-            if len(elements) < self.cong["min_sequence_length"]:
-                errors.append(
-                    f"Sequence {seq_obj.display_id} below min length "
-                    f"({len(elements)} < {self.cong['min_sequence_length']})"
-                )
-            invalid_chars = set(elements) - self.cong["allowed_nucleotides"]
-            if invalid_chars:
-                errors.append(
-                    f"Sequence {seq_obj.display_id} contains invalid characters: "
-                    f"{invalid_chars}"
+            profile = cache.get(seq_obj.identity)
+            if profile is None:
+                profile = analyze_sequence(
+                    seq_obj.identity, seq_obj.display_id, seq_obj.elements,
+                    self.cong["allowed_nucleotides"], self.pattern_matcher,
+                    repeat_window=self.cong.get("repeat_window", 20),
+                    repeat_min_count=self.cong.get("repeat_min_count", 2)
                 )
-            for forbidden in self.cong["forbidden_patterns"]:
-                if forbidden in elements.upper():
-                    errors.append(
-                        f"Sequence {seq_obj.display_id} contains forbidden pattern: "
-                        f"{forbidden[:20]}..."
-                    )
-        return errors
-
-    def _check_biohazard(self, component: pySBOL3.Component) -> List[str]:
+                cache[seq_obj.identity] = profile
+            profiles.append(profile)
+        return profiles
+
+    def _check_sequence_validity(self, component: pySBOL3.Component,
+                                 profiles: List[SequenceProfile]) -> List[str]:
+        """Validate DNA sequence integrity"""
+        return [f.description for f in self._sequence_findings(component, profiles, self.cong)]
+
+    def _sequence_findings(self, component: pySBOL3.Component, profiles: List[SequenceProfile],
+                           limits: Dict) -> List[Finding]:
+        findings = []
+        if not profiles:
+            findings.append(Finding(
+                "SEQ_MISSING", "Component has no sequence", "high", "sequence",
+                f"Component {component.display_id} missing sequence", scope={"component": str(component.identity)}
+            ))
+            return findings
+        for profile in profiles:
+            scope = {"component": str(component.identity), "sequence": str(profile.identity)}
+            if profile.length > limits["max_sequence_length"]:
+                findings.append(Finding(
+                    "SEQ_TOO_LONG", "Sequence exceeds maximum length", "high", "sequence",
+                    f"Sequence {profile.display_id} exceeds max length "
+                    f"({profile.length} > {limits['max_sequence_length']})", scope=scope
+                ))
+            if profile.length < limits["min_sequence_length"]:
+                findings.append(Finding(
+                    "SEQ_TOO_SHORT", "Sequence below minimum length", "high", "sequence",
+                    f"Sequence {profile.display_id} below min length "
+                    f"({profile.length} < {limits['min_sequence_length']})", scope=scope
+                ))
+            if profile.invalid_chars:
+                findings.append(Finding(
+                    "SEQ_INVALID_CHARS", "Sequence contains invalid characters", "high", "sequence",
+                    f"Sequence {profile.display_id} contains invalid characters: "
+                    f"{profile.invalid_chars}", scope=scope
+                ))
+            for pattern_id in profile.matched_ids("forbidden:"):
+                findings.append(Finding(
+                    "SEQ_FORBIDDEN_PATTERN", "Sequence contains a forbidden pattern", "critical", "sequence",
+                    f"Sequence {profile.display_id} contains forbidden pattern: "
+                    f"{self.pattern_matcher.patterns[pattern_id][:20]}...", scope=scope
+                ))
+        return findings
+
+    def _check_biohazard(self, profiles: List[SequenceProfile]) -> List[str]:
         """Screen for pathogen/toxin sequences"""
-        errors = []
-        if not component.sequences:
-            return errors
-        for seq in component.sequences:
-            seq_obj = seq.lookup()
-            elements = seq_obj.elements.upper()
-            for hazard_pattern in self.biohazard_patterns:
-                if hazard_pattern in elements:
-                    errors.append(
-                        f"BIOHAZARD ALERT: Sequence {seq_obj.display_id} "
-                        f"matches restricted pathogen/toxin database"
-                    )
-        return errors
-
-    def _check_complexity(self, component: pySBOL3.Component) -> List[str]:
+        return [f.description for f in self._biohazard_findings(profiles)]
+
+    def _biohazard_findings(self, profiles: List[SequenceProfile]) -> List[Finding]:
+        findings = []
+        for profile in profiles:
+            for _ in profile.matched_ids("biohazard:"):
+                findings.append(Finding(
+                    "BIOHAZARD_MATCH", "Sequence matches restricted pathogen/toxin database", "critical", "biosafety",
+                    f"BIOHAZARD ALERT: Sequence {profile.display_id} "
+                    f"matches restricted pathogen/toxin database", scope={"sequence": str(profile.identity)}
+                ))
+        return findings
+
+    def _check_complexity(self, profiles: List[SequenceProfile]) -> List[str]:
         """Warn about overly complex designs (low synthesis success)"""
-        warnings = []
-        if not component.sequences:
-            return warnings
-        for seq in component.sequences:
-            seq_obj = seq.lookup()
-            elements = seq_obj.elements.upper()
-            gc_content = (elements.count('G') + elements.count('C')) / len(elements)
-            if gc_content < 0.3 or gc_content > 0.7:
-                warnings.append(
-                    f"Sequence {seq_obj.display_id} has suboptimal GC content: "
-                    f"{gc_content:.1%} (recommend 40-60%)"
-                )
-            if self._has_high_repetition(elements):
-                warnings.append(
-                    f"Sequence {seq_obj.display_id} contains highly repetitive regions "
-                    f"(may fail synthesis or PCR)"
-                )
-        return warnings
-
-    def _has_high_repetition(self, sequence: str, window: int = 20) -> bool:
-        """Detect repetitive sequences using sliding window"""
-        seen = set()
-        for i in range(len(sequence) - window):
-            kmer = sequence[i:i+window]
-            if kmer in seen:
-                return True
-            seen.add(kmer)
-        return False
+        return [f.description for f in self._complexity_findings(profiles, {})]
+
+    def _complexity_findings(self, profiles: List[SequenceProfile], params: Dict) -> List[Finding]:
+        gc_min, gc_max = params.get("gc_min", 0.3), params.get("gc_max", 0.7)
+        findings = []
+        for profile in profiles:
+            scope = {"sequence": str(profile.identity)}
+            gc_content = profile.gc_fraction
+            if profile.length and (gc_content < gc_min or gc_content > gc_max):
+                findings.append(Finding(
+                    "COMPLEXITY_GC_CONTENT", "Suboptimal GC content", "medium", "synthesis",
+                    f"Sequence {profile.display_id} has suboptimal GC content: "
+                    f"{gc_content:.1%} (recommend 40-60%)", scope=scope
+                ))
+            if profile.has_repeats:
+                regions = ", ".join(region.describe() for region in profile.repeats[:5])
+                if len(profile.repeats) > 5:
+                    regions += f", +{len(profile.repeats) - 5} more"
+                findings.append(Finding(
+                    "COMPLEXITY_REPEATS", "Highly repetitive regions", "medium", "synthesis",
+                    f"Sequence {profile.display_id} contains highly repetitive regions "
+                    f"at {regions} (may fail synthesis or PCR)", scope=scope
+                ))
+        return findings
+
+    def _has_high_repetition(self, sequence: str, window: int = None) -> bool:
+        """Detect repetitive sequences using a rolling 2-bit k-mer encoding; windows with non-ACGT bases are skipped"""
+        window = window or self.cong.get("repeat_window", 20)
+        data = sequence.upper().encode("ascii", "replace")
+        return bool(find_repeats(data, window, self.cong.get("repeat_min_count", 2)))
 
     def _check_provenance(self, component: pySBOL3.Component) -> List[str]:
         """Verify AI model provenance is documented"""
-        errors = []
-        if not hasattr(component, 'provenance') or not component.provenance():
-            errors.append(
-                f"Component {component.display_id} missing AI provenance "
-                f"(prov:wasGeneratedBy required for audit trail)"
-            )
-        return errors
+        return [f.description for f in self._provenance_findings(component)]
+
+    def _provenance_findings(self, component: pySBOL3.Component) -> List[Finding]:
+        if hasattr(component, 'provenance') and component.provenance():
+            return []
+        # EVIDENCE_MISSING_ codes carry the adm_v1 evidence gap penalty
+        return [Finding(
+            "EVIDENCE_MISSING_PROVENANCE", "Component missing AI provenance", "high", "provenance",
+            f"Component {component.display_id} missing AI provenance "
+            f"(prov:wasGeneratedBy required for audit trail)", scope={"component": str(component.identity)}
+        )]
+
+    def _module_checks(self, profiles: Callable[[pySBOL3.Component], List[SequenceProfile]],
+                       timings: StageTimings = None) -> Dict[str, ComponentCheck]:
+        """
+        Per-component check behind each admissibility module. profiles gives a component's
+        Sequence profiles (from a shared cache, so no Sequence is analysed twice); a
+        SequenceRecord stands in for a Component on the sequence-level path.
+        With timings, each check's time is recorded under its module_id.
+        """
+        checks = {
+            "sequence_integrity": lambda c, params: self._sequence_findings(c, profiles(c), {**self.cong, **params}),
+            "biosafety": lambda c, params: self._biohazard_findings(profiles(c)),
+            "synthesis_complexity": lambda c, params: self._complexity_findings(profiles(c), params),
+            "provenance": lambda c, params: self._provenance_findings(c),
+        }
+        if timings is None:
+            return checks
+        return {module_id: timings.wrap(module_id, check) for module_id, check in checks.items()}
+
+    def _design_modules(self, components: List[pySBOL3.Component], checks: Dict[str, ComponentCheck],
+                        reuse: "_ComponentReuse") -> Dict[str, ModuleFn]:
+        """
+        Admissibility modules over one parsed design, keyed by policy module_id.
+        Each runs only when its policy enables it; Sequence profiles are shared through
+        the checks' profile cache so no sequence is analysed twice however many modules run.
+        """
+        def over_components(module_id):
+            def run(params: Dict) -> ModuleResult:
+                findings = []
+                for component in components:
+                    findings.extend(reuse.findings(module_id, component, params, checks[module_id]))
+                return ModuleResult(module_id, findings)
+            return run
+        return {module_id: over_components(module_id) for module_id in checks}
+
+    def _policy_result(self, report, design_hash: str, component_digests: Dict[str, str],
+                       timings: Dict[str, float], reevaluated: Optional[List[str]] = None) -> ValidationResult:
+        errors = [f.description for f in report.findings if f.severity in BLOCKING_SEVERITIES]
+        return ValidationResult(
+            is_valid=report.passed and not errors,
+            errors=errors,
+            warnings=[f.description for f in report.findings if f.severity not in BLOCKING_SEVERITIES],
+            design_hash=design_hash,
+            validation_timestamp=self._get_timestamp(),
+            component_digests=component_digests,
+            admissibility=report.to_dict(),
+            reevaluated_components=reevaluated,
+            timings=timings
+        )
 
     def _compute_design_hash(self, doc: pySBOL3.Document) -> str:
-        """Generate cryptographic hash for immutable audit trail"""
-        content = doc.write_string()
-        return hashlib.sha256(content.encode()).hexdigest()
+        """Generate cryptographic hash for immutable audit trail (canonical, serializer-independent)"""
+        return digest_graph(doc.graph()).design_hash
 
     def _get_timestamp(self) -> str:
         return datetime.utcnow().isoformat() + "Z"
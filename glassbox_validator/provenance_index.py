@@ -0,0 +1,169 @@
+"""
+Glassbox Bio Provenance Index
+One-time adjacency index over the SBOL/PROV references of a provenance document
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set, Tuple
+import pySBOL3
+
+# Reference properties followed from ExperimentalData back to the designed Component
+RELATIONS = ("generated_by", "members", "built")
+_PROPERTY_NAMES = {"generated_by": "prov:wasGeneratedBy", "members": "sbol:member", "built": "sbol:built"}
+
+class ProvenanceIndex:
+    """
+    Top-level objects by URI with forward and reverse reference edges.
+    Built in one pass over doc.objects; every later lookup is a dict access instead of
+    a pySBOL3 lookup() against the whole document.
+    """
+    def __init__(self, objects: Iterable):
+        self.objects: Dict[str, object] = {}
+        self.edges: Dict[str, Dict[str, List[str]]] = {}
+        self.reverse: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+        for obj in objects:
+            uri = str(obj.identity)
+            self.objects[uri] = obj
+            out = {}
+            for relation in RELATIONS:
+                value = getattr(obj, relation, None)
+                if not value:
+                    continue
+                targets = [str(value)] if isinstance(value, str) else [str(t) for t in value]
+                out[relation] = targets
+                for target in targets:
+                    self.reverse[target].append((relation, uri))
+            self.edges[uri] = out
+
+    @classmethod
+    def from_document(cls, doc: pySBOL3.Document) -> "ProvenanceIndex":
+        return cls(doc.objects)
+
+    def targets(self, uri: str, relation: str) -> List[str]:
+        return self.edges.get(uri, {}).get(relation, [])
+
+    def sources(self, uri: str, relation: str = None) -> List[str]:
+        """Objects referencing uri, optionally through one relation only"""
+        return [src for rel, src in self.reverse.get(uri, []) if relation is None or rel == relation]
+
+    def of_type(self, sbol_type) -> List:
+        return [obj for obj in self.objects.values() if isinstance(obj, sbol_type)]
+
+    def edge_list(self) -> List[Tuple[str, str, str]]:
+        """Every (source, relation, target) reference edge, e.g. for the lineage store"""
+        return [(src, relation, target) for src, out in self.edges.items()
+                for relation, targets in out.items() for target in targets]
+
+    def dangling(self) -> List[Tuple[str, str, str]]:
+        """(source, relation, target) for every reference to a URI not in the document"""
+        return [(src, relation, target) for src, out in self.edges.items()
+                for relation, targets in out.items() for target in targets if target not in self.objects]
+
+    def cycles(self) -> List[List[str]]:
+        """
+        Reference cycles, each as a closed URI path, found by one iterative DFS (linear time).
+        Provenance must be acyclic: data cannot be generated from its own descendants.
+        """
+        WHITE, GREY, BLACK = 0, 1, 2
+        color = dict.fromkeys(self.objects, WHITE)
+        found, seen = [], set()
+        for root in self.objects:
+            if color[root] != WHITE:
+                continue
+            path = [root]
+            stack = [iter(self._neighbours(root))]
+            color[root] = GREY
+            while stack:
+                nxt = next(stack[-1], None)
+                if nxt is None:
+                    color[path.pop()] = BLACK
+                    stack.pop()
+                elif color.get(nxt) == GREY:
+                    cycle = path[path.index(nxt):] + [nxt]
+                    key = frozenset(cycle)
+                    if key not in seen:
+                        seen.add(key)
+                        found.append(cycle)
+                elif color.get(nxt) == WHITE:
+                    color[nxt] = GREY
+                    path.append(nxt)
+                    stack.append(iter(self._neighbours(nxt)))
+        return found
+
+    def _neighbours(self, uri: str) -> List[str]:
+        return [t for targets in self.edges.get(uri, {}).values() for t in targets if t in self.objects]
+
+    def validate_chains(self) -> List[str]:
+        """
+        Check every ExperimentalData -> Experiment -> Implementation -> Component chain.
+        All generated_by and member edges are followed; each Experiment and Implementation
+        is checked once however many data objects share it.
+        """
+        data_objs = self.of_type(pySBOL3.ExperimentalData)
+        if not data_objs:
+            return ["SBOL document missing ExperimentalData objects"]
+        errors = []
+        checked: Set[str] = set()
+        for data_obj in data_objs:
+            uri = str(data_obj.identity)
+            experiments = self.targets(uri, "generated_by")
+            if not experiments:
+                errors.append(
+                    f"ExperimentalData {data_obj.display_id} missing prov:wasGeneratedBy link to Experiment"
+                )
+                continue
+            for experiment in experiments:
+                errors.extend(self._check_reference(data_obj, "generated_by", experiment, checked, self._check_experiment))
+        for cycle in self.cycles():
+            errors.append(f"Provenance cycle: {' -> '.join(cycle)}")
+        return errors
+
+    def _check_reference(self, source, relation: str, target: str, checked: Set[str], check) -> List[str]:
+        if target not in self.objects:
+            return [f"{type(source).__name__} {source.display_id} {_PROPERTY_NAMES[relation]} "
+                    f"references missing object {target}"]
+        if target in checked:
+            return []
+        checked.add(target)
+        return check(self.objects[target], checked)
+
+    def _check_experiment(self, experiment, checked: Set[str]) -> List[str]:
+        members = self.targets(str(experiment.identity), "members")
+        if not members:
+            return [f"Experiment {experiment.display_id} missing sbol:member link to Implementation"]
+        errors = []
+        for member in members:
+            errors.extend(self._check_reference(experiment, "members", member, checked, self._check_member))
+        return errors
+
+    def _check_member(self, member, checked: Set[str]) -> List[str]:
+        if isinstance(member, pySBOL3.Implementation):
+            return self._check_implementation(member)
+        if isinstance(member, pySBOL3.Collection):
+            return self._check_experiment(member, checked)  # nested collection of implementations
+        return [f"{type(member).__name__} {member.display_id} is an Experiment sbol:member but not an "
+                "Implementation, so no data is traced to a design through it"]
+
+    def _check_implementation(self, implementation) -> List[str]:
+        built = self.targets(str(implementation.identity), "built")
+        if not built:
+            return [f"Implementation {implementation.display_id} missing sbol:built link to original Component design"]
+        errors = []
+        for target in built:
+            design = self.objects.get(target)
+            if design is None:
+                errors.append(f"Implementation {implementation.display_id} sbol:built references missing object {target}")
+            elif not isinstance(design, pySBOL3.Component):
+                errors.append(f"Implementation {implementation.display_id} sbol:built target {target} is not a Component design")
+        return errors
+
+    def unmatched_samples(self, sample_ids: Iterable[str]) -> List[str]:
+        """
+        Allotrope sample identifiers that name no Implementation in the document.
+        A sample matches by Implementation URI, display_id, or a trailing /display_id.
+        """
+        names = set()
+        for implementation in self.of_type(pySBOL3.Implementation):
+            names.add(str(implementation.identity))
+            names.add(implementation.display_id)
+        return sorted(s for s in set(sample_ids) if s is not None and s not in names
+                      and s.rsplit("/", 1)[-1] not in names)
@@ -0,0 +1,120 @@
+"""
+Glassbox Bio Validation Result Cache
+Content-addressed LRU/TTL cache with an optional SQLite tier shared across workers
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+CACHE_FORMAT_VERSION = "3"  # bump when cached result layout or check semantics change
+
+def cache_key(payload_sha256: str, fingerprint: str) -> str:
+    """Key = upload digest + validator fingerprint, so cong/pattern DB changes miss automatically"""
+    return hashlib.sha256(f"{CACHE_FORMAT_VERSION}:{fingerprint}:{payload_sha256}".encode()).hexdigest()
+
+def config_fingerprint(cong: Dict, *extra: str) -> str:
+    """Stable digest of a validator config (sets are sorted) plus any extra version strings"""
+    canonical = json.dumps(cong, sort_keys=True, default=sorted)
+    return hashlib.sha256("\n".join((canonical,) + extra).encode()).hexdigest()
+
+class ResultCache:
+    """
+    Two-tier cache of JSON-serializable validation results.
+    Memory tier: LRU bounded by max_entries, entries expire after ttl_s.
+    Disk tier (db_path): SQLite in WAL mode, so several API worker processes share hits.
+    Expired disk rows are purged when the cache is opened and whenever purge_expired() runs.
+    """
+    def __init__(self, max_entries: int = 1024, ttl_s: float = 3600.0, db_path: str = None):
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self.hits = 0
+        self.misses = 0
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS validation_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS validation_cache_expiry ON validation_cache (expires_at)")
+            self.purge_expired()
+
+    def get(self, key: str) -> Optional[Dict]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, expires_at FROM validation_cache WHERE key = ? AND expires_at > ?", (key, now)
+                ).fetchone()
+                if row is not None:
+                    value = json.loads(row[0])
+                    self._remember(key, value, row[1])
+                    self.hits += 1
+                    return value
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Dict):
+        expires_at = time.time() + self.ttl_s
+        with self._lock:
+            self._remember(key, value, expires_at)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO validation_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(value), expires_at)
+                )
+
+    def put_many(self, items: Dict[str, Dict]):
+        """put() for several entries, written to the disk tier in one transaction"""
+        if not items:
+            return
+        expires_at = time.time() + self.ttl_s
+        with self._lock:
+            for key, value in items.items():
+                self._remember(key, value, expires_at)
+            if self._db is not None:
+                self._db.execute("BEGIN")
+                try:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO validation_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                        [(key, json.dumps(value), expires_at) for key, value in items.items()]
+                    )
+                    self._db.execute("COMMIT")
+                except Exception:
+                    self._db.execute("ROLLBACK")
+                    raise
+
+    def purge_expired(self) -> int:
+        """Drop expired disk entries; memory entries expire lazily on access"""
+        if self._db is None:
+            return 0
+        with self._lock:
+            return self._db.execute("DELETE FROM validation_cache WHERE expires_at <= ?", (time.time(),)).rowcount
+
+    def stats(self) -> Dict:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses,
+                "disk_tier": self._db is not None}
+
+    def _remember(self, key: str, value: Dict, expires_at: float):
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -0,0 +1,163 @@
+"""
+Glassbox Bio SBOL Input Helpers
+Load SBOL3 documents from paths, bytes, file-like objects, parsed Documents or archives
+"""
+import io
+import os
+import re
+import tarfile
+import zipfile
+import pySBOL3
+import rdflib
+from rdflib.util import guess_format
+from typing import IO, Iterator, Tuple, Union
+from glassbox_validator.design_digest import DesignDigest, digest_graph
+from glassbox_validator.metrics import StageTimings
+
+SbolSource = Union[str, bytes, IO, "pySBOL3.Document"]
+
+# N-Triples statement: subject IRI or blank node, then a predicate IRI
+_NTRIPLE = re.compile(r"(<[^<>\s]*>|_:\S+)[ \t]+<[^<>\s]*>[ \t]")
+_XML_PREFIXES = ("<?xml", "<rdf:", "<RDF", "<!--", "<!DOCTYPE")
+# pySBOL3 has no public way to load an rdflib Graph; Document._parse_graph(graph), present
+# since pySBOL3 1.0, is what read()/read_string() call after parsing
+_PARSE_GRAPH = getattr(pySBOL3.Document, "_parse_graph", None)
+
+def sniff_rdf_format(text: str) -> str:
+    """Guess the RDF serialization of an in-memory SBOL document"""
+    head = text.lstrip()[:512]
+    if _NTRIPLE.match(head):
+        return pySBOL3.NTRIPLES
+    if head.startswith(_XML_PREFIXES):
+        return pySBOL3.RDF_XML
+    if head.startswith("<"):
+        return pySBOL3.TURTLE  # Turtle statement without prefixes
+    if head.startswith("{") or head.startswith("["):
+        return pySBOL3.JSONLD
+    if head.startswith("@prefix") or head.startswith("PREFIX") or head.startswith("@base"):
+        return pySBOL3.TURTLE
+    return pySBOL3.NTRIPLES
+
+def read_text(source) -> str:
+    """Decode bytes or drain a file-like object into text"""
+    if hasattr(source, "read"):
+        source = source.read()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source).decode("utf-8")
+    return source
+
+def load_document(source: SbolSource) -> "pySBOL3.Document":
+    """
+    Parse an SBOL3 source without touching the filesystem unless given a path.
+    str is treated as a path or URL; bytes and file-like objects are parsed in memory.
+    """
+    if isinstance(source, pySBOL3.Document):
+        return source
+    doc = pySBOL3.Document()
+    if isinstance(source, str):
+        doc.read(source)
+        return doc
+    text = read_text(source)
+    doc.read_string(text, sniff_rdf_format(text))
+    return doc
+
+def load_document_with_digest(source: SbolSource,
+                              timings: StageTimings = None) -> Tuple["pySBOL3.Document", DesignDigest]:
+    """
+    Parse an SBOL3 source and digest its triples from the same rdflib graph.
+    The graph pySBOL3 would build internally is built here, hashed, then handed to the
+    Document, so the canonical digest costs one pass over the triples and no re-serialization.
+    A pre-parsed Document is digested from doc.graph(). timings, when given, receives
+    the "parse" (graph and Document) and "hash" stage times, each timed on its own.
+    """
+    timings = timings if timings is not None else StageTimings()
+    if isinstance(source, pySBOL3.Document):
+        with timings.time("hash"):
+            return source, digest_graph(source.graph())
+    with timings.time("parse"):
+        graph = rdflib.Graph()
+        if isinstance(source, str):
+            graph.parse(source, format=guess_format(source) or _sniff_path(source))
+        else:
+            text = read_text(source)
+            graph.parse(data=text, format=sniff_rdf_format(text))
+    with timings.time("hash"):
+        digest = digest_graph(graph)
+    with timings.time("parse"):
+        doc = _document_from_graph(graph)
+    return doc, digest
+
+def _document_from_graph(graph: rdflib.Graph) -> "pySBOL3.Document":
+    """
+    Document holding the triples of an already-parsed rdflib Graph. Uses pySBOL3's internal
+    _parse_graph when this pySBOL3 has it; otherwise the graph goes through the public
+    read_string() as N-Triples, which costs a serialization and a second parse.
+    """
+    doc = pySBOL3.Document()
+    if _PARSE_GRAPH is not None:
+        _PARSE_GRAPH(doc, graph)
+    else:
+        doc.read_string(graph.serialize(format="nt"), pySBOL3.NTRIPLES)
+    return doc
+
+def _sniff_path(path: str) -> str:
+    if not os.path.exists(path):
+        return None  # URL: let rdflib negotiate from the response content type
+    with open(path, "r", encoding="utf-8") as f:
+        return sniff_rdf_format(f.read(512))
+
+def is_archive(data: bytes) -> bool:
+    """True when data is a zip or tar (optionally compressed) archive"""
+    buffer = io.BytesIO(data)
+    if zipfile.is_zipfile(buffer):
+        return True
+    buffer.seek(0)
+    return tarfile.is_tarfile(buffer)
+
+def iter_archive(data: bytes, max_members: int = None, max_member_bytes: int = None,
+                 max_total_bytes: int = None) -> Iterator[Tuple[str, bytes]]:
+    """
+    Yield (member name, bytes) for every regular file in a zip or tar archive, in archive order.
+    Directories, links and hidden files (e.g. __MACOSX/._*) are skipped. More than max_members
+    files, or a member or archive whose uncompressed size exceeds max_member_bytes or
+    max_total_bytes, raises ValueError before anything is unpacked; members are read with
+    bounded reads, so a header that understates its size cannot inflate past the limits either.
+    """
+    buffer = io.BytesIO(data)
+    if zipfile.is_zipfile(buffer):
+        with zipfile.ZipFile(buffer) as archive:
+            members = [(info.filename, info, info.file_size) for info in archive.infolist() if not info.is_dir()]
+
+            def read(info, limit):
+                with archive.open(info) as member:
+                    return member.read(limit)
+            yield from _read_members(members, read, max_members, max_member_bytes, max_total_bytes)
+        return
+    buffer.seek(0)
+    with tarfile.open(fileobj=buffer) as archive:
+        members = [(info.name, info, info.size) for info in archive.getmembers() if info.isfile()]
+        yield from _read_members(members, lambda info, limit: archive.extractfile(info).read(limit),
+                                 max_members, max_member_bytes, max_total_bytes)
+
+def _read_members(members, read, max_members: int = None, max_member_bytes: int = None,
+                  max_total_bytes: int = None) -> Iterator[Tuple[str, bytes]]:
+    members = [(name, info, size) for name, info, size in members
+               if not any(part.startswith(".") and part != "." or part == "__MACOSX" for part in name.split("/"))]
+    if max_members is not None and len(members) > max_members:
+        raise ValueError(f"Archive holds {len(members)} files (limit {max_members})")
+    for name, _, size in members:
+        if max_member_bytes is not None and size > max_member_bytes:
+            raise ValueError(f"Archive member {name} is {size} bytes uncompressed (limit {max_member_bytes})")
+    total = sum(size for _, _, size in members)
+    if max_total_bytes is not None and total > max_total_bytes:
+        raise ValueError(f"Archive holds {total} bytes uncompressed (limit {max_total_bytes})")
+    remaining = max_total_bytes
+    for name, info, _ in members:
+        limits = [limit for limit in (max_member_bytes, remaining) if limit is not None]
+        limit = min(limits) if limits else None
+        content = read(info, -1 if limit is None else limit + 1)
+        if limit is not None and len(content) > limit:
+            raise ValueError(f"Archive member {name} inflates past its size limit ({limit} bytes)")
+        if remaining is not None:
+            remaining -= len(content)
+        yield name, content
@@ -0,0 +1,167 @@
+"""
+Glassbox Bio Schema Registry
+Compiles the JSON schemas in schemas/ once and picks Allotrope schemas by $asm.manifest
+"""
+import copy
+import functools
+import json
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+import fastjsonschema
+import jsonschema
+
+DEFAULT_SCHEMA_DIR = os.environ.get(
+    "GLASSBOX_SCHEMA_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "schemas")
+)
+GENERIC_ALLOTROPE = "allotrope_generic"  # used when $asm.manifest matches no registered schema
+MANIFEST_KEY = "x-asm-manifest-prefix"   # schema keyword naming the manifests it covers
+MEASUREMENT_DEF = "MeasurementDocument"  # $defs entry used to check streamed measurement documents
+# 2019-09/2020-12 keywords fastjsonschema (drafts 4-7) would silently ignore
+_POST_DRAFT7_KEYWORDS = {"prefixItems", "unevaluatedProperties", "unevaluatedItems", "dependentRequired",
+                         "dependentSchemas", "$dynamicRef", "$dynamicAnchor", "$recursiveRef", "minContains",
+                         "maxContains"}
+
+GENERIC_ALLOTROPE_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "required": ["$asm.manifest", "measurement aggregate document"],
+    "properties": {
+        "$asm.manifest": {"type": "string"},
+        "measurement aggregate document": {"type": "object"}
+    }
+}
+
+@dataclass(frozen=True)
+class SchemaViolation:
+    """One schema error with the JSON path of the offending value"""
+    path: Tuple
+    message: str
+
+    def __str__(self) -> str:
+        if not self.path:
+            return self.message
+        return f"{'/'.join(str(p) for p in self.path)}: {self.message}"
+
+    @property
+    def sort_key(self) -> Tuple:
+        # Array indices sort numerically, keys alphabetically
+        return tuple((0, p, "") if isinstance(p, int) else (1, 0, str(p)) for p in self.path), self.message
+
+def _fast_compatible(schema) -> bool:
+    """True when no subschema uses a keyword that fastjsonschema does not implement"""
+    if isinstance(schema, dict):
+        return not (_POST_DRAFT7_KEYWORDS & schema.keys()) and all(_fast_compatible(v) for v in schema.values())
+    if isinstance(schema, list):
+        return all(_fast_compatible(v) for v in schema)
+    return True
+
+def _no_remote(uri: str):
+    raise fastjsonschema.JsonSchemaDefinitionException(f"Remote $ref not allowed: {uri}")
+
+def _compile_fast(schema: Dict):
+    """Generated-code validator used as a fast accept path, or None if the schema needs jsonschema"""
+    if not _fast_compatible(schema):
+        return None
+    try:
+        # fastjsonschema rewrites $refs in place, so it gets its own copy
+        return fastjsonschema.compile(copy.deepcopy(schema), handlers={"http": _no_remote, "https": _no_remote})
+    except fastjsonschema.JsonSchemaDefinitionException:
+        return None
+
+class _CompiledSchema:
+    """
+    jsonschema validator plus an optional fastjsonschema gate.
+    Valid documents (the common case) are accepted by the generated code alone; only a
+    document it rejects is walked by jsonschema to report every violation.
+    """
+    def __init__(self, cls, schema: Dict):
+        self.validator = cls(schema)
+        self.fast = _compile_fast(schema)
+
+    def iter_errors(self, instance):
+        if self.fast is not None:
+            try:
+                self.fast(instance)
+                return iter(())
+            except fastjsonschema.JsonSchemaValueException:
+                pass
+        return self.validator.iter_errors(instance)
+
+class SchemaRegistry:
+    """
+    Named JSON schemas, each checked against its metaschema and compiled to a validator once.
+    Schemas carrying x-asm-manifest-prefix are selected for Allotrope documents whose
+    $asm.manifest starts with that prefix (longest prefix wins).
+    """
+    def __init__(self, schema_dir: str = None):
+        self._schemas: Dict[str, Dict] = {}
+        self._validators: Dict[str, _CompiledSchema] = {}
+        self._measurement_validators: Dict[str, _CompiledSchema] = {}
+        self._manifests: List[Tuple[str, str]] = []
+        self.register(GENERIC_ALLOTROPE, GENERIC_ALLOTROPE_SCHEMA)
+        if schema_dir and os.path.isdir(schema_dir):
+            self.load_dir(schema_dir)
+
+    def load_dir(self, schema_dir: str):
+        """Register every *.json file in schema_dir that declares a $schema (example documents are skipped)"""
+        for filename in sorted(os.listdir(schema_dir)):
+            if not filename.endswith(".json"):
+                continue
+            with open(os.path.join(schema_dir, filename)) as f:
+                schema = json.load(f)
+            if isinstance(schema, dict) and "$schema" in schema:
+                self.register(filename[:-len(".json")].replace(".schema", ""), schema)
+
+    def register(self, name: str, schema: Dict):
+        cls = jsonschema.validators.validator_for(schema)
+        cls.check_schema(schema)
+        self._schemas[name] = schema
+        self._validators[name] = _CompiledSchema(cls, schema)
+        self._measurement_validators.pop(name, None)
+        if MEASUREMENT_DEF in schema.get("$defs", {}):
+            # Self-contained copy so $refs into $defs still resolve without the root document
+            # Fresh $id so fastjsonschema resolves the $defs locally rather than against the parent URI
+            subschema = {"$id": f"urn:glassbox:schema:{name}:{MEASUREMENT_DEF}",
+                         "$ref": f"#/$defs/{MEASUREMENT_DEF}", "$defs": schema["$defs"]}
+            self._measurement_validators[name] = _CompiledSchema(cls, subschema)
+        self._manifests = [(p, n) for p, n in self._manifests if n != name]
+        if MANIFEST_KEY in schema:
+            self._manifests.append((schema[MANIFEST_KEY], name))
+            self._manifests.sort(key=lambda entry: len(entry[0]), reverse=True)
+
+    def names(self) -> List[str]:
+        return list(self._schemas)
+
+    def schema(self, name: str) -> Dict:
+        return self._schemas[name]
+
+    def for_manifest(self, manifest: Optional[str]) -> str:
+        """Schema name for an $asm.manifest URI, falling back to the generic ASM envelope"""
+        if isinstance(manifest, str):
+            for prefix, name in self._manifests:
+                if manifest.startswith(prefix):
+                    return name
+        return GENERIC_ALLOTROPE
+
+    def validate(self, instance, name: str) -> List[SchemaViolation]:
+        """All violations of schema name, in path order"""
+        return self._collect(self._validators[name], instance, ())
+
+    def validate_measurement(self, doc: Dict, name: str, index: int) -> List[SchemaViolation]:
+        """Violations of one measurement document, with paths as if it sat in the full document"""
+        validator = self._measurement_validators.get(name)
+        if validator is None:
+            return []
+        return self._collect(validator, doc, ("measurement aggregate document", "measurement document", index))
+
+    @staticmethod
+    def _collect(validator, instance, prefix: Tuple) -> List[SchemaViolation]:
+        violations = [SchemaViolation(prefix + tuple(e.absolute_path), e.message)
+                      for e in validator.iter_errors(instance)]
+        return sorted(violations, key=lambda v: v.sort_key)
+
+@functools.lru_cache(maxsize=None)
+def default_registry() -> SchemaRegistry:
+    """Process-wide registry over DEFAULT_SCHEMA_DIR, built on first use"""
+    return SchemaRegistry(DEFAULT_SCHEMA_DIR)
@@ -0,0 +1,278 @@
+"""
+Glassbox Bio Execution Seals
+Issues glassbox_seal_v1 seals for admissible designs and verifies them without re-validating
+"""
+import base64
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
+
+SEAL_VERSION = "glassbox_seal_v1"
+ED25519 = "ed25519_detached"
+HMAC_SHA256 = "sha256_manifest"  # HMAC-SHA256 under a shared secret; for closed deployments
+SEALED_DECISIONS = ("pass", "pass_via_attestation")
+
+class SealError(Exception):
+    """Seal cannot be issued (no key for the requested algorithm)"""
+
+def canonical_json(value) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(",", ":")).encode()
+
+def sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+def signing_payload(seal: Dict) -> bytes:
+    """Bytes covered by the signature: every seal field except the signature itself"""
+    return canonical_json({k: v for k, v in seal.items() if k != "signature"})
+
+def seal_manifest(design_payload_sha256: str, design_hash: str, admissibility: Dict) -> Dict:
+    """
+    Deterministic manifest bound by manifest_sha256: the exact upload, its canonical
+    design digest and the policy decision it received.
+    """
+    return {
+        "design_payload_sha256": design_payload_sha256,
+        "design_hash": design_hash,
+        "policy": admissibility["policy"],
+        "decision": admissibility["decision"],
+        "admissibility_index": admissibility["admissibility_index"],
+        "evidence_sha256": sha256_hex(canonical_json(admissibility)),
+    }
+
+def _utc(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+class SealIssuer:
+    """
+    Signs seals with an ed25519 key and, when a shared secret is configured, HMAC-SHA256.
+    Without a configured key an ephemeral ed25519 key is generated, so seals only verify
+    against this process's public key (published by GET /seal/keys).
+    """
+    def __init__(self, ed25519_key: Ed25519PrivateKey = None, key_id: str = None, hmac_secret: bytes = None):
+        self._ed25519 = ed25519_key or Ed25519PrivateKey.generate()
+        public = self._ed25519.public_key().public_bytes(serialization.Encoding.Raw, serialization.PublicFormat.Raw)
+        self.public_key = base64.b64encode(public).decode()
+        self.key_id = key_id or f"ed25519:{sha256_hex(public)[:16]}"
+        self._hmac_secret = hmac_secret
+        self.hmac_key_id = f"hmac:{sha256_hex(hmac_secret)[:16]}" if hmac_secret else None
+
+    @classmethod
+    def from_env(cls) -> "SealIssuer":
+        """GLASSBOX_SEAL_KEY: PEM ed25519 private key file; GLASSBOX_SEAL_HMAC_KEY: shared secret"""
+        key = None
+        path = os.environ.get("GLASSBOX_SEAL_KEY")
+        if path:
+            with open(path, "rb") as f:
+                key = serialization.load_pem_private_key(f.read(), password=None)
+            if not isinstance(key, Ed25519PrivateKey):
+                raise SealError(f"{path} is not an ed25519 private key")
+        secret = os.environ.get("GLASSBOX_SEAL_HMAC_KEY")
+        return cls(key, os.environ.get("GLASSBOX_SEAL_KEY_ID"), secret.encode() if secret else None)
+
+    def verifier(self, **kwargs) -> "SealVerifier":
+        """Verifier trusting this issuer's keys"""
+        hmac_keys = {self.hmac_key_id: self._hmac_secret} if self._hmac_secret else {}
+        return SealVerifier({self.key_id: self.public_key}, hmac_keys, **kwargs)
+
+    def issue(self, design_payload_sha256: str, design_hash: str, admissibility: Dict,
+              algorithm: str = ED25519, ttl_days: int = 30, now: datetime = None) -> Dict:
+        """Seal for an admissible design (decision pass or pass_via_attestation, no blocking findings)"""
+        if admissibility["decision"] not in SEALED_DECISIONS:
+            raise SealError(f"Decision {admissibility['decision']} is not sealable")
+        if admissibility.get("blocking_findings"):
+            raise SealError("Design has blocking findings")
+        if algorithm == ED25519:
+            key_id = self.key_id
+        elif algorithm == HMAC_SHA256 and self._hmac_secret:
+            key_id = self.hmac_key_id
+        else:
+            raise SealError(f"No signing key configured for {algorithm}")
+        manifest = seal_manifest(design_payload_sha256, design_hash, admissibility)
+        issued = (now or datetime.now(timezone.utc)).replace(microsecond=0)
+        seal = {
+            "seal_version": SEAL_VERSION,
+            "seal_id": f"seal_{uuid.uuid4().hex}",
+            "algorithm": algorithm,
+            "design_payload_sha256": design_payload_sha256,
+            "design_hash": design_hash,
+            "evidence_sha256": manifest["evidence_sha256"],
+            "manifest_sha256": sha256_hex(canonical_json(manifest)),
+            "policy_id": admissibility["policy"]["policy_id"],
+            "policy_version": admissibility["policy"]["policy_version"],
+            "decision": admissibility["decision"],
+            "admissibility_index": admissibility["admissibility_index"],
+            "issued_at_utc": _utc(issued),
+            "expires_at_utc": _utc(issued + timedelta(days=ttl_days)),
+            "signing_key_id": key_id,
+        }
+        payload = signing_payload(seal)
+        if algorithm == ED25519:
+            seal["signature"] = base64.b64encode(self._ed25519.sign(payload)).decode()
+        else:
+            seal["signature"] = hmac.new(self._hmac_secret, payload, hashlib.sha256).hexdigest()
+        return seal
+
+class RevocationList:
+    """
+    Revoked seal_ids held as a set. Backed by an optional text file (one seal_id per line,
+    # comments) that is re-read at most every refresh_s and only when its mtime changes,
+    so a check is a set lookup.
+    """
+    def __init__(self, path: str = None, refresh_s: float = 5.0):
+        self.path = path
+        self.refresh_s = refresh_s
+        self._revoked = set()
+        self._mtime = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+        self._reload()
+
+    def __contains__(self, seal_id: str) -> bool:
+        if self.path and time.monotonic() - self._checked >= self.refresh_s:
+            self._reload()
+        return seal_id in self._revoked
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    def revoke(self, seal_id: str):
+        with self._lock:
+            if seal_id in self._revoked:
+                return
+            self._revoked.add(seal_id)
+            if self.path:
+                with open(self.path, "a") as f:
+                    f.write(seal_id + "\n")
+                self._mtime = os.stat(self.path).st_mtime
+
+    def _reload(self):
+        with self._lock:
+            self._checked = time.monotonic()
+            if not self.path or not os.path.exists(self.path):
+                return
+            mtime = os.stat(self.path).st_mtime
+            if mtime == self._mtime:
+                return
+            with open(self.path) as f:
+                self._revoked = {line.strip() for line in f if line.strip() and not line.startswith("#")}
+            self._mtime = mtime
+
+@dataclass
+class SealCheck:
+    valid: bool
+    reason: str  # "ok" or why the seal was rejected
+    seal_id: Optional[str] = None
+
+class SealVerifier:
+    """
+    Offline seal verification for execution gates. Checks the signature and, when the
+    caller supplies the SHA-256 of the design it is about to run (or its canonical
+    design_hash), that the seal covers exactly that design; the design itself is never
+    parsed. manifest_matches() rechecks a seal against the full admissibility report.
+    Digest and HMAC comparisons are constant-time.
+    Args:
+        public_keys: signing_key_id -> base64 raw ed25519 public key (GET /seal/keys)
+        hmac_keys: signing_key_id -> shared secret, for sha256_manifest seals
+        revocations: RevocationList (or any container of revoked seal_ids)
+        allowed_policies: "policy_id@policy_version" strings accepted; None accepts any
+        min_admissibility: lowest admissibility_index accepted
+        cache_size: ed25519 signatures remembered as verified, so a seal gated repeatedly
+            pays for the public-key operation once
+    """
+    def __init__(self, public_keys: Dict[str, str] = None, hmac_keys: Dict[str, bytes] = None,
+                 revocations=None, allowed_policies: Iterable[str] = None, min_admissibility: float = 0.0,
+                 cache_size: int = 4096):
+        self._public_keys: Dict[str, Ed25519PublicKey] = {
+            key_id: Ed25519PublicKey.from_public_bytes(base64.b64decode(key))
+            for key_id, key in (public_keys or {}).items()
+        }
+        self._hmac_keys = dict(hmac_keys or {})
+        self.revocations = revocations if revocations is not None else RevocationList()
+        self.allowed_policies = frozenset(allowed_policies) if allowed_policies is not None else None
+        self.min_admissibility = min_admissibility
+        self.cache_size = cache_size
+        self._verified = set()
+
+    def verify(self, seal: Dict, design_payload_sha256: str = None, now: datetime = None,
+               design_hash: str = None) -> SealCheck:
+        seal_id = seal.get("seal_id")
+        try:
+            if seal.get("seal_version") != SEAL_VERSION:
+                return SealCheck(False, "unsupported seal_version", seal_id)
+            if seal_id in self.revocations:
+                return SealCheck(False, "seal revoked", seal_id)
+            if not self._signature_valid(seal):
+                return SealCheck(False, "invalid signature", seal_id)
+            if design_payload_sha256 is not None and not hmac.compare_digest(
+                    seal["design_payload_sha256"].lower(), design_payload_sha256.lower()):
+                return SealCheck(False, "design payload does not match seal", seal_id)
+            if design_hash is not None and not hmac.compare_digest(seal["design_hash"], design_hash):
+                return SealCheck(False, "design hash does not match seal", seal_id)
+            expires = seal.get("expires_at_utc")
+            if expires and _parse_utc(expires) <= (now or datetime.now(timezone.utc)):
+                return SealCheck(False, "seal expired", seal_id)
+            if seal["decision"] not in SEALED_DECISIONS:
+                return SealCheck(False, f"decision {seal['decision']} not admissible", seal_id)
+            if (self.allowed_policies is not None
+                    and f"{seal['policy_id']}@{seal['policy_version']}" not in self.allowed_policies):
+                return SealCheck(False, "policy not accepted", seal_id)
+            if seal["admissibility_index"] < self.min_admissibility:
+                return SealCheck(False, "admissibility below threshold", seal_id)
+        except (KeyError, TypeError, ValueError) as e:
+            return SealCheck(False, f"malformed seal: {e}", seal_id)
+        return SealCheck(True, "ok", seal_id)
+
+    def verify_many(self, items: Iterable[Dict], now: datetime = None) -> List[SealCheck]:
+        """items: {"seal": {...}, "design_payload_sha256": "...", "design_hash": "..."} each; one clock read for the batch"""
+        now = now or datetime.now(timezone.utc)
+        return [self.verify(item["seal"], item.get("design_payload_sha256"), now, item.get("design_hash"))
+                for item in items]
+
+    @staticmethod
+    def manifest_matches(seal: Dict, admissibility: Dict) -> bool:
+        """True when the seal's manifest_sha256 is that of its design and this admissibility report"""
+        try:
+            manifest = seal_manifest(seal["design_payload_sha256"], seal["design_hash"], admissibility)
+        except (KeyError, TypeError):
+            return False
+        return hmac.compare_digest(sha256_hex(canonical_json(manifest)), seal["manifest_sha256"])
+
+    def _signature_valid(self, seal: Dict) -> bool:
+        key_id = seal["signing_key_id"]
+        if seal["algorithm"] == ED25519:
+            key = self._public_keys.get(key_id)
+            if key is None:
+                return False
+            payload = signing_payload(seal)
+            # The payload digest is part of the key, so a tampered seal never hits
+            cache_key = (key_id, seal["signature"], hashlib.sha256(payload).digest())
+            if cache_key in self._verified:
+                return True
+            try:
+                key.verify(base64.b64decode(seal["signature"]), payload)
+            except (InvalidSignature, ValueError):
+                return False
+            if len(self._verified) >= self.cache_size:
+                self._verified.clear()
+            self._verified.add(cache_key)
+            return True
+        if seal["algorithm"] == HMAC_SHA256:
+            secret = self._hmac_keys.get(key_id)
+            if secret is None:
+                return False
+            expected = hmac.new(secret, signing_payload(seal), hashlib.sha256).hexdigest()
+            return hmac.compare_digest(expected, seal["signature"])
+        return False
+
+def _parse_utc(value: str) -> datetime:
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
@@ -0,0 +1,142 @@
+"""
+Glassbox Bio Sequence Analysis Kernel
+Single-pass profile of a sequence shared by all pre-execution checks
+"""
+from dataclasses import dataclass, field
+from typing import List, Set
+import numpy as np
+from glassbox_validator.pattern_matcher import PatternHit, PatternMatcher
+
+_UPPER = bytes.maketrans(b"abcdefghijklmnopqrstuvwxyz", b"ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+_GC = np.frombuffer(b"GCgc", dtype=np.uint8)
+_TWO_BIT = np.full(256, 4, dtype=np.uint8)  # 4 marks a base that cannot be packed
+for _code, _base in enumerate(b"ACGT"):
+    _TWO_BIT[_base] = _code
+_PACKED_BASES = 32  # bases that fit losslessly in one uint64
+
+@dataclass(frozen=True)
+class RepeatRegion:
+    """Run of positions whose k-mer occurs at least min_count times in the sequence"""
+    start: int
+    length: int
+    copies: int
+
+    def describe(self) -> str:
+        return f"{self.start}-{self.start + self.length} ({self.length} bp, {self.copies} copies)"
+
+@dataclass
+class SequenceProfile:
+    """Everything the sequence checks need, computed once per Sequence"""
+    identity: str
+    display_id: str
+    length: int
+    invalid_chars: Set[str]
+    gc_fraction: float
+    repeats: List[RepeatRegion] = field(default_factory=list)
+    pattern_hits: List[PatternHit] = field(default_factory=list)
+
+    @property
+    def has_repeats(self) -> bool:
+        return bool(self.repeats)
+
+    def matched_ids(self, prefix: str = "") -> List[str]:
+        """Distinct pattern IDs hit in this sequence, optionally filtered by ID prefix"""
+        return list(dict.fromkeys(h.pattern_id for h in self.pattern_hits if h.pattern_id.startswith(prefix)))
+
+def analyze_sequence(identity: str, display_id: str, elements, allowed: Set[str],
+                     matcher: PatternMatcher, repeat_window: int = 20,
+                     repeat_min_count: int = 2) -> SequenceProfile:
+    """
+    Profile a sequence from its str/bytes elements.
+    One byte buffer and one character histogram cover length, invalid characters and
+    GC fraction; the pattern automaton and repeat detector each make one further pass.
+    """
+    present = None
+    if isinstance(elements, str):
+        data = elements.encode("ascii", "replace")
+        if not elements.isascii():
+            present = set(elements)  # rare path: keep the real non-ASCII characters for the report
+    else:
+        data = bytes(elements)
+    counts = np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+    if present is None:
+        present = {chr(b) for b in np.flatnonzero(counts)}
+    length = len(data)
+    gc = int(counts[_GC].sum())
+    return SequenceProfile(
+        identity=identity,
+        display_id=display_id,
+        length=length,
+        invalid_chars=present - allowed,
+        gc_fraction=gc / length if length else 0.0,
+        repeats=find_repeats(data.translate(_UPPER), repeat_window, repeat_min_count),
+        pattern_hits=matcher.scan(data),
+    )
+
+def find_repeats(data: bytes, window: int = 20, min_count: int = 2) -> List[RepeatRegion]:
+    """
+    Locate repeated k-mers in an uppercase byte buffer.
+    Each window is packed 2 bits per base into a uint64 and rolled forward with
+    vectorized shifts, so memory stays O(len(data)) with no per-position slices.
+    Windows up to 32 bp pack losslessly; longer windows combine the packed head and
+    tail as a hash and candidate groups are verified against the raw bytes.
+    Windows containing non-ACGT characters are skipped.
+    """
+    n_windows = len(data) - window + 1
+    if window <= 0 or n_windows < min_count:
+        return []
+    codes = _TWO_BIT[np.frombuffer(data, dtype=np.uint8)]
+    unpackable = np.concatenate(([0], np.cumsum(codes == 4)))
+    valid = (unpackable[window:] - unpackable[:-window]) == 0
+    packed_bases = min(window, _PACKED_BASES)
+    kmers = _pack_kmers(codes, packed_bases, len(data) - packed_bases + 1)
+    keys = kmers[:n_windows]
+    if window > _PACKED_BASES:
+        keys = keys ^ (kmers[window - packed_bases:] * np.uint64(0x9E3779B97F4A7C15))
+    positions = np.flatnonzero(valid)
+    if len(positions) < min_count:
+        return []
+    _, inverse, counts = np.unique(keys[positions], return_inverse=True, return_counts=True)
+    copies = np.zeros(n_windows, dtype=np.int64)
+    copies[positions] = counts[inverse]
+    if window > _PACKED_BASES:
+        copies = _verify_hashed_windows(data, window, positions, inverse, counts, copies, min_count)
+    return _merge_repeat_runs(copies, window, min_count)
+
+def _pack_kmers(codes: np.ndarray, k: int, count: int) -> np.ndarray:
+    """Rolling 2-bit encoding of every k-mer (k <= 32); unpackable bases encode as 0"""
+    clean = np.where(codes == 4, 0, codes).astype(np.uint64)
+    kmers = np.zeros(count, dtype=np.uint64)
+    for offset in range(k):
+        kmers <<= np.uint64(2)
+        kmers |= clean[offset:offset + count]
+    return kmers
+
+def _verify_hashed_windows(data: bytes, window: int, positions: np.ndarray, inverse: np.ndarray,
+                           counts: np.ndarray, copies: np.ndarray, min_count: int) -> np.ndarray:
+    """Recount hash groups that reach min_count by exact byte comparison"""
+    order = np.argsort(inverse, kind="stable")
+    groups = np.split(positions[order], np.cumsum(counts)[:-1])
+    for group in np.flatnonzero(counts >= min_count).tolist():
+        members = groups[group]
+        exact = {}
+        for pos in members.tolist():
+            exact.setdefault(data[pos:pos + window], []).append(pos)
+        if len(exact) > 1:
+            for same in exact.values():
+                copies[same] = len(same)
+    return copies
+
+def _merge_repeat_runs(copies: np.ndarray, window: int, min_count: int) -> List[RepeatRegion]:
+    """Merge consecutive repeated windows into regions spanning their bases"""
+    repeated = np.flatnonzero(copies >= min_count)
+    if not len(repeated):
+        return []
+    breaks = np.flatnonzero(np.diff(repeated) > 1)
+    run_starts = np.concatenate(([0], breaks + 1))
+    run_ends = np.concatenate((breaks, [len(repeated) - 1]))
+    regions = []
+    for first, last in zip(run_starts.tolist(), run_ends.tolist()):
+        start, end = int(repeated[first]), int(repeated[last])
+        regions.append(RepeatRegion(start, end - start + window, int(copies[start:end + 1].max())))
+    return regions
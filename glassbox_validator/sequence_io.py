@@ -0,0 +1,98 @@
+"""
+Glassbox Bio Sequence Input Helpers
+Read raw sequence files (FASTA, GenBank) into SequenceRecords for sequence-level validation
+"""
+import mmap
+import os
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple
+from glassbox_validator.pre_execution import SequenceRecord
+
+FASTA = "fasta"
+GENBANK = "genbank"
+_WHITESPACE = b" \t\r\n"
+_GENBANK_NOISE = b" \t\r\n0123456789/"  # ORIGIN lines carry position numbers
+_RECORD_START = {FASTA: b"\n>", GENBANK: b"\nLOCUS"}
+
+@contextmanager
+def open_mapped(path: str):
+    """Read-only mmap of a file (b"" when empty); pages are loaded on access, not up front"""
+    if os.path.getsize(path) == 0:
+        yield b""
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        yield data
+
+def sniff_sequence_format(data) -> str:
+    head = bytes(data[:4096]).lstrip()
+    if head.startswith(b">"):
+        return FASTA
+    if head.startswith(b"LOCUS"):
+        return GENBANK
+    raise ValueError("Not a FASTA or GenBank file")
+
+def iter_records(data, fmt: str = None, was_generated_by: Optional[str] = None) -> Iterator[SequenceRecord]:
+    fmt = fmt or sniff_sequence_format(data)
+    if fmt == FASTA:
+        return iter_fasta(data, was_generated_by)
+    if fmt == GENBANK:
+        return iter_genbank(data, was_generated_by)
+    raise ValueError(f"Unknown sequence format: {fmt}")
+
+def shard_offsets(data, fmt: str, shard_bytes: int) -> Iterator[Tuple[int, int]]:
+    """
+    Split a buffer into consecutive (start, end) ranges of whole records of roughly
+    shard_bytes each. Only one search per shard, so a multi-GB mmap is never scanned
+    record by record in the caller.
+    """
+    marker = _RECORD_START[fmt]
+    start, size = 0, len(data)
+    while start < size:
+        end = data.find(marker, min(start + shard_bytes, size))
+        end = size if end == -1 else end + 1
+        yield start, end
+        start = end
+
+def iter_fasta(data, was_generated_by: Optional[str] = None) -> Iterator[SequenceRecord]:
+    """
+    Records of a FASTA buffer (bytes or any bytes-like object supporting find and slicing).
+    The header up to its first whitespace is the record's display_id; sequence lines are
+    joined with whitespace removed and kept as bytes. was_generated_by applies to every record.
+    """
+    start = data.find(b">")
+    index = 0
+    while start != -1:
+        header_end = data.find(b"\n", start)
+        if header_end == -1:
+            header_end = len(data)
+        header = bytes(data[start + 1:header_end]).strip().decode("utf-8", "replace")
+        next_start = data.find(b"\n>", header_end)
+        body_end = len(data) if next_start == -1 else next_start
+        elements = bytes(data[header_end:body_end]).translate(None, _WHITESPACE)
+        display_id = header.split(None, 1)[0] if header else f"record_{index}"
+        yield SequenceRecord(display_id, elements, was_generated_by=was_generated_by)
+        index += 1
+        start = -1 if next_start == -1 else next_start + 1
+
+def iter_genbank(data, was_generated_by: Optional[str] = None) -> Iterator[SequenceRecord]:
+    """
+    Records of a GenBank flat-file buffer: the LOCUS name is the display_id and the
+    ORIGIN block, stripped of position numbers and spacing, the elements (bytes).
+    """
+    start = data.find(b"LOCUS")
+    index = 0
+    while start != -1:
+        end = data.find(b"\n//", start)
+        stop = len(data) if end == -1 else end
+        header_end = data.find(b"\n", start, stop)
+        fields = bytes(data[start:stop if header_end == -1 else header_end]).split()
+        display_id = fields[1].decode("utf-8", "replace") if len(fields) > 1 else f"record_{index}"
+        elements = b""
+        origin = data.find(b"\nORIGIN", start, stop)
+        if origin != -1:
+            body = data.find(b"\n", origin + 1, stop)
+            if body != -1:
+                elements = bytes(data[body:stop]).translate(None, _GENBANK_NOISE)
+        yield SequenceRecord(display_id, elements, was_generated_by=was_generated_by)
+        index += 1
+        start = -1 if end == -1 else data.find(b"LOCUS", end)
@@ -2,20 +2,43 @@
 Glassbox + Benchling Integration
 Validates AI-generated sequences before Benchling registration
 """
+import uuid
+from collections import deque
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Tuple
 from benchling_sdk import Benchling
-from glassbox_validator.pre_execution import PreExecutionValidator
-import requests
+from glassbox_validator.http_client import GlassboxClient
+from glassbox_validator.pre_execution import PreExecutionValidator, SequenceRecord
+
+# Sequences per dna_sequences.bulk_create call (Benchling caps bulk requests)
+BULK_CREATE_CHUNK = 500
+SKIPPED_UPLOAD = "not uploaded: an earlier bulk_create chunk failed"
+
+@dataclass
+class BulkRegistration:
+    """
+    Outcome of register_many(): Benchling ids of registered sequences, errors of rejected
+    ones, and the upload error of valid sequences that were not registered
+    """
+    registered: Dict[str, str] = field(default_factory=dict)  # name -> Benchling sequence id
+    rejected: Dict[str, List[str]] = field(default_factory=dict)  # name -> validation errors
+    failed: Dict[str, str] = field(default_factory=dict)  # name -> bulk_create error
+    design_hashes: Dict[str, str] = field(default_factory=dict)  # name -> Glassbox design hash
 
 class GlassboxBenchlingBridge:
     """
     Middleware layer between AI design systems and Benchling ELN
     """
-    def __init__(self, benchling_api_key: str, benchling_tenant: str, glassbox_api_url: str):
-        self.benchling = Benchling(
+    def __init__(self, benchling_api_key: str, benchling_tenant: str, glassbox_api_url: str,
+                 benchling=None):
+        # benchling: pre-built client, e.g. LocalBenchlingStub() to run without a tenant
+        self.benchling = benchling or Benchling(
             url=f"https://{benchling_tenant}.benchling.com",
             auth_token=benchling_api_key
         )
         self.glassbox_url = glassbox_api_url
+        self.glassbox = GlassboxClient.from_env(glassbox_api_url)
         self.validator = PreExecutionValidator()
 
     def register_validated_sequence(self, sequence: str, name: str, folder_id: str) -> str:
@@ -24,8 +47,7 @@ class GlassboxBenchlingBridge:
         Returns:
         Benchling DNA sequence ID if successful
         """
-        sbol_data = self._convert_to_sbol(sequence, name)
-        validation_result = self._validate_with_glassbox(sbol_data)
+        validation_result = self._validate_with_glassbox(sequence, name)
         if not validation_result["is_valid"]:
             raise ValueError(f"Glassbox validation failed: {validation_result['errors']}")
         dna_sequence = self.benchling.dna_sequences.create(
@@ -40,31 +62,134 @@ class GlassboxBenchlingBridge:
         )
         return dna_sequence.id
 
+    def register_many(self, sequences: Iterable[Tuple[str, str]], folder_id: str,
+                      was_generated_by: str = None, max_workers: int = None,
+                      chunk_size: int = BULK_CREATE_CHUNK) -> BulkRegistration:
+        """
+        Bulk path for generator output: validate (name, bases) pairs in-process with the
+        sequence-level validator, spread across a process pool, and register the passing
+        ones with dna_sequences.bulk_create, chunk_size at a time. No SBOL is built and
+        Glassbox is not called over the network; each chunk uploads while the next one
+        is being validated. After a chunk fails to upload no further chunks are submitted:
+        its sequences and every later valid one are recorded in failed, and the sequences
+        registered so far are still returned.
+        Args:
+            was_generated_by: generating model/activity URI recorded as AI provenance
+        """
+        outcome = BulkRegistration()
+        sequences = list(sequences)  # the pool submits every record up front anyway
+        records = [SequenceRecord(f"design_{name}", bases, f"seq_{name}", was_generated_by)
+                   for name, bases in sequences]
+        results = self.validator.validate_many(records, max_workers=max_workers, chunksize=64)
+        uploads = deque()  # (chunk, future) in submission order
+
+        def collect(wait: bool):
+            while uploads and (wait or uploads[0][1].done()):
+                chunk, upload = uploads.popleft()
+                try:
+                    outcome.registered.update(upload.result())
+                    continue
+                except CancelledError:
+                    error = SKIPPED_UPLOAD
+                except Exception as e:
+                    error = f"{type(e).__name__}: {e}"
+                    for _, queued in uploads:
+                        queued.cancel()
+                outcome.failed.update((entry["name"], error) for entry in chunk)
+
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            def submit(chunk):
+                collect(wait=False)
+                if outcome.failed:
+                    outcome.failed.update((entry["name"], SKIPPED_UPLOAD) for entry in chunk)
+                else:
+                    uploads.append((chunk, writer.submit(self._bulk_create, chunk)))
+
+            chunk = []
+            for (name, bases), result in zip(sequences, results):
+                if not result.is_valid:
+                    outcome.rejected[name] = result.errors
+                    continue
+                outcome.design_hashes[name] = result.design_hash
+                chunk.append(self._bulk_sequence(name, bases, folder_id, result))
+                if len(chunk) >= chunk_size:
+                    submit(chunk)
+                    chunk = []
+            if chunk:
+                submit(chunk)
+            collect(wait=True)
+        return outcome
+
+    def _bulk_sequence(self, name: str, bases: str, folder_id: str, validation) -> Dict:
+        return {
+            "name": name,
+            "bases": bases,
+            "folder_id": folder_id,
+            "custom_fields": {
+                "Glassbox Validation Status": "PASSED",
+                "Glassbox Design Hash": validation.design_hash,
+                "Validation Timestamp": validation.validation_timestamp
+            }
+        }
+
+    def _bulk_create(self, chunk: List[Dict]) -> Dict[str, str]:
+        task = self.benchling.dna_sequences.bulk_create(chunk)
+        created = task.wait_for_response().dna_sequences
+        return {seq.name: seq.id for seq in created}
+
     def validate_benchling_sequence(self, sequence_id: str) -> dict:
         dna_seq = self.benchling.dna_sequences.get_by_id(sequence_id)
-        sbol_data = self._convert_to_sbol(dna_seq.bases, dna_seq.name)
-        return self._validate_with_glassbox(sbol_data)
-
-    def _convert_to_sbol(self, sequence: str, name: str) -> bytes:
-        import pySBOL3
-        doc = pySBOL3.Document()
-        component = pySBOL3.Component(f"design_{name}", pySBOL3.SBO_DNA)
-        component.name = name
-        seq = pySBOL3.Sequence(f"seq_{name}")
-        seq.elements = sequence
-        seq.encoding = pySBOL3.IUPAC_DNA_ENCODING
-        component.sequences = [seq]
-        doc.add(component)
-        doc.add(seq)
-        return doc.write_string().encode()
-
-    def _validate_with_glassbox(self, sbol_data: bytes) -> dict:
-        response = requests.post(
-            f"{self.glassbox_url}/validate/design",
-            files={"sbol_le": ("design.sbol", sbol_data)}
+        return self._validate_with_glassbox(dna_seq.bases, dna_seq.name)
+
+    def _validate_with_glassbox(self, sequence: str, name: str) -> dict:
+        """Sequence-level validation: same findings as the design_<name>/seq_<name> SBOL design"""
+        response = self.glassbox.post(
+            "/validate/sequences",
+            json={"records": [{"id": f"design_{name}", "sequence": sequence, "sequence_id": f"seq_{name}"}]},
+            idempotent=True
         )
         response.raise_for_status()
-        return response.json()
+        return response.json()["results"][0]
+
+class LocalBenchlingStub:
+    """
+    In-memory stand-in for the Benchling client covering the dna_sequences calls this
+    bridge makes (create, get_by_id, bulk_create), for tests and dry runs.
+    """
+    def __init__(self):
+        self.dna_sequences = _StubDnaSequences()
+
+@dataclass
+class _StubSequence:
+    id: str
+    name: str
+    bases: str
+    folder_id: str
+    custom_fields: Dict = field(default_factory=dict)
+
+@dataclass
+class _StubTask:
+    dna_sequences: List[_StubSequence]
+
+    def wait_for_response(self) -> "_StubTask":
+        return self
+
+class _StubDnaSequences:
+    def __init__(self):
+        self.by_id: Dict[str, _StubSequence] = {}
+        self.bulk_calls = 0
+
+    def create(self, name: str, bases: str, folder_id: str, custom_fields: Dict = None) -> _StubSequence:
+        seq = _StubSequence(f"seq_{uuid.uuid4().hex[:12]}", name, bases, folder_id, dict(custom_fields or {}))
+        self.by_id[seq.id] = seq
+        return seq
+
+    def get_by_id(self, sequence_id: str) -> _StubSequence:
+        return self.by_id[sequence_id]
+
+    def bulk_create(self, dna_sequences: Iterable[Dict]) -> _StubTask:
+        self.bulk_calls += 1
+        return _StubTask([self.create(**spec) for spec in dna_sequences])
 
 if __name__ == "__main__":
     bridge = GlassboxBenchlingBridge(
@@ -3,7 +3,9 @@ Glassbox + Opentrons Integration
 Validate designs before Opentrons protocol execution
 """
 from opentrons import protocol_api
-import requests
+from glassbox_validator.http_client import GlassboxClient
+from glassbox_validator.seal import SealVerifier
+import hashlib
 import json
 
 class GlassboxOpentronsProtocol:
@@ -12,13 +14,16 @@ class GlassboxOpentronsProtocol:
     """
     def __init__(self, glassbox_api_url: str):
         self.glassbox_url = glassbox_api_url
+        self.glassbox = GlassboxClient.from_env(glassbox_api_url)
         self.validation_results = []
+        self._seal_verifier = None
 
     def validate_design(self, sbol_le_path: str) -> bool:
         with open(sbol_le_path, 'rb') as f:
-            response = requests.post(
-                f"{self.glassbox_url}/validate/design",
-                files={"sbol_le": f}
+            response = self.glassbox.post(
+                "/validate/design",
+                files={"sbol_le": f},
+                idempotent=True
             )
             result = response.json()
             self.validation_results.append(result)
@@ -30,10 +35,49 @@ class GlassboxOpentronsProtocol:
             print(f"✅ Design validated. Hash: {result['design_hash']}")
             return True
 
+    def validate_designs(self, sbol_le_paths: list) -> bool:
+        """Validate all designs in one /validate/design/batch request; stops at the first failure"""
+        files = [("sbol_les", (path, open(path, 'rb'))) for path in sbol_le_paths]
+        try:
+            with self.glassbox.post("/validate/design/batch", files=files, stream=True, idempotent=True) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    result = json.loads(line)
+                    if "summary" in result:
+                        print(f"✅ {result['summary']['valid']} designs validated")
+                        return True
+                    self.validation_results.append(result)
+                    if not result["is_valid"]:
+                        print(f"❌ VALIDATION FAILED: {result['name']}")
+                        for error in result["errors"]:
+                            print(f" {error}")
+                        return False
+            return False
+        finally:
+            for _, (_, f) in files:
+                f.close()
+
+    def verify_seals(self, sbol_le_paths: list, seals: list) -> bool:
+        """
+        Gate on seals issued by an earlier policy validation instead of re-validating.
+        Each design file is hashed and checked against its seal offline with the
+        gateway's public keys; nothing is uploaded.
+        """
+        if self._seal_verifier is None:
+            keys = self.glassbox.get("/seal/keys").json()["keys"]
+            self._seal_verifier = SealVerifier({key_id: key["public_key"] for key_id, key in keys.items()})
+        for path, seal in zip(sbol_le_paths, seals):
+            with open(path, 'rb') as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            check = self._seal_verifier.verify(seal, digest)
+            if not check.valid:
+                print(f"❌ SEAL REJECTED: {path} ({check.reason})")
+                return False
+        return len(seals) == len(sbol_le_paths)
+
     def run_with_validation(self, protocol: protocol_api.ProtocolContext, design_les: list):
-        for design_le in design_les:
-            if not self.validate_design(design_le):
-                raise ValueError(f"Design validation failed: {design_le}")
+        if not self.validate_designs(design_les):
+            raise ValueError(f"Design validation failed: {design_les}")
         print(" Starting Opentrons protocol...")
         return self.execute_protocol(protocol)
 
@@ -55,10 +99,9 @@ def run(protocol: protocol_api.ProtocolContext):
         "/data/designs/gfp_optimized.sbol",
         "/data/designs/terminator_b0015.sbol"
     ]
-    for design in designs_to_validate:
-        if not validator.validate_design(design):
-            protocol.comment("❌ PROTOCOL ABORTED: Design validation failed")
-            return
+    if not validator.validate_designs(designs_to_validate):
+        protocol.comment("❌ PROTOCOL ABORTED: Design validation failed")
+        return
     protocol.comment("✅ All designs validated. Proceeding with assembly...")
     tips = protocol.load_labware('opentrons_96_tiprack_300ul', 1)
     plate = protocol.load_labware('nest_96_wellplate_200ul_at', 2)
@@ -2,31 +2,44 @@
 Glassbox + Strateos/Transcriptic Integration
 Validates Autoprotocol before submission to cloud lab
 """
+import hashlib
 import json
-import requests
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from typing import Dict, List
+from glassbox_validator.http_client import GlassboxClient
+from glassbox_validator.result_cache import ResultCache
+
+class _Aborted(Exception):
+    """A design task skipped because another design already blocked the submission"""
 
 class GlassboxStrateosGateway:
     """
-    Pre-execution validation gateway for Strateos protocols
+    Pre-execution validation gateway for Strateos protocols.
+    Referenced designs are fetched and validated concurrently, max_parallel at a time.
+    Fetched SBOL is revalidated with If-None-Match against its ETag, and verdicts are
+    cached by SBOL content hash, so designs shared across protocols are validated once.
     """
-    def __init__(self, glassbox_api_url: str, strateos_api_key: str):
+    def __init__(self, glassbox_api_url: str, strateos_api_key: str, max_parallel: int = 8):
         self.glassbox_url = glassbox_api_url
         self.strateos_headers = {
             "X-User-Email": "your-email@example.com",
             "X-User-Token": strateos_api_key,
             "Content-Type": "application/json"
         }
+        self.max_parallel = max_parallel
+        self.glassbox = GlassboxClient.from_env(glassbox_api_url, pool_size=max_parallel)
+        self.strateos = GlassboxClient("https://secure.transcriptic.com/api", headers=self.strateos_headers)
+        self.designs = GlassboxClient(pool_size=max_parallel)  # SBOL documents referenced by absolute URI
+        # uri -> (etag, content), least recently used evicted; entries are revalidated on use, so the TTL is long
+        self._sbol_by_uri = ResultCache(max_entries=4096, ttl_s=24 * 3600)
+        self._verdicts = ResultCache(max_entries=4096, ttl_s=3600)  # sha256(content) -> validation
 
     def submit_validated_protocol(self, autoprotocol: Dict, project_id: str) -> str:
         validation_errors = self._validate_autoprotocol_structure(autoprotocol)
         if validation_errors:
             raise ValueError(f"Protocol errors: {validation_errors}")
-        sbol_refs = self._extract_sbol_references(autoprotocol)
-        for sbol_uri in sbol_refs:
-            result = self._validate_design(sbol_uri)
-            if not result["is_valid"]:
-                raise ValueError(f"Design {sbol_uri} validation failed: {result['errors']}")
+        self.validate_designs(self._extract_sbol_references(autoprotocol))
         run_id = self._submit_to_strateos(autoprotocol, project_id)
         print(f"✓ Protocol validated and submitted. Run ID: {run_id}")
         return run_id
@@ -51,24 +64,82 @@ class GlassboxStrateosGateway:
                 sbol_refs.append(instruction["design_uri"])
         return sbol_refs
 
-    def _validate_design(self, sbol_uri: str) -> Dict:
-        sbol_response = requests.get(sbol_uri)
-        sbol_data = sbol_response.content
-        response = requests.post(
-            f"{self.glassbox_url}/validate/design",
-            files={"sbol_le": ("design.sbol", sbol_data)}
+    def validate_designs(self, sbol_uris: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch and validate every distinct URI concurrently; raises ValueError on the first
+        invalid design (or the first fetch/API error), without waiting for the rest.
+        Returns uri -> validation result when all designs pass.
+        """
+        uris = list(dict.fromkeys(sbol_uris))
+        if not uris:
+            return {}
+        abort = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=min(self.max_parallel, len(uris)))
+        try:
+            futures = {pool.submit(self._checked_design, uri, abort): uri for uri in uris}
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            failed = next((f for f in done if f.exception() is not None), None)
+            if failed is not None:
+                abort.set()
+                raise failed.exception()
+            return {futures[f]: f.result() for f in futures}
+        finally:
+            # Do not wait for in-flight requests after a failure; queued designs are dropped
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _checked_design(self, sbol_uri: str, abort: threading.Event) -> Dict:
+        if abort.is_set():
+            raise _Aborted(sbol_uri)
+        result = self._validate_design(sbol_uri, abort)
+        if not result["is_valid"]:
+            raise ValueError(f"Design {sbol_uri} validation failed: {result['errors']}")
+        return result
+
+    def _validate_design(self, sbol_uri: str, abort: threading.Event = None) -> Dict:
+        sbol_data = self._fetch_sbol(sbol_uri)
+        digest = hashlib.sha256(sbol_data).hexdigest()
+        result = self._verdicts.get(digest)
+        if result is not None:
+            return result
+        if abort is not None and abort.is_set():
+            raise _Aborted(sbol_uri)
+        response = self.glassbox.post(
+            "/validate/design",
+            files={"sbol_le": ("design.sbol", sbol_data)},
+            idempotent=True  # validation has no side effects, so a resend is harmless
         )
         response.raise_for_status()
-        return response.json()
+        result = response.json()
+        self._verdicts.put(digest, result)
+        return result
+
+    def _fetch_sbol(self, sbol_uri: str) -> bytes:
+        """
+        GET the design, revalidating a previously fetched copy by ETag (304 reuses it).
+        A 304 to a request that sent no If-None-Match has no body to validate and is an error.
+        """
+        cached = self._sbol_by_uri.get(sbol_uri)
+        headers = {"If-None-Match": cached[0]} if cached is not None else {}
+        response = self.designs.get(sbol_uri, endpoint="design_uri", headers=headers)
+        if response.status_code == 304:
+            if cached is None:
+                raise ValueError(f"Design {sbol_uri}: 304 Not Modified without a cached copy")
+            return cached[1]
+        response.raise_for_status()
+        etag = response.headers.get("ETag")
+        if etag:
+            self._sbol_by_uri.put(sbol_uri, (etag, response.content))
+        return response.content
 
     def _submit_to_strateos(self, protocol: Dict, project_id: str) -> str:
-        response = requests.post(
-            "https://secure.transcriptic.com/api/runs",
-            headers=self.strateos_headers,
+        # A resent run submission would start a second run, so it is never retried
+        response = self.strateos.post(
+            "/runs",
             json={
                 "project_id": project_id,
                 "protocol": protocol
-            }
+            },
+            attempts=1
         )
         response.raise_for_status()
         return response.json()["id"]
@@ -2,10 +2,9 @@
 Glassbox + TeselaGen Integration
 Bidirectional validation between TeselaGen LIMS and Glassbox
 """
-import requests
 import json
 from typing import Dict, List
-import pySBOL3
+from glassbox_validator.http_client import GlassboxClient
 
 class GlassboxTeselaGenBridge:
     """
@@ -18,11 +17,12 @@ class GlassboxTeselaGenBridge:
             "Content-Type": "application/json"
         }
         self.glassbox_url = glassbox_api_url
+        self.teselagen = GlassboxClient(teselagen_url, headers=self.teselagen_headers)
+        self.glassbox = GlassboxClient.from_env(glassbox_api_url)
 
     def validate_teselagen_design(self, design_id: str) -> Dict:
         design_data = self._fetch_teselagen_design(design_id)
-        sbol_data = self._convert_teselagen_to_sbol(design_data)
-        validation_result = self._validate_with_glassbox(sbol_data)
+        validation_result = self._validate_with_glassbox(self._teselagen_sequence_record(design_data))
         self._update_teselagen_validation_status(design_id, validation_result)
         return validation_result
 
@@ -35,37 +35,27 @@ class GlassboxTeselaGenBridge:
         return validation
 
     def _fetch_teselagen_design(self, design_id: str) -> Dict:
-        response = requests.get(
-            f"{self.teselagen_url}/designs/{design_id}",
-            headers=self.teselagen_headers
-        )
+        response = self.teselagen.get(f"/designs/{design_id}", endpoint="/designs/{id}")
         response.raise_for_status()
         return response.json()
 
-    def _convert_teselagen_to_sbol(self, design_data: Dict) -> bytes:
-        doc = pySBOL3.Document()
-        component = pySBOL3.Component(design_data["id"], pySBOL3.SBO_DNA)
-        component.name = design_data["name"]
-        seq = pySBOL3.Sequence(f"seq_{design_data['id']}")
-        seq.elements = design_data["sequence"]
-        seq.encoding = pySBOL3.IUPAC_DNA_ENCODING
-        component.sequences = [seq]
-        doc.add(component)
-        doc.add(seq)
-        return doc.write_string().encode()
+    def _teselagen_sequence_record(self, design_data: Dict) -> Dict:
+        """/validate/sequences record for a design (Component <id> with Sequence seq_<id>)"""
+        return {
+            "id": design_data["id"],
+            "sequence": design_data["sequence"],
+            "sequence_id": f"seq_{design_data['id']}"
+        }
 
-    def _validate_with_glassbox(self, sbol_data: bytes) -> Dict:
-        response = requests.post(
-            f"{self.glassbox_url}/validate/design",
-            files={"sbol_le": ("design.sbol", sbol_data)}
-        )
+    def _validate_with_glassbox(self, record: Dict) -> Dict:
+        response = self.glassbox.post("/validate/sequences", json={"records": [record]}, idempotent=True)
         response.raise_for_status()
-        return response.json()
+        return response.json()["results"][0]
 
     def _update_teselagen_validation_status(self, design_id: str, validation: Dict):
-        requests.patch(
-            f"{self.teselagen_url}/designs/{design_id}",
-            headers=self.teselagen_headers,
+        self.teselagen.patch(
+            f"/designs/{design_id}",
+            endpoint="/designs/{id}",
             json={
                 "custom_fields": {
                     "glassbox_validation_status": "PASSED" if validation["is_valid"] else "FAILED",
@@ -76,10 +66,7 @@ class GlassboxTeselaGenBridge:
         )
 
     def _fetch_teselagen_experiment(self, experiment_id: str) -> Dict:
-        response = requests.get(
-            f"{self.teselagen_url}/experiments/{experiment_id}/results",
-            headers=self.teselagen_headers
-        )
+        response = self.teselagen.get(f"/experiments/{experiment_id}/results", endpoint="/experiments/{id}/results")
         response.raise_for_status()
         return response.json()
 
@@ -93,10 +80,8 @@ class GlassboxTeselaGenBridge:
         return json.dumps(allotrope)
 
     def _fetch_experiment_provenance(self, experiment_id: str) -> str:
-        response = requests.get(
-            f"{self.teselagen_url}/experiments/{experiment_id}/provenance.sbol",
-            headers=self.teselagen_headers
-        )
+        response = self.teselagen.get(f"/experiments/{experiment_id}/provenance.sbol",
+                                      endpoint="/experiments/{id}/provenance.sbol")
         response.raise_for_status()
         return response.text
 
@@ -105,17 +90,14 @@ class GlassboxTeselaGenBridge:
             "allotrope_le": ("data.json", allotrope_json),
             "sbol_provenance_le": ("provenance.sbol", provenance_sbol)
         }
-        response = requests.post(
-            f"{self.glassbox_url}/validate/data",
-            files=files
-        )
+        response = self.glassbox.post("/validate/data", files=files, idempotent=True)
         response.raise_for_status()
         return response.json()
 
     def _update_experiment_quality_score(self, experiment_id: str, quality_score: float):
-        requests.patch(
-            f"{self.teselagen_url}/experiments/{experiment_id}",
-            headers=self.teselagen_headers,
+        self.teselagen.patch(
+            f"/experiments/{experiment_id}",
+            endpoint="/experiments/{id}",
             json={
                 "quality_metrics": {
                     "glassbox_quality_score": quality_score
@@ -0,0 +1,75 @@
+"""Admissibility decisions under the shipped example policy"""
+import json
+import os
+import pytest
+from glassbox_validator.admissibility import Finding, ModuleResult, compile_policy
+
+POLICY_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           "examples", "policies", "design_gate_v1.json")
+CLEAN = "ATGCCGTAGGCTTACGATCGGATCCTAGCTAGGCTTAACGGATCGATTGCAAGTCCGATAGCTTGACCTAGG"
+
+@pytest.fixture(scope="module")
+def policy():
+    with open(POLICY_PATH) as f:
+        return json.load(f)
+
+@pytest.fixture(scope="module")
+def pre_execution():
+    return pytest.importorskip("glassbox_validator.pre_execution")  # needs pySBOL3
+
+@pytest.fixture(scope="module")
+def validator(pre_execution):
+    return pre_execution.PreExecutionValidator()
+
+def codes(findings):
+    return {f["code"] for f in findings}
+
+def test_clean_sequence_passes(policy, pre_execution, validator):
+    record = pre_execution.SequenceRecord("clean", CLEAN, was_generated_by="urn:model")
+    result = validator.validate_sequence(record, policy)
+    assert result.admissibility["decision"] == "pass"
+    assert result.is_valid and not result.errors
+
+@pytest.mark.parametrize("sequence, generated_by, decision, code", [
+    (CLEAN[:20] + "XX" + CLEAN[20:], "urn:model", "fail", "SEQ_INVALID_CHARS"),
+    ("ATGCA", "urn:model", "warn", "SEQ_TOO_SHORT"),
+    (CLEAN, None, "warn", "EVIDENCE_MISSING_PROVENANCE"),
+])
+def test_known_bad_sequences_do_not_pass(policy, pre_execution, validator, sequence, generated_by, decision, code):
+    record = pre_execution.SequenceRecord("bad", sequence, was_generated_by=generated_by)
+    result = validator.validate_sequence(record, policy)
+    assert result.admissibility["decision"] == decision
+    assert code in codes(result.admissibility["blocking_findings"])
+    assert not result.is_valid
+    assert result.errors
+
+def test_fail_on_code_overrides_the_index(policy):
+    plan = compile_policy(policy)
+    finding = Finding("SEQ_INVALID_CHARS", "Sequence contains invalid characters", "low", "sequence")
+    report = plan.run({
+        "sequence_integrity": lambda params: ModuleResult("sequence_integrity", [finding], score=100.0),
+        "biosafety": lambda params: ModuleResult("biosafety", []),
+    })
+    assert report.admissibility_index >= plan.pass_threshold
+    assert report.decision == "fail"
+    assert report.blocking_findings == [finding]
+
+def test_hard_fail_code_stops_the_run(policy):
+    plan = compile_policy(policy)
+    ran = []
+
+    def biosafety(params):
+        ran.append("biosafety")
+        return ModuleResult("biosafety", [Finding("BIOHAZARD_MATCH", "Restricted match", "critical", "biosafety")])
+
+    def integrity(params):
+        ran.append("sequence_integrity")
+        return ModuleResult("sequence_integrity", [])
+    report = plan.run({"biosafety": biosafety, "sequence_integrity": integrity})
+    assert report.decision == "fail" and report.hard_fail == "BIOHAZARD_MATCH"
+    assert ran == ["biosafety"]
+
+def test_missing_required_module_fails(policy):
+    report = compile_policy(policy).run({"biosafety": lambda params: ModuleResult("biosafety", [])})
+    assert report.decision == "fail"
+    assert codes(f.to_dict("F") for f in report.findings) == {"POLICY_REQUIRED_MODULE_MISSING"}
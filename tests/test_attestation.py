@@ -0,0 +1,70 @@
+"""Attestation store persistence, rotation and trusted-attestor checks"""
+import base64
+import json
+from datetime import datetime, timedelta, timezone
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from glassbox_validator.attestation import AttestationBypass, AttestationStore
+from glassbox_validator.seal import signing_payload
+
+KEY = Ed25519PrivateKey.generate()
+PUBLIC_KEY = base64.b64encode(KEY.public_key().public_bytes(serialization.Encoding.Raw,
+                                                            serialization.PublicFormat.Raw)).decode()
+NOW = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+def envelope(payload="a" * 64, issued=NOW - timedelta(days=1), expires=None, attestor="lab-audit", key=KEY):
+    env = {"attestor_id": attestor, "attestation_type": "wet_lab_audit", "attested_payload_sha256": payload,
+           "issued_at_utc": issued.strftime("%Y-%m-%dT%H:%M:%SZ"), "claims": {"modules": ["biosafety"]}}
+    if expires:
+        env["expires_at_utc"] = expires.strftime("%Y-%m-%dT%H:%M:%SZ")
+    env["signature"] = base64.b64encode(key.sign(signing_payload(env))).decode()
+    return env
+
+@pytest.fixture
+def bypass():
+    return AttestationBypass({"enabled": True, "mode": "partial_bypass", "max_age_days": 30, "trusted_attestors": [
+        {"attestor_id": "lab-audit", "allowed_types": ["wet_lab_audit"], "public_keys": [PUBLIC_KEY]}]})
+
+def test_bypass_accepts_only_trusted_valid_envelopes(bypass):
+    good = envelope()
+    assert bypass.match([good], NOW) is good
+    assert bypass.covered_modules(good) == frozenset({"biosafety"})
+    assert bypass.match([envelope(attestor="someone-else")], NOW) is None
+    assert bypass.match([envelope(key=Ed25519PrivateKey.generate())], NOW) is None
+    assert bypass.match([envelope(issued=NOW - timedelta(days=31))], NOW) is None
+    assert bypass.match([envelope(expires=NOW - timedelta(hours=1))], NOW) is None
+    tampered = dict(good, attested_payload_sha256="b" * 64)
+    assert bypass.match([tampered], NOW) is None
+
+def test_store_persists_and_skips_duplicates(tmp_path):
+    path = str(tmp_path / "attestations.jsonl")
+    store = AttestationStore(path)
+    env = envelope()
+    assert store.add(env)
+    generation = store.generation
+    assert not store.add(dict(env))
+    assert store.generation == generation
+    assert AttestationStore(path).lookup("A" * 64) == [env]
+
+def test_malformed_lines_are_skipped(tmp_path, capsys):
+    path = tmp_path / "attestations.jsonl"
+    env = envelope()
+    path.write_text("{not json\n" + json.dumps({"no": "payload"}) + "\n" + json.dumps(env) + "\n")
+    store = AttestationStore(str(path))
+    assert store.lookup("a" * 64) == [env]
+    assert "skipping malformed line 1" in capsys.readouterr().err
+
+def test_rotation_drops_expired_then_oldest(tmp_path):
+    path = str(tmp_path / "attestations.jsonl")
+    store = AttestationStore(path, max_entries=3)
+    expired = envelope("0" * 64, expires=NOW - timedelta(days=1))
+    older = [envelope(f"{i}" * 64, issued=NOW - timedelta(days=10 - i)) for i in range(1, 5)]
+    store.add(expired, NOW)
+    for env in older:
+        store.add(env, NOW)
+    assert len(store) == 3
+    assert store.lookup("0" * 64) == [] and store.lookup("1" * 64) == []
+    with open(path) as f:
+        assert [json.loads(line)["attested_payload_sha256"][0] for line in f] == ["2", "3", "4"]
+    assert len(AttestationStore(path)) == 3
@@ -0,0 +1,52 @@
+import json
+import random
+
+import pytest
+
+bulk_ingest = pytest.importorskip("glassbox_validator.bulk_ingest")
+from glassbox_validator.pre_execution import PreExecutionValidator  # noqa: E402
+from glassbox_validator.sequence_io import iter_records, shard_offsets  # noqa: E402
+
+def _fasta(count, seed=0):
+    rng = random.Random(seed)
+    lines = []
+    for i in range(count):
+        sequence = "".join(rng.choice("ACGT") for _ in range(rng.randint(20, 300)))
+        if i % 7 == 0:
+            sequence += "XZ"  # invalid characters
+        lines.append(f">seq_{i} record {i}\n" + "\n".join(sequence[j:j + 60] for j in range(0, len(sequence), 60)))
+    return ("\n".join(lines) + "\n").encode()
+
+def _genbank(count):
+    records = [f"LOCUS       part_{i}  24 bp  DNA\nORIGIN\n        1 acgtacgtac gtacgtacgt acgt\n//\n"
+               for i in range(count)]
+    return "".join(records).encode()
+
+@pytest.mark.parametrize("fmt, data", [("fasta", _fasta(200)), ("genbank", _genbank(50))])
+@pytest.mark.parametrize("shard_bytes", [1, 64, 1000, 10 ** 9])
+def test_shards_cover_the_file_with_whole_records(fmt, data, shard_bytes):
+    shards = list(shard_offsets(data, fmt, shard_bytes))
+    assert shards[0][0] == 0 and shards[-1][1] == len(data)
+    assert all(end == next_start for (_, end), (next_start, _) in zip(shards, shards[1:]))
+    marker = b">" if fmt == "fasta" else b"LOCUS"
+    assert all(data[start:].startswith(marker) for start, _ in shards)
+    sharded = [r.display_id for start, end in shards for r in iter_records(data[start:end], fmt)]
+    assert sharded == [r.display_id for r in iter_records(data, fmt)]
+
+def test_ingest_matches_sequential_validation(tmp_path):
+    data = _fasta(300, seed=3)
+    path = tmp_path / "library.fasta"
+    path.write_bytes(data)
+    output = tmp_path / "results.ndjson"
+    stats = bulk_ingest.ingest(str(path), str(output), max_workers=2, shard_bytes=2048)
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    validator = PreExecutionValidator()
+    expected = [bulk_ingest.result_row(r, validator.validate_sequence(r)) for r in iter_records(data, "fasta")]
+    assert rows == expected
+    assert stats.records == 300 and stats.invalid == sum(not row["is_valid"] for row in expected) > 0
+    assert stats.bases == sum(row["length"] for row in expected)
+
+def test_ingest_of_empty_file(tmp_path):
+    path = tmp_path / "empty.fasta"
+    path.write_bytes(b"")
+    assert bulk_ingest.ingest(str(path), str(tmp_path / "out.ndjson"), max_workers=1).records == 0
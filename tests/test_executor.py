@@ -0,0 +1,83 @@
+"""ValidationExecutor admission: saturation, queued waiters and slot accounting"""
+import asyncio
+import threading
+import pytest
+
+executor_module = pytest.importorskip("glassbox_validator.executor")  # needs pySBOL3
+ExecutorSaturated = executor_module.ExecutorSaturated
+
+def executor(timeout_s=5.0):
+    pool = executor_module.ValidationExecutor(mode="thread", max_workers=1, max_queue=0, timeout_s=timeout_s)
+    pool.start()
+    return pool
+
+def test_submit_fails_fast_when_full():
+    pool = executor()
+    gate = threading.Event()
+
+    async def scenario():
+        busy = asyncio.ensure_future(pool.submit(gate.wait))
+        await asyncio.sleep(0.05)
+        with pytest.raises(ExecutorSaturated):
+            await pool.submit(lambda: None)
+        gate.set()
+        await busy
+    asyncio.run(scenario())
+    pool.shutdown()
+
+def test_cancelled_waiters_do_not_leak_slots():
+    pool = executor()
+    gate = threading.Event()
+
+    async def scenario():
+        busy = asyncio.ensure_future(pool.submit(gate.wait))
+        await asyncio.sleep(0.05)
+        waiters = [asyncio.ensure_future(pool.submit_queued(lambda: "late")) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        for waiter in waiters:
+            waiter.cancel()
+        gate.set()
+        await busy
+        await asyncio.gather(*waiters, return_exceptions=True)
+        assert await pool.submit_queued(lambda: "ok") == "ok"
+        assert await pool.submit(lambda: "ok") == "ok"
+    asyncio.run(scenario())
+    assert pool.stats()["in_flight"] == 0
+    assert pool._slots.acquire(blocking=False)  # the only slot is free again
+    pool._slots.release()
+    pool.shutdown()
+
+def test_queued_waiters_run_in_order():
+    pool = executor()
+    gate = threading.Event()
+    order = []
+
+    async def scenario():
+        busy = asyncio.ensure_future(pool.submit(gate.wait))
+        await asyncio.sleep(0.05)
+        waiters = []
+        for i in range(4):
+            waiters.append(asyncio.ensure_future(pool.submit_queued(order.append, i)))
+            await asyncio.sleep(0.01)
+        gate.set()
+        await asyncio.gather(busy, *waiters)
+    asyncio.run(scenario())
+    assert order == [0, 1, 2, 3]
+    pool.shutdown()
+
+def test_queued_waiter_times_out_without_holding_a_slot():
+    pool = executor(timeout_s=0.2)
+    gate = threading.Event()
+
+    async def scenario():
+        busy = asyncio.ensure_future(pool.submit(gate.wait))
+        await asyncio.sleep(0.05)
+        with pytest.raises(ExecutorSaturated):
+            await pool.submit_queued(lambda: None)
+        gate.set()
+        with pytest.raises(asyncio.TimeoutError):  # the busy call outlived the timeout too
+            await busy
+        assert await pool.submit_queued(lambda: "ok") == "ok"
+    asyncio.run(scenario())
+    assert pool.stats()["in_flight"] == 0
+    pool.shutdown()
@@ -0,0 +1,34 @@
+import gzip
+
+import requests
+
+from glassbox_validator.http_client import AsyncGlassboxClient, GlassboxClient
+
+BODY = b"A" * (128 * 1024)
+
+def _prepared(client: GlassboxClient, body: bytes = BODY) -> requests.PreparedRequest:
+    prepared = client.session.prepare_request(requests.Request("POST", "https://lab.example/runs", data=body))
+    client._compress(prepared)
+    return prepared
+
+def test_plain_client_never_compresses():
+    prepared = _prepared(GlassboxClient("https://lab.example"))
+    assert prepared.body == BODY and "Content-Encoding" not in prepared.headers
+
+def test_from_env_client_compresses_large_bodies(monkeypatch):
+    monkeypatch.delenv("GLASSBOX_API_URL", raising=False)
+    client = GlassboxClient.from_env("https://glassbox.example")
+    prepared = _prepared(client)
+    assert prepared.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(prepared.body) == BODY
+    assert prepared.headers["Content-Length"] == str(len(prepared.body))
+    assert "Content-Encoding" not in _prepared(client, b"small").headers
+
+def test_async_from_env_client_compresses():
+    glassbox, lab = AsyncGlassboxClient.from_env("https://glassbox.example"), AsyncGlassboxClient("https://lab.example")
+    try:
+        assert glassbox.sync.gzip_min_bytes == 64 * 1024
+        assert lab.sync.gzip_min_bytes == 0
+    finally:
+        glassbox.close()
+        lab.close()
@@ -0,0 +1,100 @@
+import sqlite3
+import time
+
+import pytest
+
+from glassbox_validator.job_queue import JobQueue, lanes_for_runner
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "jobs.db")
+
+def test_claim_order_prefers_gating_then_oldest(db_path):
+    queue = JobQueue(db_path)
+    bulk = queue.enqueue("data", {}, lane="bulk")
+    first = queue.enqueue("design", {}, lane="gating")
+    second = queue.enqueue("design", {}, lane="gating")
+    assert [queue.claim()["job_id"] for _ in range(3)] == [first, second, bulk]
+    assert queue.claim() is None
+
+def test_claim_respects_lanes(db_path):
+    queue = JobQueue(db_path)
+    queue.enqueue("data", {}, lane="bulk")
+    assert queue.claim(["gating"]) is None
+    assert queue.claim(["bulk"])["lane"] == "bulk"
+
+def test_job_is_claimed_once_across_processes(db_path):
+    a, b = JobQueue(db_path), JobQueue(db_path)
+    a.enqueue("design", {"source": "x"})
+    job = a.claim()
+    assert job["owner"] == a.owner and job["attempts"] == 1
+    assert b.claim() is None
+
+def test_live_lease_is_not_requeued(db_path):
+    a, b = JobQueue(db_path, lease_s=60), JobQueue(db_path, lease_s=60)
+    job_id = a.enqueue("design", {})
+    a.claim()
+    assert b.requeue_expired() == 0
+    assert b.get(job_id)["status"] == "running"
+    assert a.complete(job_id, {"ok": True})
+    assert b.get(job_id)["status"] == "done"
+
+def test_expired_lease_is_requeued_and_old_owner_cannot_finish(db_path):
+    a, b = JobQueue(db_path, lease_s=0.01), JobQueue(db_path)
+    job_id = a.enqueue("design", {})
+    a.claim()
+    time.sleep(0.05)
+    assert b.requeue_expired() == 1
+    assert b.claim()["job_id"] == job_id
+    assert not a.heartbeat(job_id)
+    assert not a.complete(job_id, {"ok": True})
+    assert b.complete(job_id, {"ok": False})
+    job = b.get(job_id)
+    assert job["status"] == "done" and job["result"] == {"ok": False} and job["attempts"] == 2
+
+def test_heartbeat_extends_lease(db_path):
+    a, b = JobQueue(db_path, lease_s=0.2), JobQueue(db_path)
+    job_id = a.enqueue("design", {})
+    a.claim()
+    for _ in range(3):
+        time.sleep(0.1)
+        assert a.heartbeat(job_id)
+    assert b.requeue_expired() == 0
+
+def test_release_requeues_only_own_jobs(db_path):
+    a, b = JobQueue(db_path), JobQueue(db_path)
+    mine = a.enqueue("design", {})
+    theirs = a.enqueue("design", {})
+    assert a.claim()["job_id"] == mine
+    assert b.claim()["job_id"] == theirs
+    assert a.release() == 1
+    assert a.get(mine)["status"] == "queued" and a.get(theirs)["status"] == "running"
+
+def test_purge_deletes_only_old_finished_jobs(db_path):
+    queue = JobQueue(db_path)
+    done = queue.enqueue("design", {})
+    queued = queue.enqueue("design", {})
+    queue.claim()
+    queue.complete(done, {})
+    assert queue.purge(3600) == 0
+    assert queue.purge(0) == 1
+    assert queue.get(done) is None and queue.get(queued)["status"] == "queued"
+
+def test_queue_file_without_lease_columns_is_migrated(db_path):
+    db = sqlite3.connect(db_path)
+    db.execute("CREATE TABLE jobs (job_id TEXT PRIMARY KEY, kind TEXT NOT NULL, lane TEXT NOT NULL, "
+               "lane_rank INTEGER NOT NULL, status TEXT NOT NULL, payload TEXT NOT NULL, result TEXT, error TEXT, "
+               "webhook_url TEXT, webhook_status TEXT, attempts INTEGER NOT NULL DEFAULT 0, created_at REAL NOT NULL, "
+               "started_at REAL, finished_at REAL)")
+    db.execute("INSERT INTO jobs (job_id, kind, lane, lane_rank, status, payload, created_at) "
+               "VALUES ('old', 'design', 'gating', 0, 'running', '{}', 0)")
+    db.commit()
+    db.close()
+    queue = JobQueue(db_path)
+    assert queue.requeue_expired() == 1
+    assert queue.claim()["job_id"] == "old"
+
+def test_lanes_for_runner_reserves_gating():
+    assert lanes_for_runner(0, 3) == ["gating"]
+    assert lanes_for_runner(1, 3) == ["gating", "bulk"]
+    assert lanes_for_runner(0, 1) == ["gating", "bulk"]
@@ -0,0 +1,66 @@
+import sqlite3
+import time
+
+from glassbox_validator.lineage_store import LineageStore
+
+def _count(db_path, table):
+    with sqlite3.connect(db_path) as db:
+        return db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+def _record_dataset(store, metadata_hash, built, object_digests=None):
+    store.record_data(metadata_hash, True, 0.9, True, 0, 0, provenance_edges=[("urn:impl", "built", built)],
+                      object_digests=object_digests)
+
+def test_buffered_rows_are_flushed_by_the_timer(tmp_path):
+    db_path = str(tmp_path / "lineage.db")
+    store = LineageStore(db_path, batch_size=1000, flush_interval_s=0.05)
+    store.record_design("design", True, 0, 0, {"urn:c": "d1"})
+    assert _count(db_path, "validations") == 0
+    time.sleep(0.3)
+    assert _count(db_path, "validations") == 1 and _count(db_path, "design_components") == 1
+    store.close()
+
+def test_close_flushes_pending_rows(tmp_path):
+    db_path = str(tmp_path / "lineage.db")
+    store = LineageStore(db_path, batch_size=1000, flush_interval_s=60)
+    store.record_design("design", True, 0, 0)
+    store.close()
+    assert _count(db_path, "validations") == 1
+
+def test_batch_size_flushes_immediately(tmp_path):
+    db_path = str(tmp_path / "lineage.db")
+    store = LineageStore(db_path, batch_size=2, flush_interval_s=60)
+    store.record_design("design", True, 0, 0, {"urn:c": "d1"})
+    assert _count(db_path, "design_components") == 1
+    store.close()
+
+def test_datasets_link_only_to_revisions_with_the_built_component():
+    store = LineageStore()
+    store.record_design("rev1", True, 0, 0, {"urn:c": "d1"})
+    store.record_design("rev2", True, 0, 0, {"urn:c": "d2"})
+    _record_dataset(store, "data", "urn:c", {"urn:c": "d2", "urn:impl": "i"})
+    assert [d["metadata_hash"] for d in store.datasets_for_design("rev2")] == ["data"]
+    assert store.datasets_for_design("rev1") == []
+    assert [d["design_hash"] for d in store.designs_for_dataset("data")] == ["rev2"]
+
+def test_component_missing_from_provenance_matches_by_uri():
+    store = LineageStore()
+    store.record_design("rev1", True, 0, 0, {"urn:c": "d1"})
+    store.record_design("rev2", True, 0, 0, {"urn:c": "d2"})
+    _record_dataset(store, "data", "urn:c")
+    assert sorted(d["design_hash"] for d in store.designs_for_dataset("data")) == ["rev1", "rev2"]
+
+def test_lineage_file_without_target_digest_is_migrated(tmp_path):
+    db_path = str(tmp_path / "lineage.db")
+    with sqlite3.connect(db_path) as db:
+        db.execute("CREATE TABLE provenance_edges (target_uri TEXT NOT NULL, relation TEXT NOT NULL, "
+                   "source_uri TEXT NOT NULL, metadata_hash TEXT NOT NULL, "
+                   "PRIMARY KEY (target_uri, relation, source_uri, metadata_hash)) WITHOUT ROWID")
+        db.execute("INSERT INTO provenance_edges VALUES ('urn:c', 'built', 'urn:impl', 'old')")
+    store = LineageStore(db_path)
+    store.record_design("rev1", True, 0, 0, {"urn:c": "d1"})
+    _record_dataset(store, "data", "urn:c", {"urn:c": "d1"})
+    store.flush()
+    assert [d["metadata_hash"] for d in store.datasets_for_design("rev1")] == ["data"]
+    assert [d["design_hash"] for d in store.designs_for_dataset("old")] == ["rev1"]
+    store.close()
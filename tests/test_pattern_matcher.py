@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from glassbox_validator.pattern_matcher import PatternHit, PatternMatcher, reverse_complement
+
+def naive_hits(patterns, sequence):
+    """Every occurrence of each pattern and of its reverse complement, by str.find"""
+    text = sequence.upper()
+    hits = set()
+    for pid, pattern in patterns.items():
+        pattern = pattern.upper()
+        strands = [("+", pattern)]
+        if reverse_complement(pattern) != pattern:
+            strands.append(("-", reverse_complement(pattern)))
+        for strand, needle in strands:
+            start = text.find(needle)
+            while start != -1:
+                hits.add(PatternHit(pid, start, start + len(needle), strand))
+                start = text.find(needle, start + 1)
+    return hits
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_naive_reference(seed):
+    rng = random.Random(seed)
+    patterns = {f"p{i}": "".join(rng.choice("ACGT") for _ in range(rng.randint(1, 8))) for i in range(12)}
+    sequence = "".join(rng.choice("ACGTacgtN") for _ in range(2000))
+    hits = PatternMatcher(patterns).scan(sequence)
+    assert len(hits) == len(set(hits))
+    assert set(hits) == naive_hits(patterns, sequence)
+
+def test_overlapping_and_nested_patterns():
+    patterns = {"short": "AA", "long": "AAAA", "mixed": "GAAT"}
+    sequence = "GAATTCAAAAA"
+    assert set(PatternMatcher(patterns).scan(sequence)) == naive_hits(patterns, sequence)
+
+def test_palindrome_is_reported_once_on_the_forward_strand():
+    assert PatternMatcher({"ecori": "GAATTC"}).scan("ttGAATTCtt") == [PatternHit("ecori", 2, 8, "+")]
+
+def test_reverse_strand_hit_uses_forward_offsets():
+    assert PatternMatcher({"p": "AACG"}).scan("TTCGTT") == [PatternHit("p", 2, 6, "-")]
+
+def test_known_bad_inputs():
+    matcher = PatternMatcher({"p": "ACGT", "empty": ""})
+    assert "empty" not in matcher.patterns
+    assert matcher.scan("") == []
+    assert matcher.scan("NNNNéACGT") == [PatternHit("p", 5, 9, "+")]  # non-ASCII becomes one "?" byte
+    assert PatternMatcher({}).scan("ACGT") == []
+    assert matcher.scan(b"acgt") == matcher.scan("ACGT")
+
+def test_pickled_matcher_scans_identically():
+    rng = random.Random(7)
+    patterns = {f"p{i}": "".join(rng.choice("ACGT") for _ in range(6)) for i in range(50)}
+    sequence = "".join(rng.choice("ACGT") for _ in range(5000))
+    matcher = PatternMatcher(patterns)
+    assert PatternMatcher.from_bytes(matcher.to_bytes()).scan(sequence) == matcher.scan(sequence)
@@ -0,0 +1,29 @@
+import pytest
+
+pySBOL3 = pytest.importorskip("pySBOL3")
+from glassbox_validator.provenance_index import ProvenanceIndex  # noqa: E402
+
+def _chain(member_of_experiment=None):
+    """ExperimentalData -> Experiment -> Implementation -> Component, plus an extra Experiment member"""
+    pySBOL3.set_namespace("https://glassbox-bio.com/test")
+    component = pySBOL3.Component("design", pySBOL3.SBO_DNA)
+    implementation = pySBOL3.Implementation("build_1", built=component)
+    members = [implementation] + ([member_of_experiment] if member_of_experiment is not None else [])
+    experiment = pySBOL3.Experiment("experiment", members=members)
+    data = pySBOL3.ExperimentalData("data")
+    data.generated_by = [experiment]
+    return [component, implementation, experiment, data] + members[1:]
+
+def test_complete_chain_has_no_errors():
+    assert ProvenanceIndex(_chain()).validate_chains() == []
+
+def test_member_that_is_not_an_implementation_is_reported():
+    stray = pySBOL3.Component("stray_component", pySBOL3.SBO_DNA)
+    errors = ProvenanceIndex(_chain(stray)).validate_chains()
+    assert len(errors) == 1
+    assert "Component stray_component is an Experiment sbol:member but not an Implementation" in errors[0]
+
+def test_missing_built_target_is_reported():
+    objects = [o for o in _chain() if not isinstance(o, pySBOL3.Component)]
+    errors = ProvenanceIndex(objects).validate_chains()
+    assert errors == [f"Implementation build_1 sbol:built references missing object {objects[0].built}"]
@@ -0,0 +1,65 @@
+import pickle
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+from glassbox_validator.result_cache import ResultCache
+
+def _rows(db_path):
+    with sqlite3.connect(db_path) as db:
+        return db.execute("SELECT COUNT(*) FROM validation_cache").fetchone()[0]
+
+def test_put_many_fills_both_tiers(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    cache = ResultCache(db_path=db_path)
+    cache.put_many({"a": {"n": 1}, "b": {"n": 2}})
+    assert cache.get("a") == {"n": 1}
+    assert _rows(db_path) == 2
+    assert ResultCache(db_path=db_path).get("b") == {"n": 2}
+
+def test_put_many_without_entries_is_a_no_op(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    ResultCache(db_path=db_path).put_many({})
+    assert _rows(db_path) == 0
+
+def test_purge_expired_drops_only_expired_rows(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    cache = ResultCache(db_path=db_path)
+    ResultCache(db_path=db_path, ttl_s=-1).put("old", {})
+    cache.put("new", {})
+    assert cache.purge_expired() == 1
+    assert cache.get("new") == {} and cache.get("old") is None
+
+def test_opening_the_cache_purges_expired_rows(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    ResultCache(db_path=db_path, ttl_s=-1).put_many({"a": {}, "b": {}})
+    ResultCache(db_path=db_path, ttl_s=3600).put("c", {})
+    assert _rows(db_path) == 1
+
+@pytest.fixture
+def pre_execution():
+    return pytest.importorskip("glassbox_validator.pre_execution")
+
+def test_component_cache_opens_on_first_use(pre_execution, tmp_path, monkeypatch):
+    validator = pre_execution.PreExecutionValidator()
+    monkeypatch.setenv("GLASSBOX_CACHE_DB", str(tmp_path / "components.db"))
+    assert validator._component_cache is None
+    assert validator.component_cache.stats()["disk_tier"]
+    copy = pickle.loads(pickle.dumps(validator))
+    assert copy._component_cache is None
+
+def test_component_findings_are_written_once_per_validation(pre_execution, tmp_path):
+    db_path = str(tmp_path / "components.db")
+    cache = ResultCache(db_path=db_path)
+    components = [SimpleNamespace(identity=f"urn:c{i}", sequences=[]) for i in range(3)]
+    digest = SimpleNamespace(object_digests={f"urn:c{i}": f"d{i}" for i in range(3)})
+    reuse = pre_execution._ComponentReuse(cache, "fp", digest, None)
+    for component in components:
+        assert reuse.findings("biosafety", component, {}, lambda c, params: []) == []
+    assert _rows(db_path) == 0
+    reuse.flush()
+    assert _rows(db_path) == 3
+    again = pre_execution._ComponentReuse(ResultCache(db_path=db_path), "fp", digest, digest.object_digests)
+    assert again.findings("biosafety", components[0], {}, lambda c, params: pytest.fail("re-analysed")) == []
+    assert again.reevaluated == []
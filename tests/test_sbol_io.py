@@ -0,0 +1,96 @@
+"""SBOL input helpers: serialization sniffing, canonical digests and archive limits"""
+import io
+import tarfile
+import time
+import zipfile
+import pytest
+
+pySBOL3 = pytest.importorskip("pySBOL3")
+from glassbox_validator import sbol_io  # noqa: E402
+from glassbox_validator.metrics import StageTimings  # noqa: E402
+from glassbox_validator.sbol_io import iter_archive, load_document_with_digest, sniff_rdf_format  # noqa: E402
+
+FORMATS = [pySBOL3.RDF_XML, pySBOL3.NTRIPLES, pySBOL3.SORTED_NTRIPLES, pySBOL3.TURTLE, pySBOL3.JSONLD]
+
+@pytest.fixture(scope="module")
+def document():
+    pySBOL3.set_namespace("https://glassbox-bio.com/test")
+    doc = pySBOL3.Document()
+    sequence = pySBOL3.Sequence("seq_1", elements="ATGCCGTAGGCTTACGATCG", encoding=pySBOL3.IUPAC_DNA_ENCODING)
+    component = pySBOL3.Component("part_1", pySBOL3.SBO_DNA, sequences=[sequence])
+    doc.add(sequence)
+    doc.add(component)
+    return doc
+
+@pytest.mark.parametrize("rdf_format", FORMATS)
+def test_sniffs_every_serialization(document, rdf_format):
+    expected = pySBOL3.NTRIPLES if rdf_format == pySBOL3.SORTED_NTRIPLES else rdf_format
+    assert sniff_rdf_format(document.write_string(rdf_format)) == expected
+
+@pytest.mark.parametrize("rdf_format", FORMATS)
+def test_design_hash_is_serialization_independent(document, rdf_format):
+    reference = load_document_with_digest(document.write_string(pySBOL3.RDF_XML).encode())[1]
+    doc, digest = load_document_with_digest(document.write_string(rdf_format).encode())
+    assert digest.design_hash == reference.design_hash
+    assert digest.object_digests == reference.object_digests
+    assert {str(o.identity) for o in doc.objects} == {str(o.identity) for o in document.objects}
+
+def test_public_read_fallback_without_parse_graph(document, monkeypatch):
+    data = document.write_string(pySBOL3.TURTLE).encode()
+    reference = load_document_with_digest(data)[1]
+    monkeypatch.setattr(sbol_io, "_PARSE_GRAPH", None)
+    doc, digest = load_document_with_digest(data)
+    assert digest.design_hash == reference.design_hash
+    assert {str(o.identity) for o in doc.objects} == {str(o.identity) for o in document.objects}
+
+def test_parse_and_hash_are_timed_separately(document, monkeypatch):
+    monkeypatch.setattr(sbol_io, "digest_graph", lambda graph: time.sleep(0.05) or sbol_io.DesignDigest(""))
+    timings = StageTimings()
+    load_document_with_digest(document.write_string(pySBOL3.NTRIPLES).encode(), timings)
+    assert timings["hash"] >= 0.05
+    assert timings["parse"] < 0.05
+
+@pytest.mark.parametrize("head, expected", [
+    ('<?xml version="1.0"?>\n<rdf:RDF/>', pySBOL3.RDF_XML),
+    ("<rdf:RDF xmlns:rdf='http://www.w3.org/1999/02/22-rdf-syntax-ns#'/>", pySBOL3.RDF_XML),
+    ("<http://a/s> <http://a/p> <http://a/o> .\n", pySBOL3.NTRIPLES),
+    ('_:b0 <http://a/p> "x" .\n', pySBOL3.NTRIPLES),
+    ("@prefix sbol: <http://sbols.org/v3#> .\n", pySBOL3.TURTLE),
+    ('{"@context": {}}', pySBOL3.JSONLD),
+])
+def test_sniff_heads(head, expected):
+    assert sniff_rdf_format(head) == expected
+
+def _zip(files):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in files:
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+def _tar(files):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for name, data in files:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+@pytest.mark.parametrize("pack", [_zip, _tar])
+def test_archive_members_and_limits(pack):
+    data = pack([("a.xml", b"a" * 100), ("__MACOSX/._a.xml", b"junk"), ("dir/b.xml", b"b" * 50)])
+    assert list(iter_archive(data, max_member_bytes=100, max_total_bytes=150)) == [
+        ("a.xml", b"a" * 100), ("dir/b.xml", b"b" * 50)]
+    with pytest.raises(ValueError):
+        list(iter_archive(data, max_member_bytes=99))
+    with pytest.raises(ValueError):
+        list(iter_archive(data, max_total_bytes=149))
+    with pytest.raises(ValueError):
+        list(iter_archive(data, max_members=1))
+
+@pytest.mark.parametrize("pack", [_zip, _tar])
+def test_archive_bomb_is_rejected_before_inflating(pack):
+    bomb = pack([("bomb.xml", b"\0" * (32 * 1024 ** 2))])
+    with pytest.raises(ValueError):
+        next(iter_archive(bomb, max_member_bytes=1024 ** 2))
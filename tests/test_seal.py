@@ -0,0 +1,81 @@
+"""Seal issue, verify and revoke round trips"""
+import json
+import os
+from datetime import datetime, timedelta, timezone
+import pytest
+from glassbox_validator.seal import HMAC_SHA256, RevocationList, SealError, SealIssuer, SealVerifier, sha256_hex
+
+POLICY_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           "examples", "policies", "design_gate_v1.json")
+PAYLOAD = sha256_hex(b"<rdf:RDF/>")
+DESIGN_HASH = "d" * 64
+
+def admissibility(decision="pass", index=92.5, blocking=()):
+    return {"policy": {"policy_id": "design_gate", "policy_version": "1.0.0", "score_model_version": "adm_v1"},
+            "decision": decision, "admissibility_index": index, "score_breakdown": {},
+            "blocking_findings": list(blocking), "findings": list(blocking)}
+
+@pytest.fixture
+def issuer():
+    return SealIssuer(hmac_secret=b"shared-secret")
+
+def test_ed25519_round_trip(issuer):
+    report = admissibility()
+    seal = issuer.issue(PAYLOAD, DESIGN_HASH, report)
+    verifier = issuer.verifier()
+    assert verifier.verify(seal, PAYLOAD, design_hash=DESIGN_HASH).valid
+    assert seal["design_hash"] == DESIGN_HASH
+    assert verifier.manifest_matches(seal, report)
+    assert not verifier.manifest_matches(seal, admissibility(index=91.0))
+
+def test_hmac_round_trip(issuer):
+    seal = issuer.issue(PAYLOAD, DESIGN_HASH, admissibility(), algorithm=HMAC_SHA256)
+    assert issuer.verifier().verify(seal, PAYLOAD).valid
+    assert not SealVerifier(hmac_keys={seal["signing_key_id"]: b"other"}).verify(seal).valid
+
+@pytest.mark.parametrize("field, value", [("decision", "fail"), ("admissibility_index", 100.0),
+                                          ("design_hash", "e" * 64), ("expires_at_utc", "2099-01-01T00:00:00Z")])
+def test_tampered_seal_is_rejected(issuer, field, value):
+    seal = issuer.issue(PAYLOAD, DESIGN_HASH, admissibility())
+    seal[field] = value
+    assert issuer.verifier().verify(seal).reason == "invalid signature"
+
+def test_other_design_is_rejected(issuer):
+    seal = issuer.issue(PAYLOAD, DESIGN_HASH, admissibility())
+    verifier = issuer.verifier()
+    assert verifier.verify(seal, sha256_hex(b"other")).reason == "design payload does not match seal"
+    assert verifier.verify(seal, design_hash="e" * 64).reason == "design hash does not match seal"
+
+def test_expired_and_revoked(issuer, tmp_path):
+    seal = issuer.issue(PAYLOAD, DESIGN_HASH, admissibility(), ttl_days=1)
+    path = tmp_path / "revoked.txt"
+    verifier = issuer.verifier(revocations=RevocationList(str(path)))
+    later = datetime.now(timezone.utc) + timedelta(days=2)
+    assert verifier.verify(seal, now=later).reason == "seal expired"
+    verifier.revocations.revoke(seal["seal_id"])
+    assert verifier.verify(seal).reason == "seal revoked"
+    assert seal["seal_id"] in RevocationList(str(path))
+
+@pytest.mark.parametrize("report", [admissibility("fail", 0.0), admissibility("warn", 70.0),
+                                    admissibility(blocking=[{"code": "SEQ_INVALID_CHARS"}])])
+def test_inadmissible_reports_are_not_sealed(issuer, report):
+    with pytest.raises(SealError):
+        issuer.issue(PAYLOAD, DESIGN_HASH, report)
+
+def test_failing_design_gets_no_seal_and_fails_verification(issuer):
+    pre_execution = pytest.importorskip("glassbox_validator.pre_execution")  # needs pySBOL3
+    with open(POLICY_PATH) as f:
+        policy = json.load(f)
+    validator = pre_execution.PreExecutionValidator()
+    good = "ATGCCGTAGGCTTACGATCGGATCCTAGCTAGGCTTAACGGATCGATTGCAAGTCCGATAGCTTGACCTAGG"
+    passing = validator.validate_sequence(pre_execution.SequenceRecord("ok", good, was_generated_by="urn:m"), policy)
+    failing = validator.validate_sequence(
+        pre_execution.SequenceRecord("bad", good[:10] + "XX" + good[10:], was_generated_by="urn:m"), policy)
+    assert failing.admissibility["decision"] == "fail"
+    with pytest.raises(SealError):
+        issuer.issue(failing.design_hash, failing.design_hash, failing.admissibility)
+    seal = issuer.issue(passing.design_hash, passing.design_hash, passing.admissibility)
+    verifier = issuer.verifier()
+    assert verifier.verify(seal, design_hash=passing.design_hash).valid
+    assert not verifier.verify(seal, design_hash=failing.design_hash).valid
+    assert not verifier.manifest_matches(seal, failing.admissibility)
@@ -0,0 +1,64 @@
+import random
+from collections import Counter
+
+import pytest
+
+from glassbox_validator.sequence_analysis import find_repeats
+
+def naive_repeats(sequence, window, min_count):
+    """(start, length, copies) per run of windows whose ACGT-only k-mer occurs min_count+ times"""
+    windows = [sequence[i:i + window] for i in range(len(sequence) - window + 1)]
+    counts = Counter(w for w in windows if set(w) <= set("ACGT"))
+    copies = [counts[w] if set(w) <= set("ACGT") else 0 for w in windows]
+    regions, start = [], None
+    for pos, count in enumerate(copies + [0]):
+        if count >= min_count and start is None:
+            start = pos
+        elif count < min_count and start is not None:
+            regions.append((start, pos - 1 - start + window, max(copies[start:pos])))
+            start = None
+    return regions
+
+def random_sequence(rng, length, motif_length=0, motifs=0, gaps=0):
+    bases = [rng.choice("ACGT") for _ in range(length)]
+    motif = [rng.choice("ACGT") for _ in range(motif_length)]
+    for _ in range(motifs):
+        at = rng.randrange(length - motif_length)
+        bases[at:at + motif_length] = motif
+    for _ in range(gaps):
+        at = rng.randrange(length)
+        bases[at] = rng.choice("NRY-")
+    return "".join(bases)
+
+@pytest.mark.parametrize("window", [4, 12, 20, 32, 33, 40])
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_naive_reference(window, seed):
+    rng = random.Random(seed * 100 + window)
+    sequence = random_sequence(rng, 1500, motif_length=window + 10, motifs=3, gaps=15)
+    for min_count in (2, 3):
+        found = [(r.start, r.length, r.copies) for r in find_repeats(sequence.encode(), window, min_count)]
+        assert found == naive_repeats(sequence, window, min_count)
+
+def test_windows_with_non_acgt_bases_are_skipped():
+    # The baseline detector compared every window, so a 50 bp N gap counted as a repeat
+    assert find_repeats(b"N" * 50, 20) == []
+    assert find_repeats(b"ACGTACGTAC" + b"N" * 40 + b"TTGCATGCAA", 20) == []
+    motif = b"GATTACAGATTACACCGGTA"
+    assert [(r.start, r.copies) for r in find_repeats(motif + b"NN" + motif, 20)] == [(0, 2), (22, 2)]
+
+def test_known_bad_inputs():
+    assert find_repeats(b"", 20) == []
+    assert find_repeats(b"ACGT", 20) == []
+    assert find_repeats(b"A" * 30, 0) == []
+    assert find_repeats(b"ACGTACGT", 4, min_count=10) == []
+
+def test_min_count_one_flags_every_clean_window():
+    regions = find_repeats(b"ACGTTGCA", 4, min_count=1)
+    assert [(r.start, r.length, r.copies) for r in regions] == [(0, 8, 1)]
+
+def test_analyze_sequence_ignores_case():
+    pre_execution = pytest.importorskip("glassbox_validator.pre_execution")
+    validator = pre_execution.PreExecutionValidator()
+    motif = "GATTACAGATTACACCGGTA"
+    assert validator._has_high_repetition(motif.lower() + "TT" + motif)
+    assert not validator._has_high_repetition("N" * 100)
@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+
+import pytest
+
+from integrations.strateos_gateway import GlassboxStrateosGateway
+
+class _Designs:
+    """Stands in for the gateway's design client: replays responses and records request headers"""
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent = []
+
+    def get(self, url, endpoint=None, headers=None):
+        self.sent.append(headers)
+        return self.responses.pop(0)
+
+def _response(status, content=b"", etag=None):
+    def raise_for_status():
+        if status >= 400:
+            raise RuntimeError(status)
+    return SimpleNamespace(status_code=status, content=content, headers={"ETag": etag} if etag else {},
+                           raise_for_status=raise_for_status)
+
+@pytest.fixture
+def gateway():
+    return GlassboxStrateosGateway("https://glassbox.example", "key")
+
+def test_etag_revalidation_reuses_cached_copy(gateway):
+    gateway.designs = _Designs(_response(200, b"<sbol/>", etag='"v1"'), _response(304))
+    assert gateway._fetch_sbol("https://designs.example/a") == b"<sbol/>"
+    assert gateway._fetch_sbol("https://designs.example/a") == b"<sbol/>"
+    assert gateway.designs.sent == [{}, {"If-None-Match": '"v1"'}]
+
+def test_unexpected_not_modified_is_an_error(gateway):
+    gateway.designs = _Designs(_response(304))
+    with pytest.raises(ValueError, match="304"):
+        gateway._fetch_sbol("https://designs.example/a")
+    assert gateway.designs.sent == [{}]
+
+def test_etag_cache_evicts_least_recently_used(gateway):
+    gateway._sbol_by_uri.max_entries = 2
+    gateway.designs = _Designs(*(_response(200, uri.encode(), etag=uri) for uri in ("a", "b", "c")))
+    gateway._fetch_sbol("a")
+    gateway._fetch_sbol("b")
+    assert gateway._sbol_by_uri.get("a") is not None  # a is now the most recently used
+    gateway._fetch_sbol("c")
+    assert gateway._sbol_by_uri.get("b") is None
+    assert gateway._sbol_by_uri.get("a") == ("a", b"a") and gateway._sbol_by_uri.get("c") == ("c", b"c")